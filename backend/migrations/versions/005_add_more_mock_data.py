@@ -18,6 +18,26 @@ down_revision: Union[str, None] = "004"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# 삽입한 mock 행 ID를 기록하는 스키마 (downgrade 전용)
+MOCK_SCHEMA = "mock_005"
+
+# downgrade 삭제 순서 (FK 역순)
+DOWNGRADE_ORDER = (
+    "delivery_routes",
+    "shipments",
+    "order_items",
+    "orders",
+    "inventory",
+    "drivers",
+    "vehicles",
+    "carriers",
+    "customers",
+    "products",
+    "product_categories",
+    "warehouse_zones",
+    "warehouses",
+)
+
 def get_random_date(days_back=30):
     """최근 N일 이내의 랜덤 날짜 반환 (음수면 미래 날짜)"""
     end = datetime.now()
@@ -331,7 +351,83 @@ def upgrade() -> None:
                 )
             """)
 
+    # 11. 삽입한 mock 행 ID 기록 (downgrade에서 PK 동등 조건으로 삭제)
+    # public 스키마 밖에 두어 스키마 조회/LLM 프롬프트에 노출되지 않도록 함
+    op.execute(f"CREATE SCHEMA IF NOT EXISTS {MOCK_SCHEMA}")
+    op.execute(f"""
+        CREATE TABLE IF NOT EXISTS {MOCK_SCHEMA}.inserted_ids (
+            table_name TEXT NOT NULL,
+            id INTEGER NOT NULL,
+            PRIMARY KEY (table_name, id)
+        )
+    """)
+
+    tracked_ids = {
+        "warehouses": warehouse_ids,
+        "product_categories": category_ids,
+        "products": product_ids,
+        "customers": customer_ids,
+        "carriers": carrier_ids,
+        "vehicles": vehicle_ids,
+        "drivers": driver_ids,
+        "orders": order_ids,
+    }
+    for table_name, ids in tracked_ids.items():
+        if ids:
+            conn.execute(
+                sa.text(
+                    f"INSERT INTO {MOCK_SCHEMA}.inserted_ids (table_name, id) "
+                    "SELECT :table_name, unnest(CAST(:ids AS INTEGER[])) ON CONFLICT DO NOTHING"
+                ),
+                {"table_name": table_name, "ids": ids},
+            )
+
+    # 하위 테이블은 신규 부모 행을 참조하는 행만 기록
+    child_sources = {
+        "warehouse_zones": ("warehouse_id", warehouse_ids),
+        "inventory": ("product_id", product_ids),
+        "order_items": ("order_id", order_ids),
+        "shipments": ("order_id", order_ids),
+        "delivery_routes": ("vehicle_id", vehicle_ids),
+    }
+    for table_name, (fk_column, parent_ids) in child_sources.items():
+        if parent_ids:
+            conn.execute(
+                sa.text(
+                    f"INSERT INTO {MOCK_SCHEMA}.inserted_ids (table_name, id) "
+                    f"SELECT :table_name, id FROM {table_name} "
+                    f"WHERE {fk_column} = ANY(CAST(:ids AS INTEGER[])) ON CONFLICT DO NOTHING"
+                ),
+                {"table_name": table_name, "ids": parent_ids},
+            )
+
+
 def downgrade() -> None:
+    conn = op.get_bind()
+    has_tracking = conn.execute(
+        sa.text(f"SELECT to_regclass('{MOCK_SCHEMA}.inserted_ids') IS NOT NULL")
+    ).scalar()
+
+    if not has_tracking:
+        # ID 기록 이전 버전으로 upgrade된 DB: 기존 패턴 기반 삭제
+        _downgrade_by_pattern()
+        return
+
+    # 역순 삭제 (기록된 PK로 인덱스 조회)
+    op.execute(f"""
+        DELETE FROM route_stops
+        WHERE route_id IN (SELECT id FROM {MOCK_SCHEMA}.inserted_ids WHERE table_name = 'delivery_routes')
+           OR shipment_id IN (SELECT id FROM {MOCK_SCHEMA}.inserted_ids WHERE table_name = 'shipments')
+    """)
+    for table_name in DOWNGRADE_ORDER:
+        op.execute(f"""
+            DELETE FROM {table_name}
+            WHERE id IN (SELECT id FROM {MOCK_SCHEMA}.inserted_ids WHERE table_name = '{table_name}')
+        """)
+    op.execute(f"DROP SCHEMA {MOCK_SCHEMA} CASCADE")
+
+
+def _downgrade_by_pattern() -> None:
     # 역순 삭제
     op.execute("DELETE FROM route_stops WHERE id IN (SELECT id FROM route_stops ORDER BY id DESC LIMIT 100)") # Approximation
     op.execute("DELETE FROM delivery_routes WHERE route_code LIKE 'RT-EXT-%'")
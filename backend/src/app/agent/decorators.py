@@ -13,6 +13,7 @@ from typing import Any, Callable
 from app.agent.state import (
     DebugContext,
     NodeTiming,
+    RetryRecord,
     Text2SQLAgentState,
 )
 
@@ -23,7 +24,7 @@ def with_debug_timing(node_name: str) -> Callable:
     """
     노드 함수에 자동 타이밍 및 에러 추적을 추가하는 데코레이터
 
-    - 노드 시작/종료 시간 자동 기록
+    - 노드 시작/종료 시간 자동 기록 (DEBUG 로그 레벨에서만)
     - 예외 발생 시 에러 체인에 자동 추가
     - debug 컨텍스트가 없어도 안전하게 동작
 
@@ -42,34 +43,40 @@ def with_debug_timing(node_name: str) -> Callable:
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(state: Text2SQLAgentState) -> dict[str, Any]:
-            start_time = time.time()
-            trace_id = ""
+            # 소요 시간은 단조 시계로 측정 (epoch 시각은 기록이 필요할 때만 계산)
+            start_ns = time.perf_counter_ns()
 
-            # debug 컨텍스트 안전하게 추출
-            try:
-                debug = state.get("debug", {})
-                trace_id = debug.get("trace_id", "")[:8] if debug else ""
-            except (KeyError, TypeError, AttributeError):
-                pass
+            # debug 컨텍스트는 호출당 한 번만 조회하여 헬퍼에 전달
+            debug = _get_debug_context(state)
+            trace_id = (debug.get("trace_id") or "")[:8]
+
+            # DEBUG 로그가 꺼져 있으면 타이밍 기록을 생략 (운영 환경 fast-path)
+            debug_enabled = bool(debug) and logger.isEnabledFor(logging.DEBUG)
 
-            logger.debug(f"[{trace_id}] Node '{node_name}' started")
+            if debug_enabled:
+                logger.debug("[%s] Node '%s' started", trace_id, node_name)
 
             try:
                 # 실제 노드 함수 실행
                 result = await func(state)
 
+                if not debug_enabled:
+                    return result
+
                 # 타이밍 정보 추가
+                duration_ns = time.perf_counter_ns() - start_ns
+                duration_ms = duration_ns / 1_000_000
                 end_time = time.time()
-                duration_ms = (end_time - start_time) * 1000
+                start_time = end_time - duration_ns / 1_000_000_000
 
                 logger.debug(
-                    f"[{trace_id}] Node '{node_name}' completed in {duration_ms:.2f}ms"
+                    "[%s] Node '%s' completed in %.2fms", trace_id, node_name, duration_ms
                 )
 
                 # 결과에 debug 업데이트 추가
                 result = _add_timing_to_result(
                     result=result,
-                    state=state,
+                    debug=debug,
                     node_name=node_name,
                     start_time=start_time,
                     end_time=end_time,
@@ -79,9 +86,8 @@ def with_debug_timing(node_name: str) -> Callable:
                 return result
 
             except Exception as e:
-                # 에러 발생 시 타이밍 정보 기록
-                end_time = time.time()
-                duration_ms = (end_time - start_time) * 1000
+                # 에러 발생 시 소요 시간만 로그로 남김 (결과는 반환되지 않으므로 타이밍 기록 생략)
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
                 logger.error(
                     f"[{trace_id}] Node '{node_name}' failed after {duration_ms:.2f}ms: {e}"
@@ -95,9 +101,17 @@ def with_debug_timing(node_name: str) -> Callable:
     return decorator
 
 
+def _get_debug_context(state: Text2SQLAgentState) -> DebugContext:
+    """state에서 debug 컨텍스트 추출 (없거나 dict가 아니면 빈 dict)"""
+    debug = state.get("debug")
+    if not isinstance(debug, dict):
+        return {}  # type: ignore[typeddict-item]
+    return debug
+
+
 def _add_timing_to_result(
     result: dict[str, Any],
-    state: Text2SQLAgentState,
+    debug: DebugContext,
     node_name: str,
     start_time: float,
     end_time: float,
@@ -107,36 +121,19 @@ def _add_timing_to_result(
     if result is None:
         result = {}
 
-    # 현재 debug 컨텍스트 가져오기
-    try:
-        current_debug = state.get("debug", {})
-        if not current_debug:
-            return result
+    if not debug:
+        return result
+
+    # 새 타이밍 항목 생성
+    new_timing = NodeTiming(
+        node_name=node_name,
+        start_time=start_time,
+        end_time=end_time,
+        duration_ms=duration_ms,
+    )
 
-        # 새 타이밍 항목 생성
-        new_timing = NodeTiming(
-            node_name=node_name,
-            start_time=start_time,
-            end_time=end_time,
-            duration_ms=duration_ms,
-        )
-
-        # 기존 타이밍 목록에 추가
-        existing_timings = list(current_debug.get("node_timings", []))
-        existing_timings.append(new_timing)
-
-        # debug 업데이트 생성
-        debug_update = DebugContext(
-            trace_id=current_debug.get("trace_id", ""),
-            node_timings=existing_timings,
-            error_chain=current_debug.get("error_chain", []),
-            current_node=current_debug.get("current_node", ""),
-            retry_history=current_debug.get("retry_history", []),
-        )  # 결과에 debug 업데이트 추가
-        result["debug"] = debug_update
-
-    except (KeyError, TypeError, AttributeError) as e:
-        logger.warning(f"Failed to add timing info: {e}")
+    # 새 항목만 반환 (debug 채널 리듀서가 기존 목록에 추가)
+    result["debug"] = {"node_timings": [new_timing]}
 
     return result
 
@@ -158,32 +155,38 @@ def with_retry_tracking(node_name: str) -> Callable:
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(state: Text2SQLAgentState) -> dict[str, Any]:
-            # 현재 시도 횟수 추출
-            try:
-                current_attempt = state.get("generation", {}).get(
-                    "generation_attempt", 0
-                )
-            except (KeyError, TypeError, AttributeError):
-                current_attempt = 0
-
             # 실제 함수 실행
             result = await func(state)
 
-            # 결과에서 새 시도 횟수 확인
+            # 결과에 시도 횟수가 없으면 재시도 추적 생략 (일반적인 경우)
+            if not isinstance(result, dict):
+                return result
+
             new_attempt = None
-            if isinstance(result, dict):
-                # nested 구조에서 확인
-                if "generation" in result and isinstance(result["generation"], dict):
-                    new_attempt = result["generation"].get("generation_attempt")
-                # flat 구조에서 확인 (하위 호환성)
-                elif "generation_attempt" in result:
-                    new_attempt = result["generation_attempt"]
+            # nested 구조에서 확인
+            generation = result.get("generation")
+            if isinstance(generation, dict):
+                new_attempt = generation.get("generation_attempt")
+            # flat 구조에서 확인 (하위 호환성)
+            elif "generation_attempt" in result:
+                new_attempt = result["generation_attempt"]
+
+            if new_attempt is None:
+                return result
+
+            # 이전 시도 횟수는 결과에 시도 횟수가 있을 때만 조회
+            generation_state = state.get("generation")
+            current_attempt = (
+                generation_state.get("generation_attempt", 0)
+                if isinstance(generation_state, dict)
+                else 0
+            )
 
             # 재시도 발생 시 기록
-            if new_attempt is not None and new_attempt > current_attempt:
+            if new_attempt > current_attempt:
                 result = _add_retry_to_result(
                     result=result,
-                    state=state,
+                    debug=_get_debug_context(state),
                     node_name=node_name,
                     attempt=new_attempt,
                     reason="Validation failed, regenerating",
@@ -198,46 +201,29 @@ def with_retry_tracking(node_name: str) -> Callable:
 
 def _add_retry_to_result(
     result: dict[str, Any],
-    state: Text2SQLAgentState,
+    debug: DebugContext,
     node_name: str,
     attempt: int,
     reason: str,
 ) -> dict[str, Any]:
     """결과에 재시도 기록 추가"""
-    from app.agent.state import RetryRecord
-
-    try:
-        current_debug = state.get("debug", {})
-        if not current_debug:
-            return result
-
-        # 새 재시도 기록
-        retry_record = RetryRecord(
-            node_name=node_name,
-            attempt=attempt,
-            reason=reason,
-            timestamp=time.time(),
-        )
-
-        # 기존 재시도 목록에 추가
-        existing_retries = list(current_debug.get("retry_history", []))
-        existing_retries.append(retry_record)
-
-        # debug 업데이트가 이미 있으면 병합
-        if "debug" in result:
-            result["debug"]["retry_history"] = existing_retries
-        else:
-            result["debug"] = DebugContext(
-                trace_id=current_debug.get("trace_id", ""),
-                node_timings=current_debug.get("node_timings", []),
-                error_chain=current_debug.get("error_chain", []),
-                current_node=current_debug.get("current_node", ""),
-                retry_history=existing_retries,
-            )
-
-        logger.info(f"Retry recorded: {node_name} attempt {attempt}")
-
-    except (KeyError, TypeError, AttributeError) as e:
-        logger.warning(f"Failed to add retry record: {e}")
+    if not debug:
+        return result
+
+    # 새 재시도 기록
+    retry_record = RetryRecord(
+        node_name=node_name,
+        attempt=attempt,
+        reason=reason,
+        timestamp=time.time(),
+    )
+
+    # 새 항목만 반환 (debug 채널 리듀서가 기존 목록에 추가)
+    if "debug" in result:
+        result["debug"]["retry_history"] = [retry_record]
+    else:
+        result["debug"] = {"retry_history": [retry_record]}
+
+    logger.info("Retry recorded: %s attempt %d", node_name, attempt)
 
     return result
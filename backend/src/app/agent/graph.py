@@ -5,6 +5,8 @@ Text2SQL 에이전트의 전체 워크플로우를 구성합니다.
 """
 
 import logging
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Literal
 
 from langgraph.checkpoint.memory import InMemorySaver
@@ -35,38 +37,18 @@ def should_continue_after_classification(
 
     Text2SQL 쿼리는 권한 검사로, 일반 대화는 일반 응답 생성으로 이동
     """
-    intent = state["input"].get("intent", "text2sql")
-    if intent == "general":
-        return "general"
-    return "text2sql"
+    return "general" if state["input"].get("intent") == "general" else "text2sql"
 
 
-def should_continue_after_schema(
+def should_continue_unless_execution_error(
     state: Text2SQLAgentState,
 ) -> Literal["generate", "format_error"]:
     """
-    스키마 조회 후 다음 단계 결정
+    권한 사전 검사 / 스키마 조회 후 다음 단계 결정
 
-    스키마 조회 중 에러(권한 부족 등)가 발생하면 즉시 응답 포맷팅으로 이동
+    권한 위반이나 스키마 조회 에러(권한 부족 등)가 기록되었으면 즉시 응답 포맷팅으로 이동
     """
-    # Nested 구조에서 execution_error 접근
-    if state["execution"]["execution_error"]:
-        return "format_error"
-    return "generate"
-
-
-def should_continue_after_permission_check(
-    state: Text2SQLAgentState,
-) -> Literal["generate", "format_error"]:
-    """
-    권한 사전 검사 후 다음 단계 결정
-
-    권한 위반이 감지되면 즉시 응답 포맷팅으로 이동
-    """
-    # Nested 구조에서 execution_error 접근
-    if state["execution"]["execution_error"]:
-        return "format_error"
-    return "generate"
+    return "format_error" if state["execution"]["execution_error"] else "generate"
 
 
 def should_continue_after_generation(
@@ -77,11 +59,7 @@ def should_continue_after_generation(
 
     쿼리가 성공적으로 생성되었으면 검증, 아니면 에러 포맷팅으로 이동
     """
-    # Nested 구조에서 값 접근
-    execution_error = state["execution"]["execution_error"]
-    generated_query = state["generation"]["generated_query"]
-
-    if execution_error or not generated_query:
+    if state["execution"]["execution_error"] or not state["generation"]["generated_query"]:
         return "format_error"
     return "validate"
 
@@ -96,20 +74,17 @@ def should_continue_after_validation(
     - 재시도 가능하면 재생성
     - 최대 재시도 초과 시 에러 포맷팅
     """
-    # Nested 구조에서 값 접근
-    is_valid = state["validation"]["is_query_valid"]
-    attempt = state["generation"]["generation_attempt"]
-
-    if is_valid:
+    if state["validation"]["is_query_valid"]:
         return "confirm"
 
     # 재시도 가능 여부 확인
+    attempt = state["generation"]["generation_attempt"]
     if attempt < MAX_VALIDATION_RETRIES:
-        logger.info(f"쿼리 재생성 시도 ({attempt}/{MAX_VALIDATION_RETRIES})")
+        logger.info("쿼리 재생성 시도 (%d/%d)", attempt, MAX_VALIDATION_RETRIES)
         return "regenerate"
 
     # 최대 재시도 초과
-    logger.warning(f"최대 재시도 횟수({MAX_VALIDATION_RETRIES}) 도달, 실패 처리")
+    logger.warning("최대 재시도 횟수(%d) 도달, 실패 처리", MAX_VALIDATION_RETRIES)
     return "format_error"
 
 
@@ -120,21 +95,12 @@ def should_continue_after_confirmation(
     사용자 확인 후 다음 단계 결정
 
     - 승인되면 실행
-    - 수정된 쿼리가 있으면 재검증
-    - 거부되면 취소 포맷팅
+    - 수정된 쿼리가 있으면 재검증 (is_query_valid가 False)
+    - 거부되거나 아직 응답이 없으면 취소 포맷팅
     """
-    # Nested 구조에서 값 접근
-    user_approved = state["response"]["user_approved"]
-    is_query_valid = state["validation"]["is_query_valid"]
-
-    if user_approved is True:
-        # 수정된 쿼리가 있고 재검증이 필요한 경우
-        if is_query_valid is False:
-            return "revalidate"
-        return "execute"
-
-    # 거부되거나 아직 응답이 없는 경우
-    return "format_cancelled"
+    if state["response"]["user_approved"] is not True:
+        return "format_cancelled"
+    return "revalidate" if state["validation"]["is_query_valid"] is False else "execute"
 
 
 def should_continue_after_execution(
@@ -148,6 +114,54 @@ def should_continue_after_execution(
     return "format_result"
 
 
+# 조건부 엣지 디스패치 테이블: 출발 노드 → (라우터, 라우터 반환값 → 도착 노드)
+CONDITIONAL_EDGES: dict[str, tuple[Callable[[Text2SQLAgentState], str], dict[str, str]]] = {
+    # 분류 노드 → 권한 검사 또는 일반 답변
+    "classification": (
+        should_continue_after_classification,
+        {"text2sql": "permission_pre_check", "general": "general_response"},
+    ),
+    # 권한 사전 검사 → 스키마 조회 또는 에러
+    "permission_pre_check": (
+        should_continue_unless_execution_error,
+        {"generate": "schema_retrieval", "format_error": "response_formatting"},
+    ),
+    # 스키마 조회 → 쿼리 생성 또는 에러
+    "schema_retrieval": (
+        should_continue_unless_execution_error,
+        {"generate": "query_generation", "format_error": "response_formatting"},
+    ),
+    # 쿼리 생성 → 검증 또는 에러
+    "query_generation": (
+        should_continue_after_generation,
+        {"validate": "query_validation", "format_error": "response_formatting"},
+    ),
+    # 쿼리 검증 → 확인, 재생성, 또는 에러
+    "query_validation": (
+        should_continue_after_validation,
+        {
+            "confirm": "user_confirmation",
+            "regenerate": "query_generation",
+            "format_error": "response_formatting",
+        },
+    ),
+    # 사용자 확인 → 실행, 재검증, 또는 취소
+    "user_confirmation": (
+        should_continue_after_confirmation,
+        {
+            "execute": "query_execution",
+            "revalidate": "query_validation",
+            "format_cancelled": "response_formatting",
+        },
+    ),
+    # 쿼리 실행 → 응답 포맷팅
+    "query_execution": (
+        should_continue_after_execution,
+        {"format_result": "response_formatting"},
+    ),
+}
+
+
 def build_graph() -> StateGraph:
     """
     Text2SQL 에이전트 그래프 빌드
@@ -182,79 +196,12 @@ def build_graph() -> StateGraph:
     # START → 분류 노드 (Text2SQL vs General 판단)
     graph.add_edge(START, "classification")
 
-    # 분류 노드 → 조건부 분기 (권한 검사 또는 일반 답변)
-    graph.add_conditional_edges(
-        "classification",
-        should_continue_after_classification,
-        {
-            "text2sql": "permission_pre_check",
-            "general": "general_response",
-        },
-    )
-
     # 일반 답변 생성 → 응답 포맷팅
     graph.add_edge("general_response", "response_formatting")
 
-    # 권한 사전 검사 → 조건부 분기 (스키마 조회 또는 에러)
-    graph.add_conditional_edges(
-        "permission_pre_check",
-        should_continue_after_permission_check,
-        {
-            "generate": "schema_retrieval",
-            "format_error": "response_formatting",
-        },
-    )
-
-    # 스키마 조회 → 조건부 분기 (쿼리 생성 또는 에러)
-    graph.add_conditional_edges(
-        "schema_retrieval",
-        should_continue_after_schema,
-        {
-            "generate": "query_generation",
-            "format_error": "response_formatting",
-        },
-    )
-
-    # 쿼리 생성 → 조건부 분기 (검증 또는 에러)
-    graph.add_conditional_edges(
-        "query_generation",
-        should_continue_after_generation,
-        {
-            "validate": "query_validation",
-            "format_error": "response_formatting",
-        },
-    )
-
-    # 쿼리 검증 → 조건부 분기 (확인, 재생성, 또는 에러)
-    graph.add_conditional_edges(
-        "query_validation",
-        should_continue_after_validation,
-        {
-            "confirm": "user_confirmation",
-            "regenerate": "query_generation",
-            "format_error": "response_formatting",
-        },
-    )
-
-    # 사용자 확인 → 조건부 분기 (실행, 재검증, 또는 취소)
-    graph.add_conditional_edges(
-        "user_confirmation",
-        should_continue_after_confirmation,
-        {
-            "execute": "query_execution",
-            "revalidate": "query_validation",
-            "format_cancelled": "response_formatting",
-        },
-    )
-
-    # 쿼리 실행 → 응답 포맷팅
-    graph.add_conditional_edges(
-        "query_execution",
-        should_continue_after_execution,
-        {
-            "format_result": "response_formatting",
-        },
-    )
+    # 조건부 분기 (CONDITIONAL_EDGES 디스패치 테이블)
+    for source, (router, path_map) in CONDITIONAL_EDGES.items():
+        graph.add_conditional_edges(source, router, path_map)
 
     # 응답 포맷팅 → END
     graph.add_edge("response_formatting", END)
@@ -286,21 +233,39 @@ def compile_graph(checkpointer: InMemorySaver | None = None) -> StateGraph:
     return compiled
 
 
-# 기본 체크포인터로 컴파일된 그래프 (개발용)
-_default_checkpointer = InMemorySaver()
-default_graph = compile_graph(_default_checkpointer)
+@lru_cache(maxsize=1)
+def _get_default_graph() -> StateGraph:
+    """기본 체크포인터로 컴파일된 그래프 (개발용, 첫 사용 시 한 번만 컴파일)"""
+    return compile_graph(InMemorySaver())
+
+
+# 체크포인터별 컴파일된 그래프 캐시 (id(checkpointer) → 컴파일된 그래프)
+# 컴파일된 그래프가 체크포인터를 참조하므로 캐시에 있는 동안 id가 재사용되지 않음
+_MAX_COMPILED_GRAPHS = 16
+_compiled_graphs: dict[int, StateGraph] = {}
 
 
 def get_graph(checkpointer: InMemorySaver | None = None) -> StateGraph:
     """
     그래프 인스턴스 반환
 
+    체크포인터별로 한 번만 컴파일하고 이후 호출에서는 캐시된 그래프를 재사용합니다.
+
     Args:
         checkpointer: 커스텀 체크포인터 (None이면 기본값 사용)
 
     Returns:
         컴파일된 그래프
     """
-    if checkpointer:
-        return compile_graph(checkpointer)
-    return default_graph
+    if not checkpointer:
+        return _get_default_graph()
+
+    key = id(checkpointer)
+    compiled = _compiled_graphs.get(key)
+    if compiled is None:
+        if len(_compiled_graphs) >= _MAX_COMPILED_GRAPHS:
+            _compiled_graphs.clear()
+        compiled = compile_graph(checkpointer)
+        _compiled_graphs[key] = compiled
+
+    return compiled
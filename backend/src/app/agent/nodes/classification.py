@@ -5,14 +5,16 @@
 """
 
 import logging
+import re
 from typing import Literal
 
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from app.agent.decorators import with_debug_timing
 from app.agent.state import Text2SQLAgentState, update_input
+from app.database.schema import prefetch_database_schema
+from app.llm.content import content_to_text
 from app.llm.factory import get_chat_model
-from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,35 @@ SYSTEM_PROMPT = """당신은 사용자의 질문 의도를 분류하는 AI 어
 - general
 """
 
+# LLM 호출 없이 판별 가능한 명확한 입력용 사전 분류 패턴
+_GENERAL_RE = re.compile(r"^(안녕|반가워|고마워|감사|수고|너는 누구|넌 누구|뭐 해|점심)")
+_SQL_RE = re.compile(r"(매출|고객|주문|상품|재고|얼마|보여줘|조회|알려줘|찾아줘)")
+
+# 키워드 사전 분류를 적용할 최대 질문 길이 (긴 질문은 LLM으로 판단)
+_PRE_CLASSIFY_MAX_LENGTH = 80
+
+
+def _pre_classify(user_question: str) -> Literal["text2sql", "general"] | None:
+    """
+    키워드 기반 사전 분류
+
+    Args:
+        user_question: 사용자 질문
+
+    Returns:
+        명확한 경우 의도, 애매하면 None (LLM으로 분류)
+    """
+    question = user_question.strip()
+    if len(question) >= _PRE_CLASSIFY_MAX_LENGTH:
+        return None
+
+    has_sql_keyword = _SQL_RE.search(question) is not None
+    if _GENERAL_RE.match(question) and not has_sql_keyword:
+        return "general"
+    if has_sql_keyword:
+        return "text2sql"
+    return None
+
 
 @with_debug_timing("classification")
 async def classification_node(state: Text2SQLAgentState) -> dict[str, object]:
@@ -53,12 +84,19 @@ async def classification_node(state: Text2SQLAgentState) -> dict[str, object]:
     Returns:
         업데이트할 상태 딕셔너리
     """
-    settings = get_settings()
     user_question = state["input"]["user_question"]
     llm_provider = state["input"]["llm_provider"]
 
     logger.info(f"의도 분류 시작 - 질문: {user_question[:50]}...")
 
+    # 명확한 입력은 LLM 호출 없이 분류
+    pre_intent = _pre_classify(user_question)
+    if pre_intent is not None:
+        logger.info(f"의도 분류 완료 (키워드): {pre_intent}")
+        return {
+            "input": update_input(state, intent=pre_intent)
+        }
+
     try:
         # LLM 모델 가져오기
         llm = get_chat_model(provider_type=llm_provider)
@@ -69,12 +107,16 @@ async def classification_node(state: Text2SQLAgentState) -> dict[str, object]:
             HumanMessage(content=user_question),
         ]
 
+        # 스키마 캐시가 비어 있으면 LLM 호출 동안 백그라운드로 선조회 (분류는 기다리지 않음)
+        prefetch_database_schema()
+
         # LLM 호출
         response = await llm.ainvoke(messages)
-        content = str(response.content).strip().lower()
+        content = content_to_text(response.content).strip()
 
-        # 결과 파싱
-        if "text2sql" in content:
+        # 결과 파싱 (한 단어만 출력하도록 지시했으므로 첫 줄의 접두어만 확인)
+        first_line = content.partition("\n")[0].strip().lower()
+        if first_line.startswith("text2sql"):
             intent = "text2sql"
         else:
             intent = "general"
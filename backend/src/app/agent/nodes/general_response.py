@@ -10,8 +10,8 @@ from langchain_core.messages import SystemMessage, HumanMessage
 
 from app.agent.decorators import with_debug_timing
 from app.agent.state import Text2SQLAgentState, update_response
+from app.llm.content import content_to_text
 from app.llm.factory import get_chat_model
-from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +51,6 @@ async def general_response_node(state: Text2SQLAgentState) -> dict[str, object]:
     Returns:
         업데이트할 상태 딕셔너리
     """
-    settings = get_settings()
     user_question = state["input"]["user_question"]
     llm_provider = state["input"]["llm_provider"]
 
@@ -69,7 +68,7 @@ async def general_response_node(state: Text2SQLAgentState) -> dict[str, object]:
 
         # LLM 호출
         response = await llm.ainvoke(messages)
-        content = str(response.content)
+        content = content_to_text(response.content)
 
         logger.info("일반 대화 응답 생성 완료")
 
@@ -10,12 +10,21 @@ import logging
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from app.agent.decorators import with_debug_timing
-from app.agent.state import Text2SQLAgentState, update_execution
+from app.agent.state import Text2SQLAgentState, get_accessible_tables_lower, update_execution
 from app.database.schema import get_database_schema
 from app.llm.factory import get_fast_model
+from app.models.entities import DatabaseSchema
+from app.utils.cache import SchemaScopedCache
 
 logger = logging.getLogger(__name__)
 
+# 권한 검사 프롬프트 캐시 (접근 가능 테이블 집합 → 프롬프트, 스키마 객체별로 유지)
+# 값이 None이면 접근 불가 테이블이 없어 검사가 필요 없음을 의미
+_PROMPT_CACHE_MAX_SIZE = 128
+_prompt_cache: SchemaScopedCache[frozenset[str], str | None] = SchemaScopedCache(
+    max_size=_PROMPT_CACHE_MAX_SIZE
+)
+
 PERMISSION_CHECK_PROMPT = """당신은 SQL 데이터베이스 권한 검사기입니다.
 
 사용자의 질문이 아래 "접근 불가 테이블" 목록의 데이터를 필요로 하는지 판단하세요.
@@ -31,6 +40,10 @@ PERMISSION_CHECK_PROMPT = """당신은 SQL 데이터베이스 권한 검사기
 - 질문이 접근 가능 테이블만으로 답할 수 있으면 "NO"만 출력
 - 반드시 YES 또는 NO 중 하나만 출력"""
 
+# 프롬프트 템플릿을 모듈 로드 시 미리 분할 (호출마다 format 문자열 파싱 생략)
+_PROMPT_HEAD, _prompt_rest = PERMISSION_CHECK_PROMPT.split("{accessible_tables}", 1)
+_PROMPT_MIDDLE, _PROMPT_TAIL = _prompt_rest.split("{inaccessible_tables}", 1)
+
 
 def _format_table_list(table_names: list[str], table_descriptions: dict[str, str]) -> str:
     """테이블 이름과 설명을 포맷팅"""
@@ -44,6 +57,54 @@ def _format_table_list(table_names: list[str], table_descriptions: dict[str, str
     return "\n".join(lines) if lines else "(없음)"
 
 
+def _build_permission_prompt(
+    schema: DatabaseSchema, accessible_lower: frozenset[str]
+) -> str | None:
+    """
+    권한 검사 프롬프트 생성
+
+    Args:
+        schema: 데이터베이스 스키마
+        accessible_lower: 소문자로 정규화된 접근 가능 테이블 집합
+
+    Returns:
+        포맷팅된 프롬프트 (접근 불가 테이블이 없으면 None)
+    """
+    # 스키마를 한 번만 순회하며 테이블 목록, 설명 맵, 접근 불가 테이블을 함께 구성
+    all_table_names: set[str] = set()
+    table_descriptions: dict[str, str] = {}
+    inaccessible_tables: set[str] = set()
+    for table in schema.tables:
+        all_table_names.add(table.name)
+        table_descriptions[table.name] = table.description or ""
+        if table.name.lower() not in accessible_lower:
+            inaccessible_tables.add(table.name)
+
+    if not inaccessible_tables:
+        return None
+
+    accessible_block = _format_table_list(
+        list(accessible_lower & all_table_names), table_descriptions
+    )
+    inaccessible_block = _format_table_list(list(inaccessible_tables), table_descriptions)
+    return _PROMPT_HEAD + accessible_block + _PROMPT_MIDDLE + inaccessible_block + _PROMPT_TAIL
+
+
+def _get_permission_prompt(
+    schema: DatabaseSchema, accessible_lower: frozenset[str]
+) -> str | None:
+    """
+    캐시된 권한 검사 프롬프트 반환
+
+    스키마가 새로 조회되면(객체가 바뀌면) 캐시를 비우고 다시 생성합니다.
+    """
+    return _prompt_cache.get_or_build(
+        schema,
+        accessible_lower,
+        lambda: _build_permission_prompt(schema, accessible_lower),
+    )
+
+
 @with_debug_timing("permission_pre_check")
 async def permission_pre_check_node(state: Text2SQLAgentState) -> dict[str, object]:
     """
@@ -76,35 +137,14 @@ async def permission_pre_check_node(state: Text2SQLAgentState) -> dict[str, obje
         # 전체 스키마 조회 (캐시됨)
         schema = await get_database_schema()
 
-        # 전체 테이블 목록에서 접근 불가 테이블 추출
-        all_table_names = {table.name for table in schema.tables}
-        accessible_lower = {t.lower() for t in accessible_tables}
-        inaccessible_tables = {
-            name for name in all_table_names
-            if name.lower() not in accessible_lower
-        }
+        # 프롬프트 조회 (스키마/권한 조합별 캐시)
+        prompt = _get_permission_prompt(schema, get_accessible_tables_lower(state))
 
         # 접근 불가 테이블이 없으면 스킵
-        if not inaccessible_tables:
+        if prompt is None:
             logger.debug("접근 불가 테이블 없음 - 권한 사전 검사 스킵")
             return {}
 
-        # 테이블 설명 맵 생성 (프롬프트용)
-        table_descriptions = {
-            table.name: table.description or ""
-            for table in schema.tables
-        }
-
-        # 프롬프트 구성
-        prompt = PERMISSION_CHECK_PROMPT.format(
-            accessible_tables=_format_table_list(
-                list(accessible_lower & all_table_names), table_descriptions
-            ),
-            inaccessible_tables=_format_table_list(
-                list(inaccessible_tables), table_descriptions
-            ),
-        )
-
         user_question = state["input"]["user_question"]
 
         # fast model로 권한 체크
@@ -117,7 +157,7 @@ async def permission_pre_check_node(state: Text2SQLAgentState) -> dict[str, obje
         ])
 
         answer = response.content.strip().upper()
-        logger.info(f"권한 사전 검사 결과: {answer}")
+        logger.info("권한 사전 검사 결과: %s", answer)
 
         if answer.startswith("YES"):
             logger.warning(
@@ -5,13 +5,62 @@
 """
 
 import logging
+from functools import partial
+
+import sqlglot
+from sqlglot import exp
 
 from app.agent.decorators import with_debug_timing
-from app.agent.state import Text2SQLAgentState, update_execution, update_response
+from app.agent.state import (
+    Text2SQLAgentState,
+    get_accessible_tables_lower,
+    update_execution,
+    update_response,
+)
+from app.auth.permissions import extract_tables_from_query
+from app.config import get_settings
 from app.database.executor import execute_safe_query
+from app.database.query_cache import (
+    get_cached_result,
+    make_cache_key,
+    run_coalesced,
+    store_result,
+)
+from app.models.entities import QueryResult
 
 logger = logging.getLogger(__name__)
 
+def ensure_limit(sql: str, max_rows: int) -> tuple[str, bool]:
+    """
+    LIMIT 절이 없는 SELECT 쿼리에 LIMIT을 추가합니다.
+
+    파싱할 수 없거나 SELECT/UNION 쿼리가 아니면 원본 쿼리를 그대로 반환합니다.
+
+    Args:
+        sql: 실행할 SQL 쿼리
+        max_rows: 추가할 LIMIT 값
+
+    Returns:
+        (실행할 쿼리, LIMIT 추가 여부)
+    """
+    try:
+        ast = sqlglot.parse_one(sql, read="postgres")
+    except sqlglot.errors.SqlglotError:
+        return sql, False
+
+    if not isinstance(ast, exp.Query) or ast.args.get("limit") is not None:
+        return sql, False
+
+    return ast.limit(max_rows).sql(dialect="postgres"), True
+
+
+async def _execute_and_cache(query: str, cache_key: str) -> QueryResult:
+    """쿼리를 실행하고 결과가 있으면 캐시에 저장"""
+    result = await execute_safe_query(query)
+    if result.total_row_count > 0:
+        store_result(cache_key, result)
+    return result
+
 
 @with_debug_timing("query_execution")
 async def query_execution_node(state: Text2SQLAgentState) -> dict[str, object]:
@@ -41,40 +90,57 @@ async def query_execution_node(state: Text2SQLAgentState) -> dict[str, object]:
     auth = state.get("auth", {})
     accessible_tables = auth.get("accessible_tables", [])
     if accessible_tables:
-        from app.auth.permissions import extract_tables_from_query
-
         referenced_tables = extract_tables_from_query(query)
-        accessible_lower = [t.lower() for t in accessible_tables]
+        accessible_lower = get_accessible_tables_lower(state)
         unauthorized = [
             t for t in referenced_tables if t.lower() not in accessible_lower
         ]
         if unauthorized:
-            logger.warning(f"실행 단계에서 권한 없는 테이블 접근 차단: {unauthorized}")
+            logger.warning("실행 단계에서 권한 없는 테이블 접근 차단: %s", unauthorized)
             return {
                 "execution": update_execution(state, query_result=[], result_columns=[], total_row_count=0, execution_time_ms=0, execution_error=f"접근 권한이 없는 테이블이 포함되어 있습니다: {', '.join(unauthorized)}"),
                 "response": update_response(state, response_format="error"),
             }
 
-    logger.info(f"쿼리 실행 시작 - 쿼리: {query[:100]}...")
+    logger.info("쿼리 실행 시작 - 쿼리: %.100s...", query)
 
     try:
-        # 안전한 쿼리 실행
-        result = await execute_safe_query(query)
+        # 결과 크기 상한 보장 (LIMIT 없는 쿼리에 자동 추가)
+        # 최대 행 수보다 한 행 더 가져오게 하여 실행기가 결과 잘림을 감지할 수 있도록 함
+        query, limit_injected = ensure_limit(query, get_settings().max_result_rows + 1)
+        if limit_injected:
+            logger.info("LIMIT 절 자동 추가")
+
+        # 동일 쿼리/권한 범위의 최근 결과가 있으면 DB 왕복 생략
+        cache_key = make_cache_key(query, accessible_tables)
+        result = get_cached_result(cache_key)
+        if result is not None:
+            logger.info("쿼리 결과 캐시 사용")
+        else:
+            # 안전한 쿼리 실행 (동시에 들어온 동일 쿼리는 한 번만 실행)
+            result = await run_coalesced(
+                cache_key, partial(_execute_and_cache, query, cache_key)
+            )
 
         # 결과 처리
         rows = result.rows
         columns = [
-            {
-                "name": col.name,
-                "data_type": col.data_type,
-                "is_nullable": col.is_nullable,
-            }
+            {"name": col.name, "data_type": col.data_type, "is_nullable": col.is_nullable}
             for col in result.columns
         ]
         total_count = result.total_row_count
         execution_time = result.execution_time_ms
+        is_truncated = result.is_truncated
+
+        # 자동 추가된 LIMIT(최대 행 수 + 1)에 걸린 경우 여분의 한 행은 잘림 감지용이므로
+        # 모든 소비자(응답/SSE/확인 API)가 같은 값을 보도록 행 수를 최대 행 수로 맞춤
+        if limit_injected:
+            max_rows = get_settings().max_result_rows
+            if total_count > max_rows:
+                total_count = max_rows
+                is_truncated = True
 
-        logger.info(f"쿼리 실행 완료 - {total_count}행, {execution_time}ms")
+        logger.info("쿼리 실행 완료 - %d행, %dms", total_count, execution_time)
 
         # 결과 형식 결정
         if total_count == 0:
@@ -83,12 +149,21 @@ async def query_execution_node(state: Text2SQLAgentState) -> dict[str, object]:
             response_format = "table"
 
         return {
-            "execution": update_execution(state, query_result=rows, result_columns=columns, total_row_count=total_count, execution_time_ms=execution_time, execution_error=None),
+            "execution": update_execution(
+                state,
+                query_result=rows,
+                result_columns=columns,
+                total_row_count=total_count,
+                execution_time_ms=execution_time,
+                execution_error=None,
+                limit_injected=limit_injected,
+                is_truncated=is_truncated,
+            ),
             "response": update_response(state, response_format=response_format),
         }
 
     except Exception as e:
-        logger.error(f"쿼리 실행 실패: {e}")
+        logger.error("쿼리 실행 실패: %s", e)
         return {
             "execution": update_execution(state, query_result=[], result_columns=[], total_row_count=0, execution_time_ms=0, execution_error=str(e)),
             "response": update_response(state, response_format="error"),
@@ -5,11 +5,21 @@ LLM을 사용하여 자연어 질문을 SQL 쿼리로 변환합니다.
 대화 맥락을 활용하여 연속 질문을 처리합니다.
 """
 
+import itertools
 import logging
+import os
 import re
+import time
 import uuid
-
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from functools import lru_cache
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+)
 
 from app.agent.decorators import with_debug_timing
 from app.agent.state import Text2SQLAgentState, update_execution, update_generation, update_response
@@ -19,7 +29,6 @@ from app.llm.factory import get_chat_model
 
 logger = logging.getLogger(__name__)
 
-# 맥락 참조 패턴 (한국어)
 # 맥락 참조 패턴 (한국어)
 CONTEXT_REFERENCE_PATTERNS = [
     r"그중에",
@@ -56,6 +65,13 @@ RESET_COMMAND_PATTERNS = [
     r"^새\s*대화$",
 ]
 
+# 패턴 목록을 하나의 정규식으로 미리 컴파일 (질문당 정규식 호출 1회)
+_CONTEXT_REFERENCE_RE = re.compile("|".join(f"(?:{p})" for p in CONTEXT_REFERENCE_PATTERNS))
+_RESET_COMMAND_RE = re.compile(
+    "^(?:" + "|".join(p.strip("^$") for p in RESET_COMMAND_PATTERNS) + ")$",
+    re.IGNORECASE,
+)
+
 FEW_SHOT_EXAMPLES = """
 ## 예시
 
@@ -230,6 +246,57 @@ SQL:
 여기에 이 쿼리가 무엇을 조회하는지 한국어로 설명
 """
 
+# 맥락 인식 프롬프트를 대화 히스토리 위치에서 미리 분할 (스키마 부분만 캐시하기 위함)
+_CONTEXT_PROMPT_HEAD, _CONTEXT_PROMPT_TAIL = CONTEXT_AWARE_SYSTEM_PROMPT.split(
+    "{conversation_history}", 1
+)
+
+# LLM 응답 파싱용 정규식
+_SQL_BLOCK_RE = re.compile(r"```sql(.*?)```", re.DOTALL)
+_CODE_BLOCK_RE = re.compile(r"```(.*?)```", re.DOTALL)
+_EXPLANATION_RE = re.compile(r"설명:(.*?)(?:```|##|\Z)", re.DOTALL)
+
+# 히스토리의 AIMessage.additional_kwargs에 생성된 SQL을 저장하는 키
+_HISTORY_SQL_KEY = "sql"
+
+# 쿼리 ID 생성용: 프로세스별 난수(62비트, 시작 시 한 번만 생성)와 순번 카운터
+_QUERY_ID_NODE = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+_query_id_counter = itertools.count()
+
+
+def _new_query_id() -> str:
+    """
+    시간순 정렬 가능한 쿼리 ID 생성 (UUIDv7 형식)
+
+    상위 48비트는 밀리초 타임스탬프, 12비트는 순번, 나머지는 프로세스별 난수로 채워
+    호출마다 os.urandom을 사용하지 않습니다.
+
+    Returns:
+        UUID 문자열
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    sequence = next(_query_id_counter) & 0xFFF
+    value = (
+        (timestamp_ms << 80)
+        | (0x7 << 76)  # 버전 7
+        | (sequence << 64)
+        | (0b10 << 62)  # RFC 4122 variant
+        | _QUERY_ID_NODE
+    )
+    return str(uuid.UUID(int=value))
+
+
+@lru_cache(maxsize=8)
+def _build_system_prompt(schema: str) -> str:
+    """기본 시스템 프롬프트 생성 (스키마 문자열별 캐시)"""
+    return SYSTEM_PROMPT.format(schema=schema, few_shot_examples=FEW_SHOT_EXAMPLES)
+
+
+@lru_cache(maxsize=8)
+def _build_context_prompt_tail(schema: str) -> str:
+    """맥락 인식 프롬프트의 히스토리 이후 부분 생성 (스키마 문자열별 캐시)"""
+    return _CONTEXT_PROMPT_TAIL.format(schema=schema, few_shot_examples=FEW_SHOT_EXAMPLES)
+
 
 def detect_context_reference(question: str) -> bool:
     """
@@ -241,13 +308,7 @@ def detect_context_reference(question: str) -> bool:
     Returns:
         맥락 참조 여부
     """
-    question_lower = question.lower().strip()
-
-    for pattern in CONTEXT_REFERENCE_PATTERNS:
-        if re.search(pattern, question_lower):
-            return True
-
-    return False
+    return _CONTEXT_REFERENCE_RE.search(question.lower()) is not None
 
 
 def is_reset_command(question: str) -> bool:
@@ -260,13 +321,7 @@ def is_reset_command(question: str) -> bool:
     Returns:
         리셋 명령어 여부
     """
-    question_normalized = question.strip()
-
-    for pattern in RESET_COMMAND_PATTERNS:
-        if re.match(pattern, question_normalized, re.IGNORECASE):
-            return True
-
-    return False
+    return _RESET_COMMAND_RE.match(question.strip()) is not None
 
 
 def build_context_aware_prompt(
@@ -286,7 +341,7 @@ def build_context_aware_prompt(
         맥락이 포함된 프롬프트
     """
     if not message_history:
-        return SYSTEM_PROMPT.format(schema=schema, few_shot_examples=FEW_SHOT_EXAMPLES)
+        return _build_system_prompt(schema)
 
     # 대화 히스토리 포맷팅
     history_lines = []
@@ -294,7 +349,13 @@ def build_context_aware_prompt(
         if isinstance(msg, HumanMessage):
             history_lines.append(f"사용자: {msg.content}")
         elif isinstance(msg, AIMessage):
-            # AI 응답에서 SQL 쿼리 부분만 추출
+            # 생성 시점에 저장한 SQL이 있으면 그대로 사용
+            sql = msg.additional_kwargs.get(_HISTORY_SQL_KEY)
+            if sql:
+                history_lines.append(f"생성된 쿼리: {sql}")
+                continue
+
+            # 이전 버전에서 저장된 히스토리: AI 응답에서 SQL 쿼리 부분만 추출
             content = str(msg.content)
             if "```sql" in content:
                 try:
@@ -309,11 +370,7 @@ def build_context_aware_prompt(
 
     conversation_history = "\n".join(history_lines)
 
-    return CONTEXT_AWARE_SYSTEM_PROMPT.format(
-        conversation_history=conversation_history,
-        schema=schema,
-        few_shot_examples=FEW_SHOT_EXAMPLES,
-    )
+    return _CONTEXT_PROMPT_HEAD + conversation_history + _build_context_prompt_tail(schema)
 
 
 def format_messages_for_llm(
@@ -362,6 +419,15 @@ async def query_generation_node(state: Text2SQLAgentState) -> dict[str, object]:
 
     # Nested 구조에서 값 추출
     attempt = state["generation"]["generation_attempt"] + 1
+
+    # 최대 시도 횟수 확인 (다른 검사보다 먼저 수행하여 마지막 시도에서의 불필요한 작업 생략)
+    if attempt > settings.max_generation_attempts:
+        logger.warning("최대 생성 시도 횟수 초과: %d", attempt)
+        return {
+            "generation": update_generation(state, generation_attempt=attempt, generated_query="", query_explanation=""),
+            "execution": update_execution(state, execution_error="쿼리를 생성할 수 없습니다. 질문을 다시 확인해주세요."),
+        }
+
     user_question = state["input"]["user_question"]
     message_history = state.get("messages", [])
 
@@ -374,7 +440,7 @@ async def query_generation_node(state: Text2SQLAgentState) -> dict[str, object]:
             "execution": update_execution(state, execution_error="접근 권한이 없습니다. 요청하신 데이터에 대한 조회 권한이 부여되지 않았습니다."),
         }
 
-    logger.info(f"쿼리 생성 시작 - 질문: {user_question[:50]}... (시도 {attempt})")
+    logger.info("쿼리 생성 시작 - 질문: %.50s... (시도 %d)", user_question, attempt)
 
     # 리셋 명령어 확인
     if is_reset_command(user_question):
@@ -406,13 +472,6 @@ async def query_generation_node(state: Text2SQLAgentState) -> dict[str, object]:
             "execution": update_execution(state, execution_error=help_text),
         }
 
-    # 최대 시도 횟수 확인
-    if attempt > settings.max_generation_attempts:
-        logger.warning(f"최대 생성 시도 횟수 초과: {attempt}")
-        return {
-            "generation": update_generation(state, generation_attempt=attempt, generated_query="", query_explanation=""),
-            "execution": update_execution(state, execution_error="쿼리를 생성할 수 없습니다. 질문을 다시 확인해주세요."),
-        }
     try:
         # LLM 모델 가져오기 (state에서 선택한 provider 사용)
         llm_provider = state["input"]["llm_provider"]
@@ -428,10 +487,7 @@ async def query_generation_node(state: Text2SQLAgentState) -> dict[str, object]:
                 schema=database_schema,
             )
         else:
-            system_prompt = SYSTEM_PROMPT.format(
-                schema=database_schema,
-                few_shot_examples=FEW_SHOT_EXAMPLES,
-            )
+            system_prompt = _build_system_prompt(database_schema)
 
         # 메시지 구성
         messages = format_messages_for_llm(
@@ -455,23 +511,35 @@ async def query_generation_node(state: Text2SQLAgentState) -> dict[str, object]:
             }
 
         # 쿼리 ID 생성
-        query_id = str(uuid.uuid4())
+        query_id = _new_query_id()
 
-        logger.info(f"쿼리 생성 완료 - ID: {query_id}")
+        logger.info("쿼리 생성 완료 - ID: %s", query_id)
 
         # 메시지 히스토리에 현재 대화 추가
-        updated_messages = list(message_history)
-        updated_messages.append(HumanMessage(content=user_question))
-        updated_messages.append(AIMessage(content=response_text))
+        # add_messages 리듀서가 기존 히스토리에 누적하므로 이번 턴의 메시지만 반환
+        new_messages: list[BaseMessage] = [
+            HumanMessage(content=user_question),
+            AIMessage(
+                content=response_text,
+                additional_kwargs={_HISTORY_SQL_KEY: sql_query},
+            ),
+        ]
+
+        # 최대 히스토리 수를 넘는 오래된 메시지는 RemoveMessage로 제거
+        overflow = len(message_history) + len(new_messages) - settings.max_message_history
+        if overflow > 0:
+            new_messages = [
+                RemoveMessage(id=msg.id) for msg in message_history[:overflow] if msg.id
+            ] + new_messages
 
         return {
             "generation": update_generation(state, generation_attempt=attempt, generated_query=sql_query, query_explanation=explanation, query_id=query_id),
             "execution": update_execution(state, execution_error=None),
-            "messages": updated_messages,
+            "messages": new_messages,
         }
 
     except Exception as e:
-        logger.error(f"쿼리 생성 실패: {e}")
+        logger.error("쿼리 생성 실패: %s", e)
         return {
             "generation": update_generation(state, generation_attempt=attempt, generated_query="", query_explanation=""),
             "execution": update_execution(state, execution_error=f"쿼리 생성 중 오류가 발생했습니다: {e}"),
@@ -488,55 +556,20 @@ def _parse_llm_response(response: str) -> tuple[str, str]:
     Returns:
         (SQL 쿼리, 설명) 튜플
     """
-    sql_query = ""
-    explanation = ""
+    # SQL 블록 추출 (sql 태그 블록 우선, 태그가 아예 없을 때만 일반 코드 블록 사용)
+    sql_match = _SQL_BLOCK_RE.search(response)
+    if sql_match is None and "```sql" not in response:
+        sql_match = _CODE_BLOCK_RE.search(response)
+    sql_query = sql_match.group(1).strip() if sql_match else ""
 
-    # SQL 블록 추출
-    if "```sql" in response:
-        try:
-            sql_start = response.index("```sql") + 6
-            sql_end = response.index("```", sql_start)
-            sql_query = response[sql_start:sql_end].strip()
-        except ValueError:
-            pass
-    elif "```" in response:
-        # sql 태그 없이 코드 블록만 있는 경우
-        try:
-            sql_start = response.index("```") + 3
-            sql_end = response.index("```", sql_start)
-            sql_query = response[sql_start:sql_end].strip()
-        except ValueError:
-            pass
-
-    # 설명 추출
-    if "설명:" in response:
-        try:
-            explanation_start = response.index("설명:") + 3
-            explanation = response[explanation_start:].strip()
-            
-            # 다음 섹션이나 불필요한 마크다운 헤더가 있으면 자르기
-            # 예: ## 데이터베이스 스키마, ``` 등이 딸려오는 경우 방지
-            cut_indicators = ["```", "##"]
-            indices = [explanation.find(ind) for ind in cut_indicators if explanation.find(ind) != -1]
-            
-            if indices:
-                cut_index = min(indices)
-                explanation = explanation[:cut_index].strip()
-                
-        except ValueError:
-            pass
+    # 설명 추출 (다음 코드 블록이나 마크다운 헤더 전까지)
+    explanation = ""
+    explanation_match = _EXPLANATION_RE.search(response)
+    if explanation_match:
+        explanation = explanation_match.group(1).strip()
     elif sql_query:
-        # 설명이 없으면 SQL 이후의 텍스트를 설명으로 사용
-        if "```" in response:
-            try:
-                after_sql = response.split("```")[-1].strip()
-                if after_sql:
-                    explanation = after_sql
-                    # 헤더 제거
-                    if "##" in explanation:
-                        explanation = explanation[:explanation.index("##")].strip()
-            except Exception:
-                pass
+        # 설명이 없으면 마지막 코드 블록 이후의 텍스트를 설명으로 사용 (헤더 제거)
+        explanation = response.rpartition("```")[2].partition("##")[0].strip()
 
     # 기본 설명
     if not explanation and sql_query:
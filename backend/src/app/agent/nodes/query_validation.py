@@ -8,32 +8,103 @@ LangGraph 워크플로우에서 생성된 SQL 쿼리의 안전성을 검증합
 3. 시맨틱 검증 (LLM 사용)
 """
 
+import asyncio
+import hashlib
 import logging
-from dataclasses import dataclass
-from typing import Literal
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal, TypeVar
 
 from langchain_core.language_models import BaseChatModel
 
 from app.agent.decorators import with_debug_timing
-from app.agent.state import Text2SQLAgentState, update_execution, update_generation, update_validation
+from app.agent.state import (
+    Text2SQLAgentState,
+    get_accessible_tables_lower,
+    update_execution,
+    update_generation,
+    update_validation,
+)
+from app.auth.permissions import extract_tables_from_query
+from app.config import get_settings
 from app.database.schema import get_database_schema
 from app.errors.exceptions import DangerousQueryError, QueryValidationError
 from app.llm.factory import get_llm
 from app.models.entities import DatabaseSchema
 from app.validation.keyword_validator import KeywordValidator, get_keyword_validator
-from app.validation.schema_validator import SchemaValidator
+from app.validation.schema_validator import get_schema_validator
 from app.validation.semantic_validator import (
+    CACHEABLE_MIN_CONFIDENCE,
     SemanticValidator,
+    is_simple_select,
     quick_pattern_check,
 )
 
 logger = logging.getLogger(__name__)
 
+_R = TypeVar("_R")
+
 # 최대 재시도 횟수
 MAX_VALIDATION_RETRIES = 3
 
+# 이 길이를 넘는 쿼리만 동기 검증기를 스레드로 오프로드 (짧은 쿼리는 스레드 전환 비용이 더 큼)
+_THREAD_OFFLOAD_MIN_QUERY_LENGTH = 256
+
+@dataclass(slots=True)
+class _SchemaCacheState:
+    """검증용 스키마 캐시 상태 (조회 시각, 스키마, 갱신 락)"""
+
+    loaded_at: float = 0.0
+    schema: DatabaseSchema | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def get_fresh(self, ttl: float) -> DatabaseSchema | None:
+        """TTL 안의 캐시된 스키마 반환 (없거나 만료되었으면 None)"""
+        if self.schema is not None and time.monotonic() - self.loaded_at < ttl:
+            return self.schema
+        return None
+
+
+# 검증용 스키마 캐시
+_schema_cache = _SchemaCacheState()
+
+
+async def _get_schema_cached() -> DatabaseSchema:
+    """
+    검증용 스키마 조회 (TTL 캐시)
+
+    TTL 동안은 get_database_schema의 버전 체크 없이 캐시된 스키마를 반환하고,
+    만료되면 락을 잡고 한 번만 다시 조회합니다.
 
-@dataclass
+    Returns:
+        DatabaseSchema: 스키마 정보
+    """
+    ttl = get_settings().validation_schema_cache_ttl_seconds
+    cached = _schema_cache.get_fresh(ttl)
+    if cached is not None:
+        return cached
+
+    async with _schema_cache.lock:
+        # 락 대기 중 다른 요청이 갱신했으면 그대로 사용
+        cached = _schema_cache.get_fresh(ttl)
+        if cached is not None:
+            return cached
+
+        schema = await get_database_schema()
+        _schema_cache.schema = schema
+        _schema_cache.loaded_at = time.monotonic()
+        return schema
+
+
+def invalidate_schema_cache() -> None:
+    """검증용 스키마 캐시 초기화 (DDL 변경 후 호출)"""
+    _schema_cache.schema = None
+    logger.info("검증용 스키마 캐시 초기화됨")
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationPipelineResult:
     """검증 파이프라인 결과"""
 
@@ -50,11 +121,118 @@ class ValidationPipelineResult:
     """상세 정보"""
 
 
+# 검증 결과 메모 ((쿼리 해시, 스키마 버전, LLM provider) → (만료 시각, 결과))
+# 재시도 루프나 반복 질문에서 같은 쿼리를 다시 검증할 때 LLM 호출까지 생략
+VALIDATION_CACHE_TTL_SECONDS = 300
+VALIDATION_CACHE_MAX_ENTRIES = 4096
+_ValidationCacheKey = tuple[bytes, str, str]
+_validation_cache: OrderedDict[
+    _ValidationCacheKey, tuple[float, ValidationPipelineResult]
+] = OrderedDict()
+
+
+def _validation_cache_key(
+    query: str, schema: DatabaseSchema, llm_provider: str
+) -> _ValidationCacheKey:
+    """검증 결과 메모 키 생성 (쿼리 해시, 스키마 버전, LLM provider)"""
+    query_hash = hashlib.blake2b(query.encode(), digest_size=16).digest()
+    return query_hash, schema.version, llm_provider
+
+
+def _is_cacheable_validation(result: ValidationPipelineResult) -> bool:
+    """
+    결정적인 검증 결과인지 판단
+
+    키워드/스키마/패턴 차단과 단순 쿼리 통과는 같은 입력에 항상 같은 결과이므로 메모합니다.
+    LLM 판정은 신뢰도가 기준을 넘을 때만 메모하여,
+    LLM 오류로 인한 차단(strict)이나 통과(lenient)가 재시도에 남지 않게 합니다.
+    """
+    if result.blocked_at_layer in ("keyword", "schema"):
+        return True
+    if "pattern_check_failed" in result.details or result.details.get("simple_query"):
+        return True
+
+    confidence = result.details.get("confidence")
+    return isinstance(confidence, float) and confidence > CACHEABLE_MIN_CONFIDENCE
+
+
+def _get_cached_validation(
+    key: _ValidationCacheKey,
+) -> ValidationPipelineResult | None:
+    """메모된 검증 결과 조회 (없거나 만료되었으면 None)"""
+    entry = _validation_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, result = entry
+    if time.monotonic() >= expires_at:
+        del _validation_cache[key]
+        return None
+
+    return result
+
+
+def _store_validation(key: _ValidationCacheKey, result: ValidationPipelineResult) -> None:
+    """검증 결과 메모 저장 (최대 항목 수 초과 시 오래된 항목부터 제거)"""
+    _validation_cache[key] = (time.monotonic() + VALIDATION_CACHE_TTL_SECONDS, result)
+    _validation_cache.move_to_end(key)
+    while len(_validation_cache) > VALIDATION_CACHE_MAX_ENTRIES:
+        _validation_cache.popitem(last=False)
+
+
+def clear_validation_cache() -> None:
+    """검증 결과 메모 초기화"""
+    _validation_cache.clear()
+    logger.info("검증 결과 메모 초기화됨")
+
+
+async def _run_sync_validator(validate: Callable[[str], _R], query: str) -> _R:
+    """
+    동기(CPU) 검증기 실행
+
+    긴 쿼리는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    """
+    if (
+        len(query) > _THREAD_OFFLOAD_MIN_QUERY_LENGTH
+        and get_settings().validation_thread_offload
+    ):
+        return await asyncio.to_thread(validate, query)
+    return validate(query)
+
+
+async def _check_keywords(query: str) -> ValidationPipelineResult | None:
+    """
+    1단계 키워드 검증
+
+    스키마가 필요 없으므로 스키마 조회 전에 실행할 수 있습니다.
+
+    Returns:
+        차단된 경우 검증 결과, 통과하면 None
+    """
+    logger.debug("1단계: 키워드 검증")
+    keyword_result = await _run_sync_validator(get_keyword_validator().validate, query)
+
+    if keyword_result.is_valid:
+        return None
+
+    logger.warning("키워드 검증 실패: %s", keyword_result.detected_keywords)
+    return ValidationPipelineResult(
+        is_valid=False,
+        blocked_at_layer="keyword",
+        error_message=keyword_result.error_message,
+        details={
+            "detected_keywords": keyword_result.detected_keywords,
+        },
+    )
+
+
 async def validate_query_pipeline(
     query: str,
     schema: DatabaseSchema,
     llm: BaseChatModel | None = None,
     skip_semantic: bool = False,
+    keywords_checked: bool = False,
+    skip_semantic_for_simple: bool = False,
 ) -> ValidationPipelineResult:
     """
     3단계 쿼리 검증 파이프라인 실행
@@ -66,37 +244,30 @@ async def validate_query_pipeline(
         schema: 데이터베이스 스키마
         llm: 시맨틱 검증용 LLM (None이면 건너뜀)
         skip_semantic: True면 시맨틱 검증 건너뜀
+        keywords_checked: True면 호출자가 이미 통과시킨 키워드 검증 건너뜀
+        skip_semantic_for_simple: True면 패턴 검사를 통과한 단순 SELECT는 LLM 검증 생략
 
     Returns:
         ValidationPipelineResult: 검증 결과
     """
-    logger.info(f"쿼리 검증 파이프라인 시작: {query[:100]}...")
+    logger.info("쿼리 검증 파이프라인 시작: %.100s...", query)
 
     # 1단계: 키워드 검증 (가장 빠름)
-    logger.debug("1단계: 키워드 검증")
-    keyword_validator = get_keyword_validator()
-    keyword_result = keyword_validator.validate(query)
-
-    if not keyword_result.is_valid:
-        logger.warning(f"키워드 검증 실패: {keyword_result.detected_keywords}")
-        return ValidationPipelineResult(
-            is_valid=False,
-            blocked_at_layer="keyword",
-            error_message=keyword_result.error_message,
-            details={
-                "detected_keywords": keyword_result.detected_keywords,
-            },
-        )
+    if not keywords_checked:
+        keyword_block = await _check_keywords(query)
+        if keyword_block is not None:
+            return keyword_block
 
     # 2단계: 스키마 검증
     logger.debug("2단계: 스키마 검증")
-    schema_validator = SchemaValidator(schema)
-    schema_result = schema_validator.validate(query)
+    schema_validator = get_schema_validator(schema)
+    schema_result = await _run_sync_validator(schema_validator.validate, query)
 
     if not schema_result.is_valid:
         logger.warning(
-            f"스키마 검증 실패: 테이블={schema_result.invalid_tables}, "
-            f"컬럼={schema_result.invalid_columns}"
+            "스키마 검증 실패: 테이블=%s, 컬럼=%s",
+            schema_result.invalid_tables,
+            schema_result.invalid_columns,
         )
         return ValidationPipelineResult(
             is_valid=False,
@@ -105,6 +276,11 @@ async def validate_query_pipeline(
             details={
                 "invalid_tables": schema_result.invalid_tables,
                 "invalid_columns": schema_result.invalid_columns,
+                # 재생성 힌트용 요약 (이름 목록은 error_message에 이미 포함)
+                "summary": (
+                    f"테이블 {len(schema_result.invalid_tables)}개, "
+                    f"컬럼 {len(schema_result.invalid_columns)}개를 찾을 수 없음"
+                ),
             },
         )
 
@@ -121,7 +297,7 @@ async def validate_query_pipeline(
     # 빠른 패턴 검사 (LLM 호출 전)
     pattern_safe, pattern_reason = quick_pattern_check(query)
     if not pattern_safe:
-        logger.warning(f"패턴 검사 실패: {pattern_reason}")
+        logger.warning("패턴 검사 실패: %s", pattern_reason)
         return ValidationPipelineResult(
             is_valid=False,
             blocked_at_layer="semantic",
@@ -129,12 +305,22 @@ async def validate_query_pipeline(
             details={"pattern_check_failed": pattern_reason},
         )
 
+    # 단순 쿼리는 LLM 호출 없이 통과 (조기 종료)
+    if skip_semantic_for_simple and is_simple_select(query):
+        logger.debug("단순 쿼리로 판단되어 LLM 시맨틱 검증 생략")
+        return ValidationPipelineResult(
+            is_valid=True,
+            blocked_at_layer=None,
+            error_message="",
+            details={"skipped_semantic": True, "simple_query": True},
+        )
+
     logger.debug("3단계: 시맨틱 검증")
     semantic_validator = SemanticValidator(llm)
     semantic_result = await semantic_validator.validate(query)
 
     if not semantic_result.is_valid:
-        logger.warning(f"시맨틱 검증 실패: {semantic_result.reason}")
+        logger.warning("시맨틱 검증 실패: %s", semantic_result.reason)
         return ValidationPipelineResult(
             is_valid=False,
             blocked_at_layer="semantic",
@@ -150,10 +336,52 @@ async def validate_query_pipeline(
         is_valid=True,
         blocked_at_layer=None,
         error_message="",
-        details={},
+        details={"confidence": semantic_result.confidence},
     )
 
 
+async def _validate_with_schema(
+    state: Text2SQLAgentState, query: str
+) -> ValidationPipelineResult:
+    """
+    키워드 검증을 통과한 쿼리의 스키마/시맨틱 검증
+
+    같은 스키마 버전/provider에서 이미 검증한 쿼리면 메모된 결과를 재사용합니다.
+    """
+    # 스키마 가져오기
+    schema = await _get_schema_cached()
+    llm_provider = state["input"]["llm_provider"]
+
+    cache_key = _validation_cache_key(query, schema, llm_provider)
+    result = _get_cached_validation(cache_key)
+    if result is not None:
+        logger.debug("검증 결과 메모 사용")
+        return result
+
+    # LLM 가져오기 (시맨틱 검증용)
+    # 빠른 모델 사용, state에서 선택한 provider 사용
+    llm = get_llm(provider_type=llm_provider, use_fast_model=True)
+
+    # 검증 파이프라인 실행
+    result = await validate_query_pipeline(
+        query=query,
+        schema=schema,
+        llm=llm,
+        skip_semantic=False,
+        keywords_checked=True,
+        skip_semantic_for_simple=get_settings().skip_semantic_for_simple_queries,
+    )
+    if _is_cacheable_validation(result):
+        _store_validation(cache_key, result)
+    return result
+
+
+def _session_query_hash(state: Text2SQLAgentState, query: str) -> str:
+    """세션 fast-path용 쿼리 해시 (권한 범위가 바뀌면 다른 해시)"""
+    scope = ",".join(sorted(get_accessible_tables_lower(state)))
+    return hashlib.sha1(f"{scope}\0{query}".encode()).hexdigest()
+
+
 @with_debug_timing("query_validation")
 async def query_validation_node(
     state: Text2SQLAgentState,
@@ -171,56 +399,73 @@ async def query_validation_node(
         업데이트된 상태 필드
     """
     # Nested 구조에서 값 추출
-    generated_query = state["generation"]["generated_query"]
-    generation_attempt = state["generation"]["generation_attempt"]
+    generation = state["generation"]
+    generated_query = generation["generated_query"]
+    generation_attempt = generation["generation_attempt"]
 
     logger.info(
-        f"쿼리 검증 노드 실행 (시도 {generation_attempt}/{MAX_VALIDATION_RETRIES})"
+        "쿼리 검증 노드 실행 (시도 %d/%d)", generation_attempt, MAX_VALIDATION_RETRIES
     )
 
     # 쿼리가 없는 경우
     if not generated_query:
         logger.warning("검증할 쿼리 없음")
         return {
-            "validation": update_validation(state, is_query_valid=False, validation_errors=["쿼리가 생성되지 않았습니다."]),
+            "validation": update_validation(
+                state,
+                is_query_valid=False,
+                validation_errors=["쿼리가 생성되지 않았습니다."],
+            ),
         }
 
-    try:
-        # 스키마 가져오기
-        schema = await get_database_schema()
+    # 같은 세션에서 방금 통과한 쿼리와 동일하면 (DB 오류 후 재시도 등) 검증 생략
+    query_hash = _session_query_hash(state, generated_query)
+    validation = state["validation"]
+    if (
+        validation.get("last_valid_query_hash") == query_hash
+        and time.time() - validation.get("last_valid_at", 0.0) < VALIDATION_CACHE_TTL_SECONDS
+    ):
+        logger.debug("직전에 통과한 쿼리와 동일하여 검증 생략")
+        return {
+            "validation": update_validation(state, is_query_valid=True, validation_errors=[]),
+        }
 
-        # LLM 가져오기 (시맨틱 검증용)
-        # 빠른 모델 사용, state에서 선택한 provider 사용
-        llm_provider = state["input"]["llm_provider"]
-        llm = get_llm(provider_type=llm_provider, use_fast_model=True)
-
-        # 검증 파이프라인 실행
-        result = await validate_query_pipeline(
-            query=generated_query,
-            schema=schema,
-            llm=llm,
-            skip_semantic=False,
-        )
+    try:
+        # 키워드 검증은 스키마가 필요 없으므로 먼저 수행 (차단 시 스키마 조회/LLM 생략)
+        result = await _check_keywords(generated_query)
+        if result is None:
+            result = await _validate_with_schema(state, generated_query)
 
         if result.is_valid:
             # 권한 검증: accessible_tables에 포함되지 않은 테이블 참조 차단
             accessible_tables = state["auth"]["accessible_tables"]
             if accessible_tables:
-                from app.auth.permissions import extract_tables_from_query
-
                 referenced_tables = extract_tables_from_query(generated_query)
-                accessible_lower = [t.lower() for t in accessible_tables]
+                accessible_lower = get_accessible_tables_lower(state)
                 unauthorized = [
                     t for t in referenced_tables if t.lower() not in accessible_lower
                 ]
                 if unauthorized:
-                    logger.warning(f"권한 없는 테이블 접근 시도: {unauthorized}")
+                    logger.warning("권한 없는 테이블 접근 시도: %s", unauthorized)
                     return {
-                        "validation": update_validation(state, is_query_valid=False, validation_errors=[f"접근 권한이 없는 테이블이 포함되어 있습니다: {', '.join(unauthorized)}"]),
+                        "validation": update_validation(
+                            state,
+                            is_query_valid=False,
+                            validation_errors=[
+                                "접근 권한이 없는 테이블이 포함되어 있습니다: "
+                                f"{', '.join(unauthorized)}"
+                            ],
+                        ),
                     }
 
             return {
-                "validation": update_validation(state, is_query_valid=True, validation_errors=[]),
+                "validation": update_validation(
+                    state,
+                    is_query_valid=True,
+                    validation_errors=[],
+                    last_valid_query_hash=query_hash,
+                    last_valid_at=time.time(),
+                ),
             }
         else:
             # 검증 실패
@@ -236,34 +481,50 @@ async def query_validation_node(
                 elif result.blocked_at_layer == "schema":
                     error_messages.append(
                         f"힌트: 유효한 테이블과 컬럼을 사용하세요. "
-                        f"오류: {result.details}"
+                        f"오류: {result.details.get('summary', '')}"
                     )
                 elif result.blocked_at_layer == "semantic":
                     error_messages.append("힌트: 더 간단하고 명확한 쿼리를 생성하세요.")
 
             return {
-                "validation": update_validation(state, is_query_valid=False, validation_errors=error_messages),
+                "validation": update_validation(
+                    state,
+                    is_query_valid=False,
+                    validation_errors=error_messages,
+                ),
                 "generation": update_generation(state, generation_attempt=generation_attempt + 1),
             }
 
     except DangerousQueryError as e:
-        logger.warning(f"위험한 쿼리 감지: {e}")
+        logger.warning("위험한 쿼리 감지: %s", e)
         return {
-            "validation": update_validation(state, is_query_valid=False, validation_errors=[e.user_message]),
+            "validation": update_validation(
+                state,
+                is_query_valid=False,
+                validation_errors=[e.user_message],
+            ),
             "execution": update_execution(state, execution_error=e.user_message),
         }
 
     except QueryValidationError as e:
-        logger.warning(f"쿼리 검증 오류: {e}")
+        logger.warning("쿼리 검증 오류: %s", e)
         return {
-            "validation": update_validation(state, is_query_valid=False, validation_errors=[e.user_message]),
+            "validation": update_validation(
+                state,
+                is_query_valid=False,
+                validation_errors=[e.user_message],
+            ),
             "generation": update_generation(state, generation_attempt=generation_attempt + 1),
         }
 
     except Exception as e:
-        logger.error(f"쿼리 검증 중 예외 발생: {e}", exc_info=True)
+        logger.error("쿼리 검증 중 예외 발생: %s", e, exc_info=True)
         return {
-            "validation": update_validation(state, is_query_valid=False, validation_errors=["쿼리 검증 중 문제가 발생했습니다. 다시 시도해주세요."]),
+            "validation": update_validation(
+                state,
+                is_query_valid=False,
+                validation_errors=["쿼리 검증 중 문제가 발생했습니다. 다시 시도해주세요."],
+            ),
             "generation": update_generation(state, generation_attempt=generation_attempt + 1),
         }
 
@@ -285,7 +546,7 @@ def should_retry_generation(state: Text2SQLAgentState) -> bool:
         return False
 
     if attempt >= MAX_VALIDATION_RETRIES:
-        logger.warning(f"최대 재시도 횟수({MAX_VALIDATION_RETRIES}) 도달")
+        logger.warning("최대 재시도 횟수(%d) 도달", MAX_VALIDATION_RETRIES)
         return False
 
     return True
@@ -5,6 +5,10 @@
 """
 
 import logging
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from operator import itemgetter
+from typing import TypeVar, cast
 
 from app.agent.decorators import with_debug_timing
 from app.agent.state import Text2SQLAgentState, update_response
@@ -17,6 +21,11 @@ from app.errors.messages import (
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# 마크다운 테이블 파이프 문자 이스케이프 변환 테이블
+_PIPE_TABLE = str.maketrans({"|": "\\|"})
+
 
 @with_debug_timing("response_formatting")
 async def response_formatting_node(state: Text2SQLAgentState) -> dict[str, object]:
@@ -31,19 +40,21 @@ async def response_formatting_node(state: Text2SQLAgentState) -> dict[str, objec
     Returns:
         업데이트할 상태 딕셔너리
     """
-    # Nested 구조에서 값 추출 (방어적 접근)
-    response_format = state["response"].get("response_format", "table")
+    # Nested 구조에서 값 추출 (방어적 접근, 자주 쓰는 컨텍스트는 한 번만 조회)
+    response = state["response"]
+    execution = state["execution"]
+    response_format = response.get("response_format", "table")
 
     logger.info(f"응답 포맷팅 - 형식: {response_format}")
 
     # 사용자가 취소한 경우
-    if state["response"].get("user_approved") is False:
+    if response.get("user_approved") is False:
         return {
             "response": update_response(state, final_response=_format_cancelled_response(), response_format="summary"),
         }
 
     # 에러 응답
-    execution_error = state["execution"].get("execution_error")
+    execution_error = execution.get("execution_error")
     if response_format == "error" or execution_error:
         validation_errors = state["validation"].get("validation_errors", [])
         user_question = state["input"]["user_question"]
@@ -62,14 +73,14 @@ async def response_formatting_node(state: Text2SQLAgentState) -> dict[str, objec
 
     # 일반/요약 응답이 이미 존재하고 에러가 없는 경우 (일반 대화)
     # 이미 general_response_node에서 final_response를 설정했으므로 그대로 반환
-    final_response = state["response"].get("final_response")
+    final_response = response.get("final_response")
     if response_format == "summary" and final_response:
         return {
-            "response": state["response"],  # 변경 없이 그대로 리턴
+            "response": response,  # 변경 없이 그대로 리턴
         }
 
     # 빈 결과 응답
-    total_count = state["execution"].get("total_row_count", 0)
+    total_count = execution.get("total_row_count", 0)
     if total_count == 0:
         user_question = state["input"]["user_question"]
         generated_query = state["generation"]["generated_query"]
@@ -85,10 +96,15 @@ async def response_formatting_node(state: Text2SQLAgentState) -> dict[str, objec
         }
 
     # 테이블 형식 응답
-    rows = state["execution"].get("query_result", [])
-    raw_columns = state["execution"].get("result_columns", [])
+    rows = execution.get("query_result", [])
+    raw_columns = execution.get("result_columns", [])
     columns = [col["name"] if isinstance(col, dict) else col for col in (raw_columns or [])]
-    execution_time = state["execution"].get("execution_time_ms", 0)
+    execution_time = execution.get("execution_time_ms", 0)
+
+    # 자동 추가된 LIMIT에 걸려 결과가 잘린 경우 (행 수는 실행 노드에서 이미 최대 행 수로 맞춤)
+    row_limit = None
+    if execution.get("limit_injected") and execution.get("is_truncated"):
+        row_limit = total_count
 
     return {
         "response": update_response(
@@ -98,6 +114,7 @@ async def response_formatting_node(state: Text2SQLAgentState) -> dict[str, objec
                 columns=columns,
                 total_count=total_count,
                 execution_time=execution_time,
+                row_limit=row_limit,
             ),
             response_format="table",
         ),
@@ -184,12 +201,15 @@ def _format_table_response(
     columns: list[str],
     total_count: int,
     execution_time: int,
+    row_limit: int | None = None,
 ) -> str:
     """테이블 형식 응답 포맷팅"""
     # 결과 요약
     summary = (
         f"조회 완료! {total_count:,}건의 데이터를 찾았습니다. ({execution_time}ms)"
     )
+    if row_limit is not None:
+        summary += f"\n결과가 {row_limit:,}건으로 제한되었습니다."
 
     # 마크다운 테이블 생성 (최대 10행만 미리보기)
     preview_rows = rows[:10]
@@ -201,15 +221,16 @@ def _format_table_response(
     if not columns:
         return summary
 
-    # 테이블 헤더
-    header = "| " + " | ".join(columns) + " |"
-    separator = "|" + "|".join(["---"] * len(columns)) + "|"
+    # 테이블 헤더 (같은 컬럼 구성이면 캐시된 문자열 재사용)
+    header, separator = _table_header(tuple(columns))
 
-    # 테이블 행
-    table_rows = []
-    for row in preview_rows:
-        values = [_format_cell_value(row.get(col, "")) for col in columns]
-        table_rows.append("| " + " | ".join(values) + " |")
+    # 테이블 행 (행별 값 튜플을 한 번에 추출하고 컬럼별 포맷터를 한 번만 선택)
+    row_values = _extract_row_values(preview_rows, columns)
+    formatters = [_column_formatter(values) for values in zip(*row_values, strict=True)]
+    table_rows = [
+        "| " + " | ".join([fmt(v) for fmt, v in zip(formatters, values, strict=True)]) + " |"
+        for values in row_values
+    ]
 
     table = "\n".join([header, separator] + table_rows)
 
@@ -221,26 +242,102 @@ def _format_table_response(
     return f"{summary}\n\n{table}"
 
 
+@lru_cache(maxsize=256)
+def _table_header(columns: tuple[str, ...]) -> tuple[str, str]:
+    """마크다운 테이블 헤더와 구분선 생성"""
+    header = "| " + " | ".join(columns) + " |"
+    separator = "|" + "|".join(["---"] * len(columns)) + "|"
+    return header, separator
+
+
+def _format_bool(value: bool) -> str:
+    """불리언 셀 포맷팅"""
+    return "예" if value else "아니오"
+
+
+def _format_float(value: float) -> str:
+    """실수 셀 포맷팅 (큰 숫자는 천 단위 구분)"""
+    if abs(value) >= 1000:
+        return f"{value:,.2f}"
+    return f"{value:.2f}"
+
+
+def _format_int(value: int) -> str:
+    """정수 셀 포맷팅 (큰 숫자는 천 단위 구분)"""
+    if abs(value) >= 1000:
+        return f"{value:,}"
+    return str(value)
+
+
+def _format_text(value: object) -> str:
+    """문자열 셀 포맷팅"""
+    str_value = str(value)
+    # 너무 긴 문자열은 자르기
+    if len(str_value) > 50:
+        return str_value[:47] + "..."
+    # 파이프 문자 이스케이프 (마크다운 테이블 호환)
+    return str_value.translate(_PIPE_TABLE)
+
+
 def _format_cell_value(value: object) -> str:
     """셀 값 포맷팅"""
     if value is None:
         return "-"
     if isinstance(value, bool):
-        return "예" if value else "아니오"
+        return _format_bool(value)
     if isinstance(value, float):
-        # 큰 숫자는 천 단위 구분
-        if abs(value) >= 1000:
-            return f"{value:,.2f}"
-        return f"{value:.2f}"
+        return _format_float(value)
     if isinstance(value, int):
-        if abs(value) >= 1000:
-            return f"{value:,}"
-        return str(value)
+        return _format_int(value)
+    return _format_text(value)
 
-    # 문자열 처리
-    str_value = str(value)
-    # 너무 긴 문자열은 자르기
-    if len(str_value) > 50:
-        return str_value[:47] + "..."
-    # 파이프 문자 이스케이프 (마크다운 테이블 호환)
-    return str_value.replace("|", "\\|")
+
+def _typed_formatter(
+    expected_type: type[_T], format_value: Callable[[_T], str]
+) -> Callable[[object], str]:
+    """예상 타입이면 전용 포맷터를, 아니면(None 등) 일반 포맷터를 사용하는 셀 포맷터 생성"""
+
+    def formatter(value: object) -> str:
+        # 정확한 타입 비교 (bool은 int의 하위 타입이므로 isinstance를 쓰지 않음)
+        if type(value) is expected_type:
+            return format_value(cast("_T", value))
+        return _format_cell_value(value)
+
+    return formatter
+
+
+# 값 타입별 컬럼 포맷터
+_COLUMN_FORMATTERS: dict[type, Callable[[object], str]] = {
+    bool: _typed_formatter(bool, _format_bool),
+    float: _typed_formatter(float, _format_float),
+    int: _typed_formatter(int, _format_int),
+    str: _typed_formatter(str, _format_text),
+}
+
+
+def _extract_row_values(
+    rows: list[dict[str, object]], columns: list[str]
+) -> list[tuple[object, ...]]:
+    """
+    행별 컬럼 값 튜플 추출
+
+    itemgetter로 행마다 한 번에 추출하고, 컬럼이 빠진 행이 있으면 빈 문자열로 채웁니다.
+    """
+    getter = itemgetter(*columns)
+    try:
+        values = [getter(row) for row in rows]
+    except KeyError:
+        return [tuple([row.get(col, "") for col in columns]) for row in rows]
+
+    # 컬럼이 하나면 itemgetter가 튜플이 아닌 값 자체를 반환
+    if len(columns) == 1:
+        return [(value,) for value in values]
+    return values
+
+
+def _column_formatter(values: Iterable[object]) -> Callable[[object], str]:
+    """컬럼의 첫 번째 non-null 값 타입에 맞는 셀 포맷터 선택"""
+    for value in values:
+        if value is not None:
+            return _COLUMN_FORMATTERS.get(type(value), _format_cell_value)
+    return _format_cell_value
@@ -8,16 +8,31 @@
 import logging
 
 from app.agent.decorators import with_debug_timing
-from app.agent.state import Text2SQLAgentState, update_execution, update_schema
+from app.agent.state import (
+    Text2SQLAgentState,
+    get_accessible_tables_lower,
+    update_execution,
+    update_schema,
+)
 from app.database.schema import format_schema_for_llm, get_database_schema
 from app.models.entities import DatabaseSchema
+from app.utils.cache import SchemaScopedCache
 
 logger = logging.getLogger(__name__)
 
+# 스키마 페이로드 캐시 (스키마 객체별로 유지)
+# 접근 가능 테이블 집합 → (LLM용 스키마 문자열, 테이블 목록)
+# 키가 None이면 권한 필터가 없는 전체 스키마를 의미
+_PAYLOAD_CACHE_MAX_SIZE = 128
+_payload_cache: SchemaScopedCache[frozenset[str] | None, tuple[str, tuple[str, ...]]] = (
+    SchemaScopedCache(max_size=_PAYLOAD_CACHE_MAX_SIZE)
+)
+
 
 def filter_schema_by_accessible_tables(
     schema: DatabaseSchema,
     accessible_tables: list[str],
+    accessible_lower: frozenset[str] | None = None,
 ) -> DatabaseSchema:
     """
     접근 가능한 테이블만 포함하도록 스키마 필터링
@@ -25,6 +40,7 @@ def filter_schema_by_accessible_tables(
     Args:
         schema: 전체 데이터베이스 스키마
         accessible_tables: 접근 가능한 테이블 목록
+        accessible_lower: 미리 소문자로 변환된 접근 가능 테이블 집합 (auth 컨텍스트에서 제공)
 
     Returns:
         필터링된 스키마
@@ -33,11 +49,11 @@ def filter_schema_by_accessible_tables(
         # 접근 가능한 테이블이 없으면 빈 스키마 반환
         return DatabaseSchema(tables=[], last_updated_at=schema.last_updated_at)
 
-    # 접근 가능한 테이블만 필터링
+    # 접근 가능한 테이블만 필터링 (소문자 집합은 한 번만 구성)
+    if accessible_lower is None:
+        accessible_lower = frozenset(t.lower() for t in accessible_tables)
     filtered_tables = [
-        table
-        for table in schema.tables
-        if table.name.lower() in [t.lower() for t in accessible_tables]
+        table for table in schema.tables if table.name.lower() in accessible_lower
     ]
 
     return DatabaseSchema(
@@ -45,6 +61,30 @@ def filter_schema_by_accessible_tables(
     )
 
 
+def _get_schema_payload(
+    schema: DatabaseSchema,
+    accessible_tables: list[str],
+    accessible_lower: frozenset[str] | None,
+) -> tuple[str, tuple[str, ...]]:
+    """
+    필터링된 스키마의 LLM용 문자열과 테이블 목록 반환 (캐시 사용)
+
+    권한 범위별 결과는 같은 스키마 객체 동안 재사용하고,
+    스키마가 새로 조회되면(객체가 바뀌면) 캐시를 비우고 다시 생성합니다.
+    """
+
+    def build() -> tuple[str, tuple[str, ...]]:
+        scoped = (
+            filter_schema_by_accessible_tables(schema, accessible_tables, accessible_lower)
+            if accessible_tables
+            else schema
+        )
+        return format_schema_for_llm(scoped), tuple(table.name for table in scoped.tables)
+
+    key = accessible_lower if accessible_tables else None
+    return _payload_cache.get_or_build(schema, key, build)
+
+
 @with_debug_timing("schema_retrieval")
 async def schema_retrieval_node(state: Text2SQLAgentState) -> dict[str, object]:
     """
@@ -66,32 +106,32 @@ async def schema_retrieval_node(state: Text2SQLAgentState) -> dict[str, object]:
         # 스키마 조회 (캐시 사용)
         schema = await get_database_schema()
 
-        # 사용자 권한에 따라 스키마 필터링
+        # 사용자 권한에 따라 스키마 필터링 후 LLM 프롬프트용 문자열로 변환 (권한 범위별 캐시)
         accessible_tables = state["auth"]["accessible_tables"]
+        schema_str, table_names = _get_schema_payload(
+            schema,
+            accessible_tables,
+            get_accessible_tables_lower(state) if accessible_tables else None,
+        )
         if accessible_tables:
-            schema = filter_schema_by_accessible_tables(schema, accessible_tables)
             logger.info(
                 f"권한에 따라 스키마 필터링 - 접근 가능: {len(accessible_tables)}개 테이블"
             )
 
         # 필터링 후 접근 가능한 테이블이 없으면 즉시 에러 반환
-        if accessible_tables and len(schema.tables) == 0:
+        if accessible_tables and not table_names:
             logger.warning("접근 가능한 테이블이 없음 - 권한 부족")
             return {
                 "schema": update_schema(state, database_schema="", relevant_tables=[]),
                 "execution": update_execution(state, execution_error="접근 권한이 없습니다. 요청하신 데이터에 대한 조회 권한이 부여되지 않았습니다."),
             }
 
-        # LLM 프롬프트용 문자열로 변환
-        schema_str = format_schema_for_llm(schema)
-
-        # 테이블 목록 추출
-        table_names = [table.name for table in schema.tables]
-
         logger.info(f"스키마 조회 완료 - {len(table_names)}개 테이블")
 
         return {
-            "schema": update_schema(state, database_schema=schema_str, relevant_tables=table_names),
+            "schema": update_schema(
+                state, database_schema=schema_str, relevant_tables=list(table_names)
+            ),
         }
 
     except Exception as e:
@@ -6,6 +6,7 @@ Human-in-the-Loop: LangGraph의 interrupt()를 사용하여
 """
 
 import logging
+from functools import lru_cache
 from typing import Literal
 
 from langgraph.types import interrupt
@@ -16,6 +17,46 @@ from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# 확인 요청의 고정 부분 (호출마다 쿼리 정보만 채움, 공유 객체이므로 변경 금지)
+_CONFIRMATION_TEMPLATE: dict[str, object] = {
+    "type": "query_confirmation",
+    "message": "다음 쿼리를 실행할까요?",
+    "options": {
+        "approve": "실행",
+        "reject": "취소",
+        "modify": "수정",
+    },
+}
+
+
+def _parse_dict_response(response: dict[str, object]) -> tuple[object, object]:
+    """dict 응답 파싱 (Command(resume=...)로 전달된 JSON 객체)"""
+    return response.get("approved", False), response.get("modified_query")
+
+
+def _parse_bool_response(response: bool) -> tuple[object, object]:
+    """bool 응답 파싱 (단순 승인/거부)"""
+    return response, None
+
+
+def _parse_unknown_response(response: object) -> tuple[object, object]:
+    """예상치 못한 응답 타입은 거부로 처리"""
+    logger.warning("예상치 못한 응답 타입: %s", type(response))
+    return False, None
+
+
+# 응답 타입별 파서 (정확한 타입으로 조회하므로 1/0 같은 int는 bool로 취급하지 않음)
+_RESPONSE_PARSERS = {
+    dict: _parse_dict_response,
+    bool: _parse_bool_response,
+}
+
+
+@lru_cache(maxsize=1)
+def _auto_confirm() -> bool:
+    """자동 확인 모드 여부 (설정은 기동 후 바뀌지 않으므로 한 번만 읽음)"""
+    return get_settings().auto_confirm_queries
+
 
 @with_debug_timing("user_confirmation")
 async def user_confirmation_node(
@@ -34,41 +75,34 @@ async def user_confirmation_node(
     Returns:
         업데이트할 상태 딕셔너리
     """
-    settings = get_settings()
-
     # 자동 확인 모드인 경우 바로 승인
-    if settings.auto_confirm_queries:
+    if _auto_confirm():
         logger.info("자동 확인 모드: 쿼리 자동 승인")
         return {
             "response": update_response(state, user_approved=True),
         }
 
     # Nested 구조에서 값 추출
-    generated_query = state["generation"]["generated_query"]
-    query_explanation = state["generation"]["query_explanation"]
-    query_id = state["generation"]["query_id"]
+    generation = state["generation"]
+    generated_query = generation["generated_query"]
+    query_explanation = generation["query_explanation"]
+    query_id = generation["query_id"]
 
-    logger.info(f"사용자 확인 요청 - 쿼리 ID: {query_id}")
+    logger.info("사용자 확인 요청 - 쿼리 ID: %s", query_id)
 
     # 확인 요청 정보 구성
     confirmation_request = {
-        "type": "query_confirmation",
+        **_CONFIRMATION_TEMPLATE,
         "query_id": query_id,
         "query": generated_query,
         "explanation": query_explanation,
-        "message": "다음 쿼리를 실행할까요?",
-        "options": {
-            "approve": "실행",
-            "reject": "취소",
-            "modify": "수정",
-        },
     }
 
     # interrupt()를 호출하여 워크플로우 일시 중지
     # Command(resume=...)로 재개될 때까지 대기
     user_response = interrupt(confirmation_request)
 
-    logger.info(f"사용자 응답 수신: {user_response}")
+    logger.info("사용자 응답 수신: %s", user_response)
 
     # 사용자 응답 처리
     return handle_user_response(state, user_response)
@@ -88,17 +122,9 @@ def handle_user_response(
     Returns:
         업데이트할 상태 딕셔너리
     """
-    # bool 타입 응답 처리 (단순 승인/거부)
-    if isinstance(response, bool):
-        approved = response
-        modified_query = None
-    elif isinstance(response, dict):
-        approved = response.get("approved", False)
-        modified_query = response.get("modified_query")
-    else:
-        logger.warning(f"예상치 못한 응답 타입: {type(response)}")
-        approved = False
-        modified_query = None
+    approved, modified_query = _RESPONSE_PARSERS.get(
+        type(response), _parse_unknown_response
+    )(response)
 
     if approved:
         logger.info("사용자가 쿼리 실행을 승인함")
@@ -108,7 +134,7 @@ def handle_user_response(
 
         # 수정된 쿼리가 있으면 업데이트
         if modified_query:
-            logger.info(f"수정된 쿼리로 변경: {modified_query[:50]}...")
+            logger.info("수정된 쿼리로 변경: %.50s...", modified_query)
             result["generation"] = update_generation(state, generated_query=modified_query)
             # 수정된 쿼리는 재검증 필요
             result["validation"] = update_validation(state, is_query_valid=False)
@@ -132,21 +158,12 @@ def should_wait_for_confirmation(state: Text2SQLAgentState) -> bool:
     Returns:
         확인 필요 여부
     """
-    settings = get_settings()
-
-    # 자동 확인 모드면 대기 불필요
-    if settings.auto_confirm_queries:
-        return False
-
-    # 이미 승인/거부된 경우
-    if state["response"]["user_approved"] is not None:
-        return False
-
-    # 쿼리가 유효하지 않으면 확인 불필요
-    if not state["validation"]["is_query_valid"]:
-        return False
-
-    return True
+    # 유효한 쿼리 → 아직 승인/거부되지 않음 → 자동 확인 모드 아님 순으로 단락 평가
+    return (
+        state["validation"]["is_query_valid"]
+        and state["response"]["user_approved"] is None
+        and not _auto_confirm()
+    )
 
 
 def get_confirmation_status(
@@ -161,9 +178,7 @@ def get_confirmation_status(
     Returns:
         확인 상태
     """
-    settings = get_settings()
-
-    if settings.auto_confirm_queries:
+    if _auto_confirm():
         return "not_required"
 
     user_approved = state["response"]["user_approved"]
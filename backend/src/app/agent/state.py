@@ -5,11 +5,15 @@ Text2SQL 워크플로우에서 사용하는 상태를 Nested TypedDict로 정의
 논리적 그룹화를 통해 노드별 책임을 명확히 하고 디버깅을 용이하게 합니다.
 """
 
+import uuid
+from functools import lru_cache
 from typing import Annotated, Literal, TypedDict
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
+_uuid4 = uuid.uuid4
+
 
 # === Nested Context TypedDicts ===
 
@@ -42,6 +46,9 @@ class AuthContext(TypedDict):
     accessible_tables: list[str]
     """사용자 권한에 따라 접근 가능한 테이블 목록"""
 
+    accessible_tables_lower: frozenset[str]
+    """소문자로 정규화된 접근 가능 테이블 집합 (권한 비교용)"""
+
 
 class SchemaContext(TypedDict):
     """스키마 컨텍스트 - 데이터베이스 스키마 정보"""
@@ -78,6 +85,12 @@ class ValidationResult(TypedDict):
     is_query_valid: bool
     """쿼리 유효성 여부"""
 
+    last_valid_query_hash: str
+    """마지막으로 검증을 통과한 쿼리 해시 (권한 범위 포함, 없으면 빈 문자열)"""
+
+    last_valid_at: float
+    """마지막 검증 통과 시각 (Unix timestamp)"""
+
 
 class ExecutionResult(TypedDict):
     """실행 결과 - 쿼리 실행 결과"""
@@ -97,6 +110,12 @@ class ExecutionResult(TypedDict):
     execution_error: str | None
     """실행 오류 메시지"""
 
+    limit_injected: bool
+    """실행 전 LIMIT 절이 자동으로 추가되었는지 여부"""
+
+    is_truncated: bool
+    """결과가 최대 행 수로 잘렸는지 여부"""
+
 
 class ResponseOutput(TypedDict):
     """응답 출력 - 최종 응답 정보"""
@@ -181,6 +200,42 @@ class DebugContext(TypedDict):
     """재시도 히스토리"""
 
 
+def merge_debug_context(current: DebugContext | None, update: DebugContext | None) -> DebugContext:
+    """
+    debug 채널 리듀서
+
+    노드는 새로 추가할 항목만 담은 부분 업데이트(delta)를 반환하고,
+    리스트 필드(node_timings, error_chain, retry_history)는 여기서 기존 값에 이어 붙입니다.
+    trace_id가 포함된 업데이트는 새 요청의 초기 컨텍스트이므로 전체를 교체합니다.
+    """
+    if not update:
+        return current  # type: ignore[return-value]
+    if not current or "trace_id" in update:
+        return update
+
+    return DebugContext(
+        trace_id=current.get("trace_id", ""),
+        node_timings=_concat_entries(current.get("node_timings"), update.get("node_timings")),
+        error_chain=_concat_entries(current.get("error_chain"), update.get("error_chain")),
+        current_node=update.get("current_node", current.get("current_node", "")),
+        retry_history=_concat_entries(current.get("retry_history"), update.get("retry_history")),
+    )
+
+
+def _concat_entries(existing: list | None, new: list | None) -> list:
+    """
+    리듀서용 목록 연결
+
+    새 항목이 없으면 기존 목록 객체를 그대로 재사용하여
+    노드마다 비어 있는 필드의 목록이 새로 할당되지 않도록 합니다.
+    """
+    if not new:
+        return existing if existing is not None else []
+    if not existing:
+        return list(new)
+    return [*existing, *new]
+
+
 # === Main Agent State ===
 
 
@@ -209,8 +264,8 @@ class Text2SQLAgentState(TypedDict):
     response: ResponseOutput
     """응답 출력"""
 
-    debug: DebugContext
-    """디버그 컨텍스트"""
+    debug: Annotated[DebugContext, merge_debug_context]
+    """디버그 컨텍스트 (merge_debug_context 리듀서로 항목 누적)"""
 
     # 대화 컨텍스트 (add_messages 리듀서 필요로 최상위 유지)
     messages: Annotated[list[BaseMessage], add_messages]
@@ -220,74 +275,37 @@ class Text2SQLAgentState(TypedDict):
 # === State Update Helpers ===
 # LangGraph의 Nested TypedDict는 deep merge가 아닌 replace(전체 교체) 방식으로 동작합니다.
 # 아래 헬퍼 함수들은 현재 상태 값을 유지하면서 특정 필드만 안전하게 업데이트합니다.
+# 빠진 필드의 기본값은 create_initial_*로 호출마다 새로 만들어 기본 리스트를 공유하지 않습니다.
 
 
 def update_execution(state: "Text2SQLAgentState", **overrides) -> ExecutionResult:
     """execution 컨텍스트의 현재 값을 유지하면서 특정 필드만 업데이트"""
-    current = state.get("execution", {})
-    return {
-        "query_result": current.get("query_result", []),
-        "result_columns": current.get("result_columns", []),
-        "total_row_count": current.get("total_row_count", 0),
-        "execution_time_ms": current.get("execution_time_ms", 0),
-        "execution_error": current.get("execution_error", None),
-        **overrides,
-    }
+    return {**create_initial_execution(), **state.get("execution", {}), **overrides}
 
 
 def update_input(state: "Text2SQLAgentState", **overrides) -> InputContext:
     """input 컨텍스트의 현재 값을 유지하면서 특정 필드만 업데이트"""
-    current = state.get("input", {})
-    return {
-        "user_question": current.get("user_question", ""),
-        "session_id": current.get("session_id", ""),
-        "llm_provider": current.get("llm_provider", "openai"),
-        "intent": current.get("intent", None),
-        **overrides,
-    }
+    return {**create_initial_input("", ""), **state.get("input", {}), **overrides}
 
 
 def update_response(state: "Text2SQLAgentState", **overrides) -> ResponseOutput:
     """response 컨텍스트의 현재 값을 유지하면서 특정 필드만 업데이트"""
-    current = state.get("response", {})
-    return {
-        "user_approved": current.get("user_approved", None),
-        "final_response": current.get("final_response", ""),
-        "response_format": current.get("response_format", "table"),
-        **overrides,
-    }
+    return {**create_initial_response(), **state.get("response", {}), **overrides}
 
 
 def update_generation(state: "Text2SQLAgentState", **overrides) -> QueryGeneration:
     """generation 컨텍스트의 현재 값을 유지하면서 특정 필드만 업데이트"""
-    current = state.get("generation", {})
-    return {
-        "generated_query": current.get("generated_query", ""),
-        "query_explanation": current.get("query_explanation", ""),
-        "generation_attempt": current.get("generation_attempt", 0),
-        "query_id": current.get("query_id", ""),
-        **overrides,
-    }
+    return {**create_initial_generation(), **state.get("generation", {}), **overrides}
 
 
 def update_validation(state: "Text2SQLAgentState", **overrides) -> ValidationResult:
     """validation 컨텍스트의 현재 값을 유지하면서 특정 필드만 업데이트"""
-    current = state.get("validation", {})
-    return {
-        "validation_errors": current.get("validation_errors", []),
-        "is_query_valid": current.get("is_query_valid", False),
-        **overrides,
-    }
+    return {**create_initial_validation(), **state.get("validation", {}), **overrides}
 
 
 def update_schema(state: "Text2SQLAgentState", **overrides) -> SchemaContext:
     """schema 컨텍스트의 현재 값을 유지하면서 특정 필드만 업데이트"""
-    current = state.get("schema", {})
-    return {
-        "database_schema": current.get("database_schema", ""),
-        "relevant_tables": current.get("relevant_tables", []),
-        **overrides,
-    }
+    return {**create_initial_schema(), **state.get("schema", {}), **overrides}
 
 
 # === Helper Functions ===
@@ -314,10 +332,12 @@ def create_initial_auth(
     accessible_tables: list[str] | None = None,
 ) -> AuthContext:
     """초기 인증 컨텍스트 생성"""
+    accessible_tables = accessible_tables or []
     return AuthContext(
         user_id=user_id,
         user_roles=user_roles or [],
-        accessible_tables=accessible_tables or [],
+        accessible_tables=accessible_tables,
+        accessible_tables_lower=_lowercase_tables(tuple(accessible_tables)),
     )
 
 
@@ -344,6 +364,8 @@ def create_initial_validation() -> ValidationResult:
     return ValidationResult(
         validation_errors=[],
         is_query_valid=False,
+        last_valid_query_hash="",
+        last_valid_at=0.0,
     )
 
 
@@ -355,6 +377,8 @@ def create_initial_execution() -> ExecutionResult:
         total_row_count=0,
         execution_time_ms=0,
         execution_error=None,
+        limit_injected=False,
+        is_truncated=False,
     )
 
 
@@ -369,10 +393,8 @@ def create_initial_response() -> ResponseOutput:
 
 def create_initial_debug(trace_id: str = "") -> DebugContext:
     """초기 디버그 컨텍스트 생성"""
-    import uuid
-
     return DebugContext(
-        trace_id=trace_id or str(uuid.uuid4()),
+        trace_id=trace_id or str(_uuid4()),
         node_timings=[],
         error_chain=[],
         current_node="",
@@ -438,6 +460,25 @@ def get_accessible_tables(state: Text2SQLAgentState) -> list[str]:
     return state["auth"]["accessible_tables"]
 
 
+def get_accessible_tables_lower(state: Text2SQLAgentState) -> frozenset[str]:
+    """
+    소문자 accessible_tables 집합 접근 헬퍼
+
+    상태에 미리 계산된 값이 없으면(이전 체크포인트 등) 캐시를 통해 계산합니다.
+    """
+    auth = state["auth"]
+    accessible_lower = auth.get("accessible_tables_lower")
+    if accessible_lower is None:
+        accessible_lower = _lowercase_tables(tuple(auth["accessible_tables"]))
+    return accessible_lower
+
+
+@lru_cache(maxsize=32)
+def _lowercase_tables(tables: tuple[str, ...]) -> frozenset[str]:
+    """테이블 이름 목록을 소문자 집합으로 변환 (권한 조합별 캐시)"""
+    return frozenset(t.lower() for t in tables)
+
+
 def get_database_schema(state: Text2SQLAgentState) -> str:
     """database_schema 접근 헬퍼"""
     return state["schema"]["database_schema"]
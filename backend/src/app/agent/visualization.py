@@ -5,13 +5,29 @@ LangGraph 시각화 유틸리티
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 
+from langchain_core.runnables.graph import Graph
+from langgraph.graph import StateGraph
+
 from app.agent.graph import build_graph
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_compiled() -> StateGraph:
+    """시각화용 컴파일된 그래프 (체크포인터 없이 한 번만 빌드)"""
+    return build_graph().compile()
+
+
+@lru_cache(maxsize=1)
+def _get_drawable_graph() -> Graph:
+    """Mermaid/PNG 렌더러가 공유하는 그래프 구조 객체"""
+    return _get_compiled().get_graph()
+
+
 def get_graph_mermaid() -> str:
     """
     그래프를 Mermaid 다이어그램 형식으로 반환
@@ -19,9 +35,7 @@ def get_graph_mermaid() -> str:
     Returns:
         Mermaid 다이어그램 문자열
     """
-    graph = build_graph()
-    compiled = graph.compile()
-    return compiled.get_graph().draw_mermaid()
+    return _get_drawable_graph().draw_mermaid()
 
 
 def get_graph_png() -> bytes:
@@ -31,9 +45,7 @@ def get_graph_png() -> bytes:
     Returns:
         PNG 이미지 바이트
     """
-    graph = build_graph()
-    compiled = graph.compile()
-    return compiled.get_graph().draw_mermaid_png()
+    return _get_drawable_graph().draw_mermaid_png()
 
 
 def save_graph_png(output_path: str | Path = "langgraph_structure.png") -> Path:
@@ -47,9 +59,9 @@ def save_graph_png(output_path: str | Path = "langgraph_structure.png") -> Path:
         저장된 파일 경로
     """
     output_path = Path(output_path)
-    png_data = get_graph_png()
-    output_path.write_bytes(png_data)
-    logger.info(f"그래프 이미지 저장: {output_path}")
+    # 렌더러가 파일에 직접 기록하도록 경로를 넘김 (반환 바이트를 다시 쓰지 않음)
+    _get_drawable_graph().draw_mermaid_png(output_file_path=str(output_path))
+    logger.info("그래프 이미지 저장: %s", output_path)
     return output_path
 
 
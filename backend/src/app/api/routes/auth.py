@@ -4,6 +4,7 @@
 회원가입, 로그인, 로그아웃, 토큰 갱신 기능을 제공합니다.
 """
 
+import asyncio
 import logging
 from typing import Annotated
 
@@ -27,6 +28,10 @@ from app.models.auth import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["인증"])
 
+# 존재하지 않는 이메일로 로그인할 때도 같은 bcrypt 비용을 치르기 위한 더미 해시
+# (응답 시간으로 가입 여부를 구분할 수 없도록 함)
+_DUMMY_PASSWORD_HASH = hash_password("dummy-password-for-timing")
+
 
 @router.post(
     "/register",
@@ -37,57 +42,49 @@ router = APIRouter(prefix="/auth", tags=["인증"])
 )
 async def register(request: RegisterRequest) -> UserResponse:
     """회원가입"""
-    async with get_connection() as conn:
-        # 이메일 중복 확인
-        existing = await conn.fetchrow(
-            "SELECT id FROM users WHERE email = $1",
-            request.email,
-        )
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="이미 등록된 이메일입니다",
-            )
+    # 비밀번호 해싱 (연결 획득 전에, 이벤트 루프를 막지 않도록 스레드에서 수행)
+    password_hash = await asyncio.to_thread(hash_password, request.password)
 
-        # 비밀번호 해싱
-        password_hash = hash_password(request.password)
-
-        # 사용자 생성
+    async with get_connection() as conn:
+        # 사용자 생성과 역할 할당을 한 번의 왕복으로 수행
+        # 이메일이 이미 있으면 ON CONFLICT로 아무것도 삽입하지 않고 빈 결과 반환
         user_row = await conn.fetchrow(
             """
-            INSERT INTO users (email, password_hash, name)
-            VALUES ($1, $2, $3)
-            RETURNING id, email, name, is_active, created_at
+            WITH new_user AS (
+                INSERT INTO users (email, password_hash, name)
+                VALUES ($1, $2, $3)
+                ON CONFLICT (email) DO NOTHING
+                RETURNING id, email, name, is_active, created_at
+            ), assigned_role AS (
+                INSERT INTO user_roles (user_id, role_id)
+                SELECT nu.id, r.id
+                FROM new_user nu
+                JOIN roles r ON r.name = $4
+            )
+            SELECT id, email, name, is_active, created_at FROM new_user
             """,
             request.email,
             password_hash,
             request.name,
+            request.role,
         )
 
-        user_id = user_row["id"]
-
-        # 요청된 역할 할당
-        selected_role = await conn.fetchrow(
-            "SELECT id FROM roles WHERE name = $1",
-            request.role,
+    if user_row is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 등록된 이메일입니다",
         )
-        if selected_role:
-            await conn.execute(
-                "INSERT INTO user_roles (user_id, role_id) VALUES ($1, $2)",
-                user_id,
-                selected_role["id"],
-            )
 
-        logger.info(f"새 사용자 등록: {request.email}, 역할: {request.role}")
+    logger.info("새 사용자 등록: %s, 역할: %s", request.email, request.role)
 
-        return UserResponse(
-            id=user_row["id"],
-            email=user_row["email"],
-            name=user_row["name"],
-            is_active=user_row["is_active"],
-            roles=[request.role],
-            created_at=user_row["created_at"],
-        )
+    return UserResponse(
+        id=user_row["id"],
+        email=user_row["email"],
+        name=user_row["name"],
+        is_active=user_row["is_active"],
+        roles=[request.role],
+        created_at=user_row["created_at"],
+    )
 
 
 @router.post(
@@ -101,49 +98,54 @@ async def login(request: LoginRequest, response: Response) -> TokenResponse:
     settings = get_settings()
 
     async with get_connection() as conn:
-        # 사용자 조회
+        # 사용자와 역할을 한 번의 왕복으로 조회
         user_row = await conn.fetchrow(
             """
-            SELECT id, email, password_hash, name, is_active
-            FROM users
-            WHERE email = $1
+            SELECT
+                u.id,
+                u.email,
+                u.password_hash,
+                u.name,
+                u.is_active,
+                COALESCE(
+                    array_agg(r.name) FILTER (WHERE r.name IS NOT NULL),
+                    ARRAY[]::varchar[]
+                ) as roles
+            FROM users u
+            LEFT JOIN user_roles ur ON u.id = ur.user_id
+            LEFT JOIN roles r ON ur.role_id = r.id
+            WHERE u.email = $1
+            GROUP BY u.id
             """,
             request.email,
         )
 
-        if not user_row:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="이메일 또는 비밀번호가 올바르지 않습니다",
-            )
-
-        # 비밀번호 확인
-        if not verify_password(request.password, user_row["password_hash"]):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="이메일 또는 비밀번호가 올바르지 않습니다",
-            )
-
-        # 계정 활성화 확인
-        if not user_row["is_active"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="비활성화된 계정입니다",
-            )
+    # 비밀번호 검증은 연결을 반환한 뒤 수행 (해싱 동안 풀 연결을 점유하지 않음)
+    if not user_row:
+        await asyncio.to_thread(verify_password, request.password, _DUMMY_PASSWORD_HASH)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="이메일 또는 비밀번호가 올바르지 않습니다",
+        )
 
-        user_id = user_row["id"]
+    # 비밀번호 확인 (bcrypt는 CPU 작업이므로 스레드에서 수행)
+    if not await asyncio.to_thread(
+        verify_password, request.password, user_row["password_hash"]
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="이메일 또는 비밀번호가 올바르지 않습니다",
+        )
 
-        # 역할 조회
-        role_rows = await conn.fetch(
-            """
-            SELECT r.name
-            FROM user_roles ur
-            JOIN roles r ON ur.role_id = r.id
-            WHERE ur.user_id = $1
-            """,
-            user_id,
+    # 계정 활성화 확인 (비밀번호 확인 뒤에 수행해야 비밀번호 없이 계정 상태가 노출되지 않음)
+    if not user_row["is_active"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="비활성화된 계정입니다",
         )
-        roles = [row["name"] for row in role_rows]
+
+    user_id = user_row["id"]
+    roles = list(user_row["roles"])
 
     # 토큰 생성
     token_data = {"sub": user_id, "roles": roles}
@@ -157,15 +159,15 @@ async def login(request: LoginRequest, response: Response) -> TokenResponse:
         httponly=True,
         secure=not settings.debug,  # HTTPS에서만 전송 (개발 환경 제외)
         samesite="lax",
-        max_age=settings.refresh_token_expire_days * 24 * 60 * 60,
+        max_age=settings.refresh_token_max_age,
     )
 
-    logger.info(f"사용자 로그인: {request.email}")
+    logger.info("사용자 로그인: %s", request.email)
 
     return TokenResponse(
         access_token=access_token,
         token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
+        expires_in=settings.access_token_expires_in,
     )
 
 
@@ -183,7 +185,7 @@ async def logout(
     # Refresh Token 쿠키 삭제
     response.delete_cookie(key="refresh_token")
 
-    logger.info(f"사용자 로그아웃: {current_user.email}")
+    logger.info("사용자 로그아웃: %s", current_user.email)
 
     return MessageResponse(message="로그아웃되었습니다")
 
@@ -251,15 +253,15 @@ async def refresh_token(
         httponly=True,
         secure=not settings.debug,
         samesite="lax",
-        max_age=settings.refresh_token_expire_days * 24 * 60 * 60,
+        max_age=settings.refresh_token_max_age,
     )
 
-    logger.info(f"토큰 갱신: {user.email}")
+    logger.info("토큰 갱신: %s", user.email)
 
     return TokenResponse(
         access_token=access_token,
         token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
+        expires_in=settings.access_token_expires_in,
     )
 
 
@@ -4,32 +4,35 @@
 자연어 질문을 SQL로 변환하고 결과를 반환하는 SSE 스트리밍 API입니다.
 """
 
-import json
+import asyncio
 import logging
-from typing import Annotated, AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
+from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
 from langgraph.types import Command
-from sse_starlette.sse import EventSourceResponse
+from pydantic_core import to_json
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 
 from app.agent.graph import get_graph
 from app.agent.state import create_initial_state
 from app.auth.dependencies import get_current_user
-from app.auth.permissions import get_accessible_tables
+from app.auth.permissions import get_accessible_tables, validate_query_permission
 from app.models.auth import UserWithRoles
 from app.models.entities import ColumnInfo, QueryRequestStatus
 from app.models.requests import ChatRequest, ConfirmationRequest
 from app.models.responses import (
+    ConfirmationRequiredEvent,
     ConfirmationResponse,
     DoneEvent,
     ErrorDetail,
     ErrorEvent,
     QueryPreviewEvent,
     QueryResultData,
-    ResultEvent,
+    ResultMetaEvent,
+    RowBatchEvent,
     SessionEvent,
     StatusEvent,
-    ConfirmationRequiredEvent,
 )
 from app.session.manager import (
     add_message_to_session,
@@ -43,6 +46,20 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# 체크포인트 저장 방식: 각 스텝의 체크포인트를 다음 스텝 전에 동기적으로 저장
+# ("async"는 이전 저장 작업을 체인으로 연결해 그래프 종료 시까지 이전 체크포인트 참조를 유지함)
+CHECKPOINT_DURABILITY = "sync"
+
+# 결과 행을 나누어 보내는 SSE 이벤트당 행 수
+SSE_ROW_BATCH_SIZE = 50
+
+# 연속으로 생성된 SSE 프레임을 한 번의 쓰기로 묶는 대기 시간(초)과 최대 프레임 수
+SSE_FLUSH_SECONDS = 0.005
+SSE_MAX_FRAMES_PER_FLUSH = 32
+
+# pydantic 모델이 아닌 이벤트에 대한 고정 프레임
+_UNKNOWN_EVENT_FRAME: dict[str, str] = {"event": "message", "data": '{"type":"unknown"}'}
+
 
 def _get_nested_value(state: dict, *keys, default=None):
     """Nested dict에서 안전하게 값 추출"""
@@ -88,12 +105,7 @@ async def chat_endpoint(
             yield _format_sse_event(SessionEvent(session_id=session_id))
 
             # 상태 이벤트: 생성 중
-            yield _format_sse_event(
-                StatusEvent(
-                    status=QueryRequestStatus.GENERATING,
-                    message="쿼리를 생성하고 있습니다...",
-                )
-            )
+            yield _STATUS_FRAMES[QueryRequestStatus.GENERATING]
 
             # 사용자 메시지 저장
             add_message_to_session(session_id, "user", request.message)
@@ -118,7 +130,10 @@ async def chat_endpoint(
             current_query_id = ""  # query_id 추적용
 
             async for event in graph.astream(
-                initial_state, config, stream_mode="updates"
+                initial_state,
+                config,
+                stream_mode="updates",
+                durability=CHECKPOINT_DURABILITY,
             ):
                 # 노드별 이벤트 처리
                 for node_name, node_output in event.items():
@@ -153,53 +168,15 @@ async def chat_endpoint(
                     if query_id:
                         current_query_id = query_id
 
-                    # 쿼리 생성 완료 시
-                    generated_query = _get_nested_value(
-                        node_output, "generation", "generated_query"
-                    )
-                    if node_name == "query_generation" and generated_query:
-                        yield _format_sse_event(
-                            StatusEvent(
-                                status=QueryRequestStatus.VALIDATING,
-                                message="쿼리를 검증하고 있습니다...",
-                            )
-                        )
-                        yield _format_sse_event(
-                            QueryPreviewEvent(
-                                query=generated_query,
-                                explanation=_get_nested_value(
-                                    node_output,
-                                    "generation",
-                                    "query_explanation",
-                                    default="",
-                                ),
-                            )
-                        )
-
-                    # 검증 완료 시
-                    is_query_valid = _get_nested_value(
-                        node_output, "validation", "is_query_valid"
-                    )
-                    if node_name == "query_validation" and is_query_valid:
-                        yield _format_sse_event(
-                            StatusEvent(
-                                status=QueryRequestStatus.AWAITING_CONFIRM,
-                                message="쿼리 확인을 기다리고 있습니다...",
-                            )
-                        )
-
-                    # 쿼리 실행 중
-                    if node_name == "query_execution":
-                        yield _format_sse_event(
-                            StatusEvent(
-                                status=QueryRequestStatus.EXECUTING,
-                                message="쿼리를 실행하고 있습니다...",
-                            )
-                        )
+                    # 노드별 진행 이벤트 전송
+                    handler = _NODE_HANDLERS.get(node_name)
+                    if handler is not None:
+                        for frame in handler(node_output):
+                            yield frame
 
             # 인터럽트 상태인 경우 (Human-in-the-Loop)
             if is_interrupted:
-                yield _format_sse_event(DoneEvent(awaiting_confirmation=True))
+                yield _AWAITING_CONFIRMATION_DONE_FRAME
                 update_session_activity(session_id)
                 return
 
@@ -270,33 +247,35 @@ async def chat_endpoint(
                         )
                         for col in columns
                     ]
-                    yield _format_sse_event(
-                        ResultEvent(
-                            data=QueryResultData(
-                                rows=rows,
-                                total_row_count=_get_nested_value(
-                                    final_state,
-                                    "execution",
-                                    "total_row_count",
-                                    default=0,
-                                ),
-                                returned_row_count=len(rows),
-                                columns=column_infos,
-                                is_truncated=len(rows)
-                                < _get_nested_value(
-                                    final_state,
-                                    "execution",
-                                    "total_row_count",
-                                    default=0,
-                                ),
-                                execution_time_ms=_get_nested_value(
-                                    final_state,
-                                    "execution",
-                                    "execution_time_ms",
-                                    default=0,
-                                ),
+                    # 결과 행은 배치 단위 이벤트로 나누어 전송하고 메타데이터는 마지막에 전송
+                    for batch_index, start in enumerate(
+                        range(0, len(rows), SSE_ROW_BATCH_SIZE)
+                    ):
+                        yield _format_sse_event(
+                            RowBatchEvent(
+                                batch_index=batch_index,
+                                rows=rows[start : start + SSE_ROW_BATCH_SIZE],
                             )
                         )
+
+                    total_row_count = _get_nested_value(
+                        final_state, "execution", "total_row_count", default=0
+                    )
+                    yield _format_sse_event(
+                        ResultMetaEvent(
+                            total_row_count=total_row_count,
+                            returned_row_count=len(rows),
+                            columns=column_infos,
+                            is_truncated=_get_nested_value(
+                                final_state, "execution", "is_truncated", default=False
+                            ),
+                            execution_time_ms=_get_nested_value(
+                                final_state,
+                                "execution",
+                                "execution_time_ms",
+                                default=0,
+                            ),
+                        )
                     )
 
                     # 어시스턴트 응답 저장
@@ -307,7 +286,7 @@ async def chat_endpoint(
                     )
 
             # 완료 이벤트
-            yield _format_sse_event(DoneEvent())
+            yield _DONE_FRAME
 
             # 세션 활동 시간 업데이트
             update_session_activity(session_id)
@@ -322,9 +301,9 @@ async def chat_endpoint(
                     )
                 )
             )
-            yield _format_sse_event(DoneEvent())
+            yield _DONE_FRAME
 
-    return EventSourceResponse(event_generator())
+    return EventSourceResponse(_coalesce_sse_frames(event_generator()))
 
 
 @router.post(
@@ -381,7 +360,10 @@ async def confirm_query(
             # Command로 워크플로우 재개 (거부 상태)
             final_state = {}
             async for event in graph.astream(
-                Command(resume=user_response), config, stream_mode="updates"
+                Command(resume=user_response),
+                config,
+                stream_mode="updates",
+                durability=CHECKPOINT_DURABILITY,
             ):
                 for node_name, node_output in event.items():
                     if not isinstance(node_output, dict):
@@ -407,8 +389,6 @@ async def confirm_query(
             )
 
         if generated_query:
-            from app.auth.permissions import validate_query_permission
-
             has_permission, unauthorized_tables = await validate_query_permission(
                 current_user, generated_query
             )
@@ -428,7 +408,10 @@ async def confirm_query(
         # Command로 워크플로우 재개
         final_state = {}
         async for event in graph.astream(
-            Command(resume=user_response), config, stream_mode="updates"
+            Command(resume=user_response),
+            config,
+            stream_mode="updates",
+            durability=CHECKPOINT_DURABILITY,
         ):
             for node_name, node_output in event.items():
                 if not isinstance(node_output, dict):
@@ -481,7 +464,9 @@ async def confirm_query(
                     total_row_count=total_row_count,
                     returned_row_count=len(query_result),
                     columns=column_infos,
-                    is_truncated=len(query_result) < total_row_count,
+                    is_truncated=_get_nested_value(
+                        final_state, "execution", "is_truncated", default=False
+                    ),
                     execution_time_ms=_get_nested_value(
                         final_state, "execution", "execution_time_ms", default=0
                     ),
@@ -500,14 +485,134 @@ async def confirm_query(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+async def _coalesce_sse_frames(
+    frames: AsyncGenerator[dict[str, str], None],
+) -> AsyncGenerator[bytes, None]:
+    """
+    짧은 시간 안에 생성된 SSE 프레임을 한 번의 쓰기로 묶어 전송
+
+    각 프레임을 SSE 형식 바이트로 인코딩한 뒤 이어 붙이므로 이벤트 경계는 그대로 유지되고
+    ASGI send 호출 수만 줄어듭니다. 첫 프레임 이후 SSE_FLUSH_SECONDS 동안
+    (최대 SSE_MAX_FRAMES_PER_FLUSH개) 도착한 프레임을 함께 전송합니다.
+
+    Args:
+        frames: SSE 프레임 dict를 생성하는 제너레이터
+
+    Yields:
+        하나 이상의 SSE 이벤트가 이어 붙은 바이트
+    """
+    # 느린 클라이언트 때문에 프레임이 무한정 쌓이지 않도록 큐 크기를 제한
+    queue: asyncio.Queue[dict[str, str] | None] = asyncio.Queue(
+        maxsize=SSE_MAX_FRAMES_PER_FLUSH
+    )
+
+    async def produce() -> None:
+        cancelled = False
+        try:
+            async for frame in frames:
+                await queue.put(frame)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            await frames.aclose()
+            # 취소는 소비자가 종료된 경우이므로 종료 표식이 필요 없음
+            # 그 외에는 소비자가 읽는 중이므로 공간이 생길 때까지 기다려 반드시 전달
+            if not cancelled:
+                await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    loop = asyncio.get_running_loop()
+    try:
+        finished = False
+        while not finished:
+            frame = await queue.get()
+            if frame is None:
+                break
+
+            chunks = [ServerSentEvent(**frame).encode()]
+            deadline = loop.time() + SSE_FLUSH_SECONDS
+            while len(chunks) < SSE_MAX_FRAMES_PER_FLUSH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    frame = await asyncio.wait_for(queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if frame is None:
+                    finished = True
+                    break
+                chunks.append(ServerSentEvent(**frame).encode())
+
+            yield b"".join(chunks)
+
+        # 생성 중 발생한 예외 전파
+        await producer
+    finally:
+        # 클라이언트 연결 종료 등으로 중단되면 그래프 실행도 함께 취소
+        producer.cancel()
+
+
 def _format_sse_event(event: object) -> dict[str, str]:
     """SSE 이벤트 포맷팅"""
-    if hasattr(event, "model_dump"):
-        data = event.model_dump()  # type: ignore[union-attr]
-    else:
-        data = {"type": "unknown"}
+    if not hasattr(event, "model_dump"):
+        return _UNKNOWN_EVENT_FRAME
 
+    # 모델을 중간 dict 없이 pydantic-core의 Rust 인코더로 바로 직렬화
+    # (비ASCII 문자는 이스케이프 없이 UTF-8로 출력, 알 수 없는 값은 str())
     return {
         "event": "message",
-        "data": json.dumps(data, ensure_ascii=False, default=str),
+        "data": to_json(event, fallback=str).decode(),
     }
+
+
+# 내용이 고정된 상태/완료 이벤트는 모듈 로드 시 한 번만 직렬화하여 재사용
+# (공유 객체이므로 변경 금지)
+_STATUS_FRAMES: dict[QueryRequestStatus, dict[str, str]] = {
+    status: _format_sse_event(StatusEvent(status=status, message=message))
+    for status, message in (
+        (QueryRequestStatus.GENERATING, "쿼리를 생성하고 있습니다..."),
+        (QueryRequestStatus.VALIDATING, "쿼리를 검증하고 있습니다..."),
+        (QueryRequestStatus.AWAITING_CONFIRM, "쿼리 확인을 기다리고 있습니다..."),
+        (QueryRequestStatus.EXECUTING, "쿼리를 실행하고 있습니다..."),
+    )
+}
+_DONE_FRAME = _format_sse_event(DoneEvent())
+_AWAITING_CONFIRMATION_DONE_FRAME = _format_sse_event(DoneEvent(awaiting_confirmation=True))
+
+
+def _query_generation_frames(node_output: dict) -> Iterator[dict[str, str]]:
+    """쿼리 생성 완료 시 검증 상태와 쿼리 미리보기 전송"""
+    generation = node_output.get("generation")
+    if not isinstance(generation, dict):
+        return
+    generated_query = generation.get("generated_query")
+    if generated_query:
+        yield _STATUS_FRAMES[QueryRequestStatus.VALIDATING]
+        yield _format_sse_event(
+            QueryPreviewEvent(
+                query=generated_query,
+                explanation=generation.get("query_explanation") or "",
+            )
+        )
+
+
+def _query_validation_frames(node_output: dict) -> Iterator[dict[str, str]]:
+    """검증 통과 시 확인 대기 상태 전송"""
+    validation = node_output.get("validation")
+    if isinstance(validation, dict) and validation.get("is_query_valid"):
+        yield _STATUS_FRAMES[QueryRequestStatus.AWAITING_CONFIRM]
+
+
+def _query_execution_frames(_node_output: dict) -> Iterator[dict[str, str]]:
+    """쿼리 실행 상태 전송"""
+    yield _STATUS_FRAMES[QueryRequestStatus.EXECUTING]
+
+
+# 진행 이벤트를 보내는 노드별 핸들러 (그 외 노드는 이벤트 없음)
+_NODE_HANDLERS: dict[str, Callable[[dict], Iterator[dict[str, str]]]] = {
+    "query_generation": _query_generation_frames,
+    "query_validation": _query_validation_frames,
+    "query_execution": _query_execution_frames,
+}
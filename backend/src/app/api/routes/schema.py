@@ -8,6 +8,7 @@ import logging
 
 from fastapi import APIRouter, HTTPException, status
 
+from app.agent.nodes.query_validation import invalidate_schema_cache
 from app.database.schema import clear_schema_cache, get_database_schema
 from app.errors.exceptions import DatabaseConnectionError
 from app.models.responses import DatabaseSchemaResponse
@@ -79,8 +80,9 @@ async def refresh_schema() -> DatabaseSchemaResponse:
         HTTPException: 데이터베이스 연결 실패 시
     """
     try:
-        # 캐시 초기화
+        # 캐시 초기화 (검증 노드의 스키마 캐시 포함)
         clear_schema_cache()
+        invalidate_schema_cache()
 
         # 새로 조회
         schema = await get_database_schema(force_refresh=True)
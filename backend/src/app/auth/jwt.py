@@ -5,6 +5,9 @@ Access Token: 30분 만료
 Refresh Token: 7일 만료
 """
 
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -12,6 +15,12 @@ from jose import JWTError, jwt
 
 from app.config import get_settings
 
+# 검증된 토큰 페이로드 캐시 ((토큰 해시, 토큰 타입) → (만료 시각, 페이로드))
+# 같은 토큰이 짧은 시간에 반복 검증될 때 서명 검증을 생략 (토큰 만료 시각을 넘겨 보관하지 않음)
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+_verified_cache: OrderedDict[tuple[bytes, str], tuple[float, dict[str, Any]]] = OrderedDict()
+
 
 def create_access_token(
     data: dict[str, Any],
@@ -106,6 +115,14 @@ def verify_token(token: str, token_type: str = "access") -> dict[str, Any] | Non
     Returns:
         토큰 페이로드 (유효하지 않으면 None)
     """
+    cache_key = (hashlib.blake2b(token.encode(), digest_size=16).digest(), token_type)
+    entry = _verified_cache.get(cache_key)
+    if entry is not None:
+        expires_at, payload = entry
+        if time.time() < expires_at:
+            return dict(payload)
+        del _verified_cache[cache_key]
+
     settings = get_settings()
 
     try:
@@ -123,12 +140,31 @@ def verify_token(token: str, token_type: str = "access") -> dict[str, Any] | Non
         if "sub" in payload:
             payload["sub"] = int(payload["sub"])
 
-        return payload
+        _store_verified(cache_key, payload)
+        return dict(payload)
 
     except JWTError:
         return None
 
 
+def _store_verified(key: tuple[bytes, str], payload: dict[str, Any]) -> None:
+    """검증된 페이로드 캐시 저장 (최대 항목 수 초과 시 오래된 항목부터 제거)"""
+    expires_at = time.time() + TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+
+    _verified_cache[key] = (expires_at, payload)
+    _verified_cache.move_to_end(key)
+    while len(_verified_cache) > TOKEN_CACHE_MAX_ENTRIES:
+        _verified_cache.popitem(last=False)
+
+
+def clear_token_cache() -> None:
+    """검증된 토큰 캐시 초기화 (서명 키 변경 시 등)"""
+    _verified_cache.clear()
+
+
 def decode_token_without_verification(token: str) -> dict[str, Any] | None:
     """
     토큰 검증 없이 디코딩 (디버깅용)
@@ -5,10 +5,15 @@
 """
 
 import logging
+import re
+from functools import lru_cache
 from typing import Literal
 
+import sqlglot
+
 from app.database.connection import get_connection
 from app.models.auth import UserWithRoles
+from app.utils.sql import normalize_sql
 
 logger = logging.getLogger(__name__)
 
@@ -173,8 +178,13 @@ def extract_tables_from_query(sql_query: str) -> list[str]:
     Returns:
         추출된 테이블 이름 목록
     """
-    import sqlglot
+    # 검증/실행 단계에서 같은 쿼리를 반복 파싱하지 않도록 정규화된 쿼리 기준으로 캐시
+    return list(_extract_tables_cached(normalize_sql(sql_query)))
+
 
+@lru_cache(maxsize=2048)
+def _extract_tables_cached(sql_query: str) -> tuple[str, ...]:
+    """extract_tables_from_query의 캐시 구현 (호출자가 변경할 수 없도록 튜플 반환)"""
     try:
         tables: set[str] = set()
         for statement in sqlglot.parse(sql_query, error_level=sqlglot.ErrorLevel.IGNORE):
@@ -183,10 +193,10 @@ def extract_tables_from_query(sql_query: str) -> list[str]:
             for table in statement.find_all(sqlglot.exp.Table):
                 if table.name:
                     tables.add(table.name.lower())
-        return list(tables)
+        return tuple(tables)
     except Exception:
         logger.warning("sqlglot 파싱 실패, 정규식 fallback 사용")
-        return _extract_tables_regex(sql_query)
+        return tuple(_extract_tables_regex(sql_query))
 
 
 def _extract_tables_regex(sql_query: str) -> list[str]:
@@ -199,8 +209,6 @@ def _extract_tables_regex(sql_query: str) -> list[str]:
     Returns:
         추출된 테이블 이름 목록
     """
-    import re
-
     sql_upper = sql_query.upper()
     sql_normalized = sql_query
 
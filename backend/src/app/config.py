@@ -6,7 +6,7 @@ Pydantic Settings를 사용하여 환경 변수에서 설정을 로드합니다.
 
 import logging
 import sys
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic import Field
@@ -59,6 +59,23 @@ class Settings(BaseSettings):
     max_result_rows: int = Field(default=10000, description="최대 결과 행 수")
     default_page_size: int = Field(default=100, description="기본 페이지 크기")
     max_generation_attempts: int = Field(default=3, description="쿼리 생성 최대 시도 횟수")
+    query_cache_ttl_seconds: int = Field(
+        default=60,
+        description="쿼리 결과 캐시 유지 시간 (초, 0이면 캐시 비활성화)",
+    )
+    query_cache_max_entries: int = Field(default=256, description="쿼리 결과 캐시 최대 항목 수")
+    validation_schema_cache_ttl_seconds: int = Field(
+        default=60,
+        description="쿼리 검증 노드의 스키마 캐시 유지 시간 (초, 0이면 매번 조회)",
+    )
+    validation_thread_offload: bool = Field(
+        default=True,
+        description="긴 쿼리의 키워드/스키마 검증을 스레드에서 실행 (이벤트 루프 블로킹 방지)",
+    )
+    skip_semantic_for_simple_queries: bool = Field(
+        default=False,
+        description="JOIN/서브쿼리/함수가 없는 단순 테이블 SELECT는 LLM 시맨틱 검증 생략",
+    )
 
     # === Human-in-the-Loop 설정 ===
     auto_confirm_queries: bool = Field(
@@ -110,6 +127,16 @@ class Settings(BaseSettings):
         description="Refresh Token 만료 시간 (일)",
     )
 
+    @cached_property
+    def access_token_expires_in(self) -> int:
+        """Access Token 만료 시간 (초, 요청마다 다시 계산하지 않도록 캐시)"""
+        return self.access_token_expire_minutes * 60
+
+    @cached_property
+    def refresh_token_max_age(self) -> int:
+        """Refresh Token 쿠키 max-age (초, 요청마다 다시 계산하지 않도록 캐시)"""
+        return self.refresh_token_expire_days * 24 * 60 * 60
+
     @property
     def database_url_str(self) -> str:
         """데이터베이스 URL을 문자열로 반환"""
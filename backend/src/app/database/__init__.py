@@ -12,10 +12,13 @@ from app.database.connection import (
     get_pool,
     get_readonly_connection,
 )
+from app.database.query_cache import clear_query_cache
 from app.database.schema import (
     clear_schema_cache,
     format_schema_for_llm,
     get_database_schema,
+    is_schema_cache_warm,
+    prefetch_database_schema,
 )
 
 __all__ = [
@@ -26,8 +29,12 @@ __all__ = [
     "get_connection",
     "get_pool",
     "get_readonly_connection",
+    # 쿼리 결과 캐시
+    "clear_query_cache",
     # 스키마
     "clear_schema_cache",
     "format_schema_for_llm",
     "get_database_schema",
+    "is_schema_cache_warm",
+    "prefetch_database_schema",
 ]
@@ -64,6 +64,13 @@ def get_pool() -> asyncpg.Pool:
 async def get_connection() -> AsyncGenerator[asyncpg.Connection, None]:
     """연결 풀에서 연결 획득 (컨텍스트 매니저)"""
     pool = get_pool()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "연결 풀 상태 - 전체: %d, 유휴: %d, 최대: %d",
+            pool.get_size(),
+            pool.get_idle_size(),
+            pool.get_max_size(),
+        )
     try:
         async with pool.acquire() as connection:
             yield connection
@@ -86,10 +93,10 @@ async def get_readonly_connection(
 
     async with get_connection() as conn:
         try:
-            # 읽기 전용 트랜잭션 시작
-            await conn.execute("SET TRANSACTION READ ONLY")
-            # 쿼리 타임아웃 설정
-            await conn.execute(f"SET statement_timeout = {timeout}")
+            # 읽기 전용 트랜잭션 시작 + 쿼리 타임아웃 설정 (한 번의 왕복으로 전송)
+            await conn.execute(
+                f"SET TRANSACTION READ ONLY; SET statement_timeout = {timeout}"
+            )
             yield conn
         except asyncpg.PostgresError as e:
             logger.error(f"읽기 전용 연결 설정 오류: {e}")
@@ -6,9 +6,11 @@ READ ONLY 트랜잭션, 타임아웃, 행 제한을 적용하여 쿼리를 실
 
 import logging
 import time
-from datetime import date, datetime, time as dt_time
+from collections.abc import AsyncIterator, Callable
+from datetime import date, datetime, time as dt_time, timedelta
 from decimal import Decimal
 from typing import Any
+from uuid import UUID
 
 import asyncpg
 
@@ -23,6 +25,9 @@ from app.models.entities import ColumnInfo, QueryResult
 
 logger = logging.getLogger(__name__)
 
+# 서버 측 커서에서 한 번에 가져올 행 수
+FETCH_BATCH_SIZE = 1000
+
 # 위험 키워드 (기본 검사용)
 DANGEROUS_KEYWORDS = frozenset(
     {
@@ -42,21 +47,57 @@ DANGEROUS_KEYWORDS = frozenset(
 )
 
 
-def _sanitize_row_values(row: dict[str, Any]) -> dict[str, Any]:
+def _decimal_to_number(value: Decimal) -> int | float:
+    """Decimal을 정수면 int, 아니면 float로 변환"""
+    if value == value.to_integral_value():
+        return int(value)
+    return float(value)
+
+
+# JSON 기본 타입이 아닌 값의 변환기 (정확한 타입 기준 조회)
+# 날짜/시간 계열은 기존 str() 직렬화와 같은 문자열을 만들도록 변환
+_JSON_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    Decimal: _decimal_to_number,
+    datetime: lambda v: v.isoformat(sep=" "),
+    date: date.isoformat,
+    dt_time: dt_time.isoformat,
+    timedelta: str,
+    UUID: str,
+    bytes: bytes.hex,
+    memoryview: lambda v: v.hex(),
+}
+
+# 값 타입별 변환기 조회 결과 (변환이 필요 없는 타입은 None)
+# asyncpg의 UUID처럼 등록된 타입의 하위 클래스도 첫 조회 시 상속 관계로 찾아 기록
+_converter_by_type: dict[type, Callable[[Any], Any] | None] = dict(_JSON_CONVERTERS)
+
+
+def _resolve_converter(value_type: type) -> Callable[[Any], Any] | None:
+    """정확한 타입으로 찾지 못한 값 타입의 변환기를 상위 클래스에서 찾아 기록"""
+    converter = next(
+        (_JSON_CONVERTERS[base] for base in value_type.__mro__ if base in _JSON_CONVERTERS),
+        None,
+    )
+    _converter_by_type[value_type] = converter
+    return converter
+
+
+def _sanitize_row_values(row: asyncpg.Record) -> dict[str, Any]:
     """
-    행 값에서 Decimal을 int/float로 변환합니다.
+    행 값을 JSON 기본 타입으로 변환합니다.
 
-    JSON 직렬화 시 Decimal이 문자열로 변환되는 문제를 방지합니다.
+    Decimal은 int/float로, 날짜/시간·UUID·바이너리는 문자열로 변환하여
+    캐시와 상태에 저장되는 행이 별도 인코더 없이 직렬화되도록 합니다.
     """
+    converters = _converter_by_type
     sanitized = {}
     for key, value in row.items():
-        if isinstance(value, Decimal):
-            if value == value.to_integral_value():
-                sanitized[key] = int(value)
-            else:
-                sanitized[key] = float(value)
+        value_type = type(value)
+        if value_type in converters:
+            converter = converters[value_type]
         else:
-            sanitized[key] = value
+            converter = _resolve_converter(value_type)
+        sanitized[key] = value if converter is None else converter(value)
     return sanitized
 
 
@@ -106,6 +147,35 @@ def _quick_safety_check(query: str) -> None:
             raise DangerousQueryError(keyword)
 
 
+async def iter_query_batches(
+    conn: asyncpg.Connection,
+    query: str,
+    batch_size: int = FETCH_BATCH_SIZE,
+) -> AsyncIterator[list[asyncpg.Record]]:
+    """
+    서버 측 커서로 쿼리 결과를 배치 단위로 가져옵니다.
+
+    전체 결과를 한 번에 메모리에 올리지 않으므로 결과 크기와 무관하게
+    메모리 사용량이 배치 크기로 제한됩니다.
+
+    Args:
+        conn: 읽기 전용 연결
+        query: 실행할 SQL 쿼리 (안전 검사 완료된 SELECT)
+        batch_size: 배치당 행 수
+
+    Yields:
+        행 배치 (빈 배치는 반환하지 않음)
+    """
+    # asyncpg 커서는 트랜잭션 안에서만 사용 가능
+    async with conn.transaction(readonly=True):
+        cursor = await conn.cursor(query)
+        while True:
+            batch = await cursor.fetch(batch_size)
+            if not batch:
+                return
+            yield batch
+
+
 async def execute_safe_query(
     query: str,
     timeout_ms: int | None = None,
@@ -144,19 +214,21 @@ async def execute_safe_query(
 
     try:
         async with get_readonly_connection(timeout) as conn:
-            # 쿼리 실행
-            rows = await conn.fetch(query)
+            # 쿼리 실행 (배치 단위로 가져오며 최대 행 수까지만 보관, 나머지는 개수만 집계)
+            rows: list[asyncpg.Record] = []
+            total_count = 0
+            async for batch in iter_query_batches(conn, query):
+                total_count += len(batch)
+                remaining = max_row_limit - len(rows)
+                if remaining > 0:
+                    rows.extend(batch[:remaining])
 
             # 실행 시간 계산
             execution_time_ms = int((time.time() - start_time) * 1000)
 
             # 결과 처리
-            total_count = len(rows)
             is_truncated = total_count > max_row_limit
 
-            if is_truncated:
-                rows = rows[:max_row_limit]
-
             # 컬럼 정보 추출 (raw Record에서 타입 추론)
             columns: list[ColumnInfo] = []
             if rows:
@@ -169,9 +241,9 @@ async def execute_safe_query(
                         )
                     )
 
-            # dict로 변환 (Decimal → int/float 변환 포함)
+            # dict로 변환 (JSON 기본 타입으로 변환 포함)
             result_rows: list[dict[str, Any]] = [
-                _sanitize_row_values(dict(row)) for row in rows
+                _sanitize_row_values(row) for row in rows
             ]
 
             logger.info(
@@ -0,0 +1,142 @@
+"""
+쿼리 결과 캐시
+
+동일한 SELECT 쿼리를 짧은 시간 내에 반복 실행할 때 DB 왕복을 생략하기 위한
+TTL 기반 인메모리 캐시입니다. 캐시 키는 정규화된 SQL과 권한 범위(접근 가능 테이블)로 구성됩니다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+
+from app.config import get_settings
+from app.models.entities import QueryResult
+from app.utils.sql import normalize_sql
+
+logger = logging.getLogger(__name__)
+
+# 캐시 저장소 (키 → (만료 시각, 결과)), 삽입 순서로 오래된 항목부터 제거
+_cache: OrderedDict[str, tuple[float, QueryResult]] = OrderedDict()
+
+# 실행을 맡은 호출자가 취소되었음을 대기자에게 알리는 표식 (대기자는 직접 다시 실행)
+_LEADER_CANCELLED = object()
+
+# 실행 중인 쿼리 (키 → 결과 Future), 동시에 들어온 동일 쿼리를 한 번만 실행하기 위함
+_inflight: dict[str, asyncio.Future[QueryResult | object]] = {}
+
+
+def make_cache_key(query: str, accessible_tables: Iterable[str]) -> str:
+    """
+    캐시 키 생성
+
+    Args:
+        query: SQL 쿼리
+        accessible_tables: 접근 가능 테이블 (권한 범위)
+
+    Returns:
+        sha256 해시 키
+    """
+    scope = ",".join(sorted(t.lower() for t in accessible_tables))
+    raw = f"{normalize_sql(query)}|{scope}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def get_cached_result(key: str) -> QueryResult | None:
+    """
+    캐시된 쿼리 결과 조회
+
+    Args:
+        key: make_cache_key로 생성한 키
+
+    Returns:
+        유효한 캐시 결과 (없거나 만료되었으면 None)
+    """
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, result = entry
+    if time.monotonic() >= expires_at:
+        del _cache[key]
+        return None
+
+    return result
+
+
+def store_result(key: str, result: QueryResult) -> None:
+    """
+    쿼리 결과 캐시 저장
+
+    TTL이 0 이하이면 캐시를 사용하지 않습니다.
+
+    Args:
+        key: make_cache_key로 생성한 키
+        result: 저장할 쿼리 결과
+    """
+    settings = get_settings()
+    if settings.query_cache_ttl_seconds <= 0:
+        return
+
+    _cache[key] = (time.monotonic() + settings.query_cache_ttl_seconds, result)
+    _cache.move_to_end(key)
+
+    # 최대 항목 수 초과 시 오래된 항목부터 제거
+    while len(_cache) > settings.query_cache_max_entries:
+        _cache.popitem(last=False)
+
+
+async def run_coalesced(
+    key: str,
+    execute: Callable[[], Awaitable[QueryResult]],
+) -> QueryResult:
+    """
+    동일 키의 쿼리 실행을 하나로 합쳐 실행
+
+    같은 키의 실행이 이미 진행 중이면 새로 실행하지 않고 그 결과를 함께 기다립니다.
+    조회와 등록 사이에 await가 없으므로 이벤트 루프 안에서는 별도 락이 필요 없습니다.
+
+    Args:
+        key: make_cache_key로 생성한 키
+        execute: 실제 쿼리를 실행하는 코루틴 함수
+
+    Returns:
+        쿼리 결과 (실행이 실패하면 같은 예외가 모든 대기자에게 전달됨,
+        실행한 호출자가 취소되면 대기자는 취소되지 않고 직접 다시 실행)
+    """
+    pending = _inflight.get(key)
+    if pending is not None:
+        logger.debug("진행 중인 동일 쿼리 결과 대기")
+        # 대기자가 취소되어도 공유 Future는 취소되지 않도록 shield
+        result = await asyncio.shield(pending)
+        if result is _LEADER_CANCELLED:
+            # 다른 요청의 취소는 전파하지 않고 직접 다시 실행 (대기자끼리는 다시 합쳐짐)
+            return await run_coalesced(key, execute)
+        return result  # type: ignore[return-value]
+
+    future: asyncio.Future[QueryResult | object] = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await execute()
+    except Exception as e:
+        future.set_exception(e)
+        # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+        future.exception()
+        raise
+    except BaseException:
+        # 취소를 대기자에게 전파하지 않도록 Future를 취소하지 않고 표식으로 완료
+        future.set_result(_LEADER_CANCELLED)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del _inflight[key]
+
+
+def clear_query_cache() -> None:
+    """쿼리 결과 캐시 초기화"""
+    _cache.clear()
+    logger.info("쿼리 결과 캐시 초기화됨")
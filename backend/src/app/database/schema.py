@@ -4,6 +4,7 @@
 PostgreSQL의 information_schema와 pg_catalog에서 스키마 정보를 조회합니다.
 """
 
+import asyncio
 import hashlib
 import logging
 from datetime import datetime, timedelta
@@ -27,6 +28,9 @@ SCHEMA_CACHE_TTL = timedelta(hours=1)
 SCHEMA_VERSION_CHECK_INTERVAL = timedelta(minutes=5)  # 버전 체크 주기
 _last_version_check: datetime | None = None
 
+# 진행 중인 백그라운드 스키마 선조회 작업 (조회 시 완료를 기다려 중복 조회 방지)
+_prefetch_tasks: set[asyncio.Task[DatabaseSchema]] = set()
+
 
 async def _get_schema_version_hash() -> str:
     """
@@ -105,6 +109,12 @@ async def get_database_schema(force_refresh: bool = False) -> DatabaseSchema:
     """
     global _schema_cache, _cache_updated_at
 
+    # 백그라운드 선조회가 진행 중이면 완료를 기다린 뒤 캐시 사용 (실패 시 직접 조회)
+    if not force_refresh:
+        pending = [t for t in _prefetch_tasks if t is not asyncio.current_task()]
+        if pending:
+            await asyncio.wait(pending)
+
     # 캐시 확인
     if not force_refresh and _schema_cache is not None and _cache_updated_at is not None:
         if datetime.utcnow() - _cache_updated_at < SCHEMA_CACHE_TTL:
@@ -276,6 +286,37 @@ async def get_database_schema(force_refresh: bool = False) -> DatabaseSchema:
     return _schema_cache
 
 
+def is_schema_cache_warm() -> bool:
+    """스키마 캐시가 있고 TTL 안에 있는지 여부"""
+    return (
+        _schema_cache is not None
+        and _cache_updated_at is not None
+        and datetime.utcnow() - _cache_updated_at < SCHEMA_CACHE_TTL
+    )
+
+
+def prefetch_database_schema() -> None:
+    """
+    스키마 캐시가 비어 있거나 만료된 경우에만 백그라운드 조회 시작
+
+    호출자는 조회 완료를 기다리지 않으며, 이후 get_database_schema 호출이
+    진행 중인 선조회 결과를 기다려 사용합니다. 실패는 무시됩니다.
+    """
+    if _prefetch_tasks or is_schema_cache_warm():
+        return
+
+    task = asyncio.create_task(get_database_schema())
+    _prefetch_tasks.add(task)
+    task.add_done_callback(_on_prefetch_done)
+
+
+def _on_prefetch_done(task: asyncio.Task[DatabaseSchema]) -> None:
+    """선조회 작업 정리 (실패는 로그만 남김)"""
+    _prefetch_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("스키마 선조회 실패 (무시): %s", task.exception())
+
+
 def format_schema_for_llm(schema: DatabaseSchema) -> str:
     """
     LLM 프롬프트용 스키마 문자열 생성
@@ -6,8 +6,10 @@ LLM 프로바이더 패키지
 
 from app.llm.anthropic import AnthropicProvider
 from app.llm.base import DEFAULT_MODELS, LLMConfig, LLMProvider
+from app.llm.content import content_to_text
 from app.llm.factory import (
     check_llm_availability,
+    clear_model_cache,
     get_chat_model,
     get_fast_model,
     get_provider,
@@ -20,8 +22,10 @@ __all__ = [
     "DEFAULT_MODELS",
     "LLMConfig",
     "LLMProvider",
+    "content_to_text",
     # 팩토리
     "check_llm_availability",
+    "clear_model_cache",
     "get_chat_model",
     "get_fast_model",
     "get_provider",
@@ -0,0 +1,29 @@
+"""
+LLM 응답 콘텐츠 유틸리티
+
+프로바이더마다 다른 응답 content 형식(문자열 또는 content 블록 목록)을 텍스트로 변환합니다.
+"""
+
+
+def content_to_text(content: str | list) -> str:
+    """
+    응답 content를 텍스트로 변환
+
+    멀티파트 응답(content 블록 목록)은 텍스트 블록만 이어 붙입니다.
+
+    Args:
+        content: 메시지 content (문자열 또는 content 블록 목록)
+
+    Returns:
+        응답 텍스트
+    """
+    if isinstance(content, str):
+        return content
+
+    texts = []
+    for part in content:
+        if isinstance(part, str):
+            texts.append(part)
+        elif isinstance(part, dict):
+            texts.append(str(part.get("text", "")))
+    return "".join(texts)
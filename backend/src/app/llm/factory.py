@@ -23,6 +23,10 @@ ProviderType = Literal["openai", "anthropic", "google"]
 # 프로바이더 인스턴스 캐시
 _providers: dict[ProviderType, OpenAIProvider | AnthropicProvider | GoogleProvider] = {}
 
+# 기본 설정 모델 인스턴스 캐시 ((프로바이더, "chat"|"fast") → 모델)
+# LangChain 채팅 모델은 ainvoke마다 새 요청을 만들므로 요청 간 재사용해도 안전
+_default_models: dict[tuple[ProviderType, str], BaseChatModel] = {}
+
 
 def get_provider(
     provider_type: ProviderType | None = None,
@@ -66,10 +70,11 @@ def get_chat_model(
         config: LLM 설정 (None이면 기본 설정 사용)
 
     Returns:
-        BaseChatModel 인스턴스
+        BaseChatModel 인스턴스 (config가 없으면 캐시된 인스턴스)
     """
-    provider = get_provider(provider_type)
-    return provider.get_chat_model(config)
+    if config is not None:
+        return get_provider(provider_type).get_chat_model(config)
+    return _get_default_model(provider_type, "chat")
 
 
 def get_fast_model(
@@ -84,10 +89,35 @@ def get_fast_model(
         config: LLM 설정 (None이면 기본 설정 사용)
 
     Returns:
-        BaseChatModel 인스턴스
+        BaseChatModel 인스턴스 (config가 없으면 캐시된 인스턴스)
     """
-    provider = get_provider(provider_type)
-    return provider.get_fast_model(config)
+    if config is not None:
+        return get_provider(provider_type).get_fast_model(config)
+    return _get_default_model(provider_type, "fast")
+
+
+def _get_default_model(
+    provider_type: ProviderType | None,
+    kind: Literal["chat", "fast"],
+) -> BaseChatModel:
+    """기본 설정 모델 인스턴스를 프로바이더/종류별로 한 번만 생성하여 반환"""
+    if provider_type is None:
+        provider_type = get_settings().default_llm_provider
+
+    key = (provider_type, kind)
+    if key not in _default_models:
+        provider = get_provider(provider_type)
+        if kind == "chat":
+            _default_models[key] = provider.get_chat_model()
+        else:
+            _default_models[key] = provider.get_fast_model()
+
+    return _default_models[key]
+
+
+def clear_model_cache() -> None:
+    """모델 인스턴스 캐시 초기화 (API 키 등 설정 변경 시)"""
+    _default_models.clear()
 
 
 def get_llm(
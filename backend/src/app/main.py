@@ -23,6 +23,7 @@ from app.config import get_settings, setup_logging
 from app.database.connection import close_pool, create_pool
 from app.database.schema import get_database_schema
 from app.errors.handlers import register_error_handlers
+from app.llm.factory import get_chat_model, get_fast_model
 from app.session.manager import cleanup_expired_sessions
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,12 @@ async def periodic_session_cleanup(interval_seconds: int = 600):
             logger.error(f"세션 정리 중 오류: {e}")
 
 
+def _warm_up_llm_models() -> None:
+    """기본 프로바이더의 채팅/빠른 모델을 미리 생성 (모델 캐시에 저장)"""
+    get_chat_model()
+    get_fast_model()
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """요청 로깅 미들웨어"""
 
@@ -130,12 +137,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.error(f"데이터베이스 연결 실패: {e}")
         # 연결 실패해도 서버는 시작 (헬스체크에서 확인 가능)
 
-    # 스키마 미리 로드 (Eager Loading) - 첫 요청 지연 제거
-    try:
-        schema = await get_database_schema()
-        logger.info(f"스키마 캐시 미리 로드 완료: {len(schema.tables)}개 테이블")
-    except Exception as e:
-        logger.warning(f"스키마 미리 로드 실패 (첫 요청 시 재시도됨): {e}")
+    # 스키마 / 기본 LLM 모델 미리 로드 (Eager Loading) - 첫 요청 지연 제거
+    # 서로 독립적이므로 동시에 수행 (모델 생성은 동기 작업이라 스레드에서 실행)
+    schema_result, llm_result = await asyncio.gather(
+        get_database_schema(),
+        asyncio.to_thread(_warm_up_llm_models),
+        return_exceptions=True,
+    )
+    if isinstance(schema_result, Exception):
+        logger.warning(f"스키마 미리 로드 실패 (첫 요청 시 재시도됨): {schema_result}")
+    else:
+        logger.info(f"스키마 캐시 미리 로드 완료: {len(schema_result.tables)}개 테이블")
+    if isinstance(llm_result, Exception):
+        logger.warning(f"LLM 모델 미리 생성 실패 (첫 요청 시 재시도됨): {llm_result}")
+    else:
+        logger.info("기본 LLM 모델 미리 생성 완료")
 
     # 백그라운드 세션 정리 태스크 시작
     _cleanup_task = asyncio.create_task(periodic_session_cleanup(300))
@@ -41,6 +41,8 @@ from app.models.responses import (
     QueryPreviewEvent,
     QueryResultData,
     ResultEvent,
+    ResultMetaEvent,
+    RowBatchEvent,
     SessionEvent,
     SessionResponse,
     StatusEvent,
@@ -82,6 +84,8 @@ __all__ = [
     "QueryPreviewEvent",
     "QueryResultData",
     "ResultEvent",
+    "ResultMetaEvent",
+    "RowBatchEvent",
     "SessionEvent",
     "SessionResponse",
     "StatusEvent",
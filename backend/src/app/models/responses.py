@@ -79,6 +79,25 @@ class ResultEvent(BaseModel):
     data: QueryResultData
 
 
+class RowBatchEvent(BaseModel):
+    """결과 행 배치 이벤트 (결과 행을 여러 이벤트로 나누어 전송)"""
+
+    type: Literal["row_batch"] = "row_batch"
+    batch_index: int = Field(ge=0, description="0부터 시작하는 배치 순번")
+    rows: list[dict[str, object]] = Field(default_factory=list)
+
+
+class ResultMetaEvent(BaseModel):
+    """결과 메타데이터 이벤트 (모든 행 배치 전송 후 마지막에 전송)"""
+
+    type: Literal["result_meta"] = "result_meta"
+    total_row_count: int = Field(ge=0)
+    returned_row_count: int = Field(ge=0)
+    columns: list[ColumnInfo] = Field(default_factory=list)
+    is_truncated: bool = False
+    execution_time_ms: int = Field(ge=0)
+
+
 class ErrorDetail(BaseModel):
     """에러 상세 정보"""
 
@@ -110,7 +129,8 @@ ChatStreamEvent = Union[
     QueryPreviewEvent,
     ConfirmRequiredEvent,
     ConfirmationRequiredEvent,
-    ResultEvent,
+    RowBatchEvent,
+    ResultMetaEvent,
     ErrorEvent,
     DoneEvent,
 ]
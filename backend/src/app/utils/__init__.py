@@ -0,0 +1,13 @@
+"""
+공통 유틸리티 패키지
+
+여러 계층(인증/검증/데이터베이스)에서 함께 사용하는 도우미 함수입니다.
+"""
+
+from app.utils.cache import SchemaScopedCache
+from app.utils.sql import normalize_sql
+
+__all__ = [
+    "SchemaScopedCache",
+    "normalize_sql",
+]
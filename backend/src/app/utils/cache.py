@@ -0,0 +1,56 @@
+"""
+캐시 유틸리티
+
+스키마 객체 단위로 유지되는 파생 값 캐시를 제공합니다.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+@dataclass(slots=True)
+class SchemaScopedCache(Generic[_K, _V]):
+    """
+    스키마 객체별 캐시 상태
+
+    같은 스키마 객체 동안만 값을 재사용하고, 스키마가 새로 조회되면(객체가 바뀌면)
+    모든 항목을 비웁니다. 최대 크기에 도달해도 전체를 비웁니다.
+    """
+
+    max_size: int
+    schema: object | None = None
+    entries: dict[_K, _V] = field(default_factory=dict)
+
+    def get_or_build(self, schema: object, key: _K, build: Callable[[], _V]) -> _V:
+        """
+        캐시된 값 반환 (없으면 생성 후 저장)
+
+        Args:
+            schema: 값의 기준이 되는 스키마 객체 (동일성으로 비교)
+            key: 스키마 안에서의 캐시 키
+            build: 캐시에 없을 때 값을 생성하는 함수 (None도 유효한 값으로 캐시)
+
+        Returns:
+            캐시되었거나 새로 생성한 값
+        """
+        if schema is not self.schema:
+            self.entries.clear()
+            self.schema = schema
+
+        if key in self.entries:
+            return self.entries[key]
+
+        value = build()
+        if len(self.entries) >= self.max_size:
+            self.entries.clear()
+        self.entries[key] = value
+        return value
+
+    def clear(self) -> None:
+        """캐시 초기화"""
+        self.entries.clear()
+        self.schema = None
@@ -0,0 +1,30 @@
+"""
+SQL 문자열 유틸리티
+
+캐시 키 생성 등에 사용하는 SQL 텍스트 정규화 함수입니다.
+"""
+
+import re
+
+# 문자열 리터럴('...')과 따옴표 식별자("...")는 그대로 두고 그 밖의 연속 공백만 매칭
+_WHITESPACE_OUTSIDE_LITERALS = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")|\s+")
+
+
+def normalize_sql(query: str) -> str:
+    """
+    캐시 키용 SQL 정규화
+
+    앞뒤 공백과 끝의 세미콜론을 제거하고
+    문자열 리터럴/따옴표 식별자 밖의 연속 공백을 하나로 합칩니다.
+    리터럴 값의 대소문자가 결과에 영향을 주므로 소문자 변환은 하지 않습니다.
+
+    Args:
+        query: 원본 SQL 쿼리
+
+    Returns:
+        정규화된 SQL
+    """
+    normalized = _WHITESPACE_OUTSIDE_LITERALS.sub(
+        lambda m: m.group(1) or " ", query.strip()
+    )
+    return normalized.rstrip("; ")
@@ -16,10 +16,12 @@ from app.validation.keyword_validator import (
 from app.validation.schema_validator import (
     SchemaValidator,
     ValidationResult,
+    get_schema_validator,
 )
 from app.validation.semantic_validator import (
     SemanticValidationResult,
     SemanticValidator,
+    is_simple_select,
     quick_pattern_check,
 )
 
@@ -32,8 +34,10 @@ __all__ = [
     # 스키마 검증
     "SchemaValidator",
     "ValidationResult",
+    "get_schema_validator",
     # 시맨틱 검증
     "SemanticValidationResult",
     "SemanticValidator",
+    "is_simple_select",
     "quick_pattern_check",
 ]
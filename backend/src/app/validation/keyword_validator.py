@@ -49,8 +49,11 @@ DANGEROUS_KEYWORDS: tuple[str, ...] = (
     "LOAD",
 )
 
+# 주석 매칭 정규식 (-- 스타일과 /* */ 스타일을 한 번의 스캔으로 처리)
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*[\s\S]*?\*/")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class KeywordValidationResult:
     """키워드 검증 결과"""
 
@@ -152,11 +155,8 @@ class KeywordValidator:
         Returns:
             주석이 제거된 쿼리
         """
-        # -- 스타일 주석 제거
-        query = re.sub(r"--[^\n]*", "", query)
-        # /* */ 스타일 주석 제거
-        query = re.sub(r"/\*[\s\S]*?\*/", "", query)
-        return query
+        # 먼저 시작된 주석부터 제거하므로 /* -- */ 처럼 중첩된 표기도 올바르게 처리
+        return _COMMENT_RE.sub("", query)
 
     def _generate_error_message(self, keywords: list[str]) -> str:
         """
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from app.models.entities import DatabaseSchema
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """스키마 검증 결과"""
 
@@ -51,6 +51,7 @@ class SchemaValidator:
             self._tables[table_name_lower] = {
                 col.name.lower() for col in table.columns
             }
+        self._all_columns: set[str] = set().union(*self._tables.values())
 
     def validate(self, query: str) -> ValidationResult:
         """
@@ -236,11 +237,8 @@ class SchemaValidator:
         return list(set(invalid))
 
     def _get_all_columns(self) -> set[str]:
-        """모든 테이블의 모든 컬럼 반환"""
-        all_cols: set[str] = set()
-        for columns in self._tables.values():
-            all_cols.update(columns)
-        return all_cols
+        """모든 테이블의 모든 컬럼 반환 (초기화 시 구축한 인덱스)"""
+        return self._all_columns
 
     def _generate_error_message(
         self,
@@ -283,3 +281,35 @@ class SchemaValidator:
         if table_lower not in self._tables:
             return False
         return column_name.lower() in self._tables[table_lower]
+
+
+@dataclass(slots=True)
+class _ValidatorCacheState:
+    """스키마 객체별 검증기 캐시 상태 (기준 스키마와 검증기를 함께 보관)"""
+
+    schema: DatabaseSchema | None = None
+    validator: SchemaValidator | None = None
+
+
+# 스키마 객체별 검증기 캐시 (스키마가 갱신되면 새 객체가 되므로 객체 동일성으로 무효화)
+_validator_cache = _ValidatorCacheState()
+
+
+def get_schema_validator(schema: DatabaseSchema) -> SchemaValidator:
+    """
+    스키마에 대한 검증기 인스턴스 반환
+
+    같은 스키마 객체에 대해서는 인덱스를 다시 구축하지 않고 기존 검증기를 재사용합니다.
+
+    Args:
+        schema: 데이터베이스 스키마 정보
+
+    Returns:
+        SchemaValidator 인스턴스
+    """
+    validator = _validator_cache.validator
+    if validator is None or _validator_cache.schema is not schema:
+        validator = SchemaValidator(schema)
+        _validator_cache.validator = validator
+        _validator_cache.schema = schema
+    return validator
@@ -4,14 +4,38 @@
 3단계 검증: LLM을 사용하여 쿼리의 의도와 안전성을 분석합니다.
 """
 
+import asyncio
+import hashlib
 import logging
+import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 
+import sqlglot
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
+from sqlglot import exp
+
+from app.utils.sql import normalize_sql
 
 logger = logging.getLogger(__name__)
 
+# 검증을 맡은 호출자가 취소되었음을 대기자에게 알리는 표식 (대기자는 직접 다시 검증)
+_LEADER_CANCELLED = object()
+
+# 진행 중인 LLM 검증 ((LLM 인스턴스 id, strict 모드, 쿼리) → 결과 Future)
+# 동시에 들어온 동일 쿼리는 LLM을 한 번만 호출하고 결과를 공유
+_inflight: dict[tuple[int, bool, str], asyncio.Future["SemanticValidationResult | object"]] = {}
+
+# 시맨틱 판정 캐시 ((모델, strict 모드, 정규화 쿼리) 해시 → (만료 시각, 결과))
+# 판정은 스키마와 무관하므로 스키마가 갱신되어도 유지
+SEMANTIC_CACHE_TTL_SECONDS = 3600
+SEMANTIC_CACHE_MAX_ENTRIES = 4096
+# 이 신뢰도를 넘는 판정만 캐시 (LLM 오류/불명확 응답은 재시도 시 다시 물음)
+CACHEABLE_MIN_CONFIDENCE = 0.5
+_verdict_cache: OrderedDict[bytes, tuple[float, "SemanticValidationResult"]] = OrderedDict()
+
 
 VALIDATION_SYSTEM_PROMPT = """당신은 SQL 쿼리 보안 분석가입니다.
 주어진 SQL 쿼리가 안전한 조회 쿼리인지 분석해주세요.
@@ -36,7 +60,7 @@ VALIDATION_SYSTEM_PROMPT = """당신은 SQL 쿼리 보안 분석가입니다.
 반드시 SAFE 또는 UNSAFE로 시작하는 한 줄 응답만 해주세요."""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SemanticValidationResult:
     """시맨틱 검증 결과"""
 
@@ -75,6 +99,8 @@ class SemanticValidator:
         """
         self._llm = llm
         self._strict_mode = strict_mode
+        # 판정 캐시 범위: 같은 모델/같은 strict 모드의 판정만 재사용
+        self._cache_scope = f"{_llm_identity(llm)}\0{int(strict_mode)}"
 
     async def validate(self, query: str) -> SemanticValidationResult:
         """
@@ -94,6 +120,58 @@ class SemanticValidator:
                 error_message="쿼리가 비어있습니다.",
             )
 
+        cache_key = _verdict_cache_key(self._cache_scope, query)
+        cached = _get_cached_verdict(cache_key)
+        if cached is not None:
+            logger.debug("캐시된 시맨틱 판정 사용")
+            return cached
+
+        key = (id(self._llm), self._strict_mode, query)
+        pending = _inflight.get(key)
+        if pending is not None:
+            logger.debug("진행 중인 동일 쿼리 시맨틱 검증 결과 대기")
+            # 대기자가 취소되어도 공유 Future는 취소되지 않도록 shield
+            shared = await asyncio.shield(pending)
+            if shared is _LEADER_CANCELLED:
+                # 다른 요청의 취소는 전파하지 않고 직접 다시 검증 (대기자끼리는 다시 합쳐짐)
+                return await self.validate(query)
+            return shared  # type: ignore[return-value]
+
+        future: asyncio.Future[SemanticValidationResult | object] = (
+            asyncio.get_running_loop().create_future()
+        )
+        _inflight[key] = future
+        try:
+            result = await self._ask_llm(query)
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        except BaseException:
+            # 취소를 대기자에게 전파하지 않도록 Future를 취소하지 않고 표식으로 완료
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        else:
+            future.set_result(result)
+            if result.confidence > CACHEABLE_MIN_CONFIDENCE:
+                _store_verdict(cache_key, result)
+            return result
+        finally:
+            del _inflight[key]
+
+    async def _ask_llm(self, query: str) -> SemanticValidationResult:
+        """
+        LLM에게 쿼리 분석 요청
+
+        LLM 오류는 strict 모드에 따라 차단/허용 결과로 변환되므로 예외를 던지지 않습니다.
+
+        Args:
+            query: 검증할 SQL 쿼리
+
+        Returns:
+            SemanticValidationResult: 검증 결과
+        """
         try:
             # LLM에게 쿼리 분석 요청
             messages = [
@@ -209,6 +287,45 @@ class SemanticValidator:
         return "보안 검증에 실패했습니다. 질문을 다시 작성해주세요."
 
 
+def _llm_identity(llm: BaseChatModel) -> str:
+    """판정 캐시 키에 사용할 LLM 식별자 (프로바이더 클래스와 모델 이름)"""
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+    return f"{type(llm).__name__}:{model}"
+
+
+def _verdict_cache_key(scope: str, query: str) -> bytes:
+    """시맨틱 판정 캐시 키 생성 (모델/strict 모드 범위 + 공백 차이를 무시한 쿼리 해시)"""
+    return hashlib.sha1(f"{scope}\0{normalize_sql(query)}".encode()).digest()
+
+
+def _get_cached_verdict(key: bytes) -> SemanticValidationResult | None:
+    """캐시된 시맨틱 판정 조회 (없거나 만료되었으면 None)"""
+    entry = _verdict_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, result = entry
+    if time.monotonic() >= expires_at:
+        del _verdict_cache[key]
+        return None
+
+    return result
+
+
+def _store_verdict(key: bytes, result: SemanticValidationResult) -> None:
+    """시맨틱 판정 캐시 저장 (최대 항목 수 초과 시 오래된 항목부터 제거)"""
+    _verdict_cache[key] = (time.monotonic() + SEMANTIC_CACHE_TTL_SECONDS, result)
+    _verdict_cache.move_to_end(key)
+    while len(_verdict_cache) > SEMANTIC_CACHE_MAX_ENTRIES:
+        _verdict_cache.popitem(last=False)
+
+
+def clear_semantic_cache() -> None:
+    """시맨틱 판정 캐시 초기화"""
+    _verdict_cache.clear()
+    logger.info("시맨틱 판정 캐시 초기화됨")
+
+
 # 빠른 검증을 위한 패턴 기반 사전 필터
 SUSPICIOUS_PATTERNS = [
     # SQL 인젝션 패턴
@@ -229,6 +346,12 @@ SUSPICIOUS_PATTERNS = [
     r"\blo_export\b",
 ]
 
+# 모든 의심 패턴을 하나의 정규식으로 결합 (패턴마다 그룹 하나, 한 번의 스캔으로 검사)
+_SUSPICIOUS_RE = re.compile(
+    "|".join(f"({pattern})" for pattern in SUSPICIOUS_PATTERNS),
+    re.IGNORECASE,
+)
+
 
 def quick_pattern_check(query: str) -> tuple[bool, str]:
     """
@@ -242,12 +365,67 @@ def quick_pattern_check(query: str) -> tuple[bool, str]:
     Returns:
         (안전 여부, 위험 시 이유)
     """
-    import re
+    match = _SUSPICIOUS_RE.search(query)
+    if match:
+        pattern = SUSPICIOUS_PATTERNS[match.lastindex - 1]
+        return False, f"의심스러운 패턴 감지: {pattern}"
 
-    query_lower = query.lower()
+    return True, ""
 
-    for pattern in SUSPICIOUS_PATTERNS:
-        if re.search(pattern, query_lower):
-            return False, f"의심스러운 패턴 감지: {pattern}"
 
-    return True, ""
+# 단순 쿼리 판정 기준 (선택 컬럼 수가 이 값 미만이어야 LLM 검증 생략 가능)
+SIMPLE_QUERY_MAX_COLUMNS = 5
+
+# 상수로 취급하는 표현식 (양쪽이 모두 상수인 비교는 1=1 같은 항진식)
+_CONSTANT_EXPRESSIONS = (exp.Literal, exp.Boolean, exp.Null)
+
+
+def is_simple_select(query: str) -> bool:
+    """
+    LLM 시맨틱 검증을 생략해도 될 만큼 단순한 SELECT인지 판단
+
+    주석, UNION/CTE, 상수끼리의 비교(1=1 등)가 없는 단일 SELECT 중에서
+    JOIN·서브쿼리·함수 호출이 모두 없고, 컬럼이 5개 미만이며,
+    FROM 절에 실제 테이블이 있는 쿼리만 단순한 쿼리로 봅니다.
+    함수 호출만 있는 쿼리(pg_read_binary_file, pg_sleep 등)는 항상 LLM 검증 대상입니다.
+
+    Args:
+        query: 키워드/스키마/패턴 검사를 통과한 쿼리
+
+    Returns:
+        단순한 쿼리이면 True
+    """
+    # 주석을 이용한 조작 여부는 LLM에게 맡김
+    if "--" in query or "/*" in query:
+        return False
+
+    try:
+        statements = sqlglot.parse(query, read="postgres")
+    except sqlglot.errors.SqlglotError:
+        return False
+
+    if len(statements) != 1 or not isinstance(statements[0], exp.Select):
+        return False
+    select = statements[0]
+
+    if select.find(exp.With, exp.Union, exp.Intersect, exp.Except) is not None:
+        return False
+
+    for predicate in select.find_all(exp.Predicate):
+        if (
+            isinstance(predicate, exp.Binary)
+            and isinstance(predicate.left, _CONSTANT_EXPRESSIONS)
+            and isinstance(predicate.right, _CONSTANT_EXPRESSIONS)
+        ):
+            return False
+
+    from_clause = select.find(exp.From)
+    return (
+        from_clause is not None
+        and isinstance(from_clause.this, exp.Table)
+        and bool(from_clause.this.name)
+        and select.find(exp.Join) is None
+        and all(node is select for node in select.find_all(exp.Select))
+        and len(select.expressions) < SIMPLE_QUERY_MAX_COLUMNS
+        and select.find(exp.Func) is None
+    )
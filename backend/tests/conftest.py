@@ -5,7 +5,7 @@ pytest 설정 및 공통 fixture
 """
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -15,6 +15,7 @@ from httpx import ASGITransport, AsyncClient
 
 from app.config import Settings
 from app.main import app
+from app.models.entities import SchemaColumnInfo, TableInfo
 
 
 @pytest.fixture(scope="session")
@@ -96,6 +97,24 @@ def sample_schema() -> dict[str, Any]:
     }
 
 
+@pytest.fixture
+def make_table() -> Callable[..., TableInfo]:
+    """id 기본키 컬럼 하나를 가진 테스트용 TableInfo 팩토리"""
+
+    def _make_table(name: str, description: str | None = None) -> TableInfo:
+        return TableInfo(
+            name=name,
+            description=description,
+            columns=[
+                SchemaColumnInfo(
+                    name="id", data_type="integer", is_nullable=False, is_primary_key=True
+                ),
+            ],
+        )
+
+    return _make_table
+
+
 @pytest.fixture
 def sample_query_result() -> list[dict[str, Any]]:
     """샘플 쿼리 결과"""
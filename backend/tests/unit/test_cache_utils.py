@@ -0,0 +1,38 @@
+"""
+캐시 유틸리티 단위 테스트
+
+스키마 객체별 캐시의 재사용/무효화 동작을 검증합니다.
+"""
+
+from app.utils.cache import SchemaScopedCache
+
+
+class TestSchemaScopedCache:
+    """SchemaScopedCache 테스트"""
+
+    def test_none_value_is_cached(self) -> None:
+        """None도 유효한 값으로 캐시되어 다시 생성하지 않아야 함"""
+        cache: SchemaScopedCache[str, None] = SchemaScopedCache(max_size=4)
+        schema = object()
+        calls: list[str] = []
+
+        for _ in range(2):
+            cache.get_or_build(schema, "key", lambda: calls.append("build"))
+
+        assert calls == ["build"]
+
+    def test_new_schema_clears_entries(self) -> None:
+        """스키마 객체가 바뀌면 기존 항목을 버려야 함"""
+        cache: SchemaScopedCache[str, int] = SchemaScopedCache(max_size=4)
+        cache.get_or_build(object(), "key", lambda: 1)
+
+        assert cache.get_or_build(object(), "key", lambda: 2) == 2
+
+    def test_full_cache_is_cleared_before_insert(self) -> None:
+        """최대 크기에 도달하면 전체를 비운 뒤 새 항목을 저장해야 함"""
+        cache: SchemaScopedCache[str, int] = SchemaScopedCache(max_size=2)
+        schema = object()
+        for key in ("a", "b", "c"):
+            cache.get_or_build(schema, key, lambda: 0)
+
+        assert list(cache.entries) == ["c"]
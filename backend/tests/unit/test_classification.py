@@ -0,0 +1,35 @@
+"""
+의도 사전 분류 단위 테스트
+
+LLM 호출 없이 키워드로 판별 가능한 입력의 분류 결과를 검증합니다.
+"""
+
+import pytest
+
+from app.agent.nodes.classification import _pre_classify
+
+
+class TestPreClassify:
+    """_pre_classify 테스트"""
+
+    @pytest.mark.parametrize("question", ["안녕", "안녕하세요!", "고마워요", "너는 누구야?"])
+    def test_greetings_are_general(self, question: str) -> None:
+        """인사/정체성 질문은 general로 분류되어야 함"""
+        assert _pre_classify(question) == "general"
+
+    @pytest.mark.parametrize("question", ["지난달 매출 얼마야?", "서울 지역 고객 수 알려줘"])
+    def test_data_questions_are_text2sql(self, question: str) -> None:
+        """데이터 조회 질문은 text2sql로 분류되어야 함"""
+        assert _pre_classify(question) == "text2sql"
+
+    def test_greeting_with_data_request_is_text2sql(self) -> None:
+        """인사와 데이터 요청이 섞이면 text2sql로 분류되어야 함"""
+        assert _pre_classify("안녕, 재고 현황 보여줘") == "text2sql"
+
+    def test_ambiguous_question_falls_through(self) -> None:
+        """키워드로 판단할 수 없는 질문은 None (LLM 분류)"""
+        assert _pre_classify("오늘 날씨 어때?") is None
+
+    def test_long_question_falls_through(self) -> None:
+        """긴 질문은 키워드가 있어도 LLM으로 분류해야 함"""
+        assert _pre_classify("매출 " * 40) is None
@@ -0,0 +1,70 @@
+"""
+디버그 컨텍스트 리듀서 단위 테스트
+
+debug 채널 리듀서의 누적/교체 동작을 테스트합니다.
+"""
+
+from app.agent.state import (
+    NodeTiming,
+    create_initial_debug,
+    merge_debug_context,
+)
+
+
+def _timing(node_name: str) -> NodeTiming:
+    """테스트용 타이밍 항목 생성"""
+    return NodeTiming(
+        node_name=node_name,
+        start_time=0.0,
+        end_time=1.0,
+        duration_ms=1000.0,
+    )
+
+
+class TestMergeDebugContext:
+    """merge_debug_context 테스트"""
+
+    def test_delta_appends_node_timings(self) -> None:
+        """부분 업데이트의 타이밍은 기존 목록 뒤에 추가되어야 함"""
+        current = create_initial_debug("trace-1")
+        current = merge_debug_context(current, {"node_timings": [_timing("a")]})
+        current = merge_debug_context(current, {"node_timings": [_timing("b")]})
+
+        assert [t["node_name"] for t in current["node_timings"]] == ["a", "b"]
+        assert current["trace_id"] == "trace-1"
+
+    def test_delta_keeps_other_lists(self) -> None:
+        """타이밍만 담긴 업데이트는 다른 목록을 유지해야 함"""
+        current = create_initial_debug("trace-1")
+        current = merge_debug_context(
+            current,
+            {"retry_history": [{"node_name": "a", "attempt": 2, "reason": "", "timestamp": 0.0}]},
+        )
+        current = merge_debug_context(current, {"node_timings": [_timing("a")]})
+
+        assert len(current["retry_history"]) == 1
+        assert len(current["node_timings"]) == 1
+
+    def test_initial_context_replaces_previous_request(self) -> None:
+        """trace_id가 포함된 업데이트(새 요청)는 이전 기록을 교체해야 함"""
+        current = create_initial_debug("trace-1")
+        current = merge_debug_context(current, {"node_timings": [_timing("a")]})
+
+        current = merge_debug_context(current, create_initial_debug("trace-2"))
+
+        assert current["trace_id"] == "trace-2"
+        assert current["node_timings"] == []
+
+    def test_empty_update_returns_current(self) -> None:
+        """빈 업데이트는 현재 값을 그대로 반환해야 함"""
+        current = create_initial_debug("trace-1")
+        assert merge_debug_context(current, {}) is current
+
+    def test_untouched_lists_are_reused(self) -> None:
+        """업데이트에 없는 목록은 새로 할당하지 않고 기존 객체를 재사용해야 함"""
+        current = create_initial_debug("trace-1")
+        error_chain = current["error_chain"]
+
+        merged = merge_debug_context(current, {"node_timings": [_timing("a")]})
+
+        assert merged["error_chain"] is error_chain
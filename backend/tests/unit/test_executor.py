@@ -0,0 +1,44 @@
+"""
+안전한 쿼리 실행기 단위 테스트
+
+행 값의 JSON 기본 타입 변환을 검증합니다.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from asyncpg.pgproto.pgproto import UUID as PgUUID
+
+from app.database.executor import _sanitize_row_values
+
+
+class TestSanitizeRowValues:
+    """_sanitize_row_values 테스트"""
+
+    def test_converts_non_json_types(self) -> None:
+        """Decimal/datetime/UUID는 JSON 기본 타입으로 변환되어야 함"""
+        value = UUID("12345678-1234-5678-1234-567812345678")
+        row = {
+            "price": Decimal("12.50"),
+            "qty": Decimal("3"),
+            "created_at": datetime(2024, 1, 1, 9, 30),
+            "id": value,
+            "name": "item",
+        }
+
+        assert _sanitize_row_values(row) == {
+            "price": 12.5,
+            "qty": 3,
+            "created_at": "2024-01-01 09:30:00",
+            "id": str(value),
+            "name": "item",
+        }
+
+    def test_converts_asyncpg_uuid_subclass(self) -> None:
+        """asyncpg가 반환하는 UUID 하위 클래스도 문자열로 변환되어야 함"""
+        text = "12345678-1234-5678-1234-567812345678"
+        value = PgUUID(text)
+        assert type(value) is not UUID
+
+        assert _sanitize_row_values({"id": value}) == {"id": text}
@@ -0,0 +1,68 @@
+"""
+JWT 토큰 단위 테스트
+
+토큰 검증 결과 캐시 동작을 검증합니다.
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.auth import jwt as jwt_module
+from app.auth.jwt import clear_token_cache, create_access_token, verify_token
+
+
+@pytest.fixture(autouse=True)
+def jwt_settings():
+    """JWT 설정 패치 및 테스트 간 캐시 초기화"""
+    settings = MagicMock(
+        jwt_secret_key="test-secret",
+        jwt_algorithm="HS256",
+        access_token_expire_minutes=30,
+    )
+    clear_token_cache()
+    with patch("app.auth.jwt.get_settings", return_value=settings):
+        yield settings
+    clear_token_cache()
+
+
+class TestVerifyTokenCache:
+    """verify_token 캐시 테스트"""
+
+    def test_repeated_verification_skips_decode(self) -> None:
+        """같은 토큰을 다시 검증하면 서명 검증을 생략해야 함"""
+        token = create_access_token({"sub": 1, "roles": ["viewer"]})
+
+        with patch.object(jwt_module.jwt, "decode", wraps=jwt_module.jwt.decode) as decode:
+            first = verify_token(token)
+            second = verify_token(token)
+
+        assert decode.call_count == 1
+        assert first == second
+        assert first is not None and first["sub"] == 1
+
+    def test_cached_payload_is_not_shared(self) -> None:
+        """반환된 페이로드를 수정해도 캐시에 영향이 없어야 함"""
+        token = create_access_token({"sub": 1})
+        verify_token(token)["sub"] = 999
+        assert verify_token(token)["sub"] == 1
+
+    def test_token_type_is_part_of_key(self) -> None:
+        """access 토큰은 refresh 타입 검증에서 캐시로 통과하지 않아야 함"""
+        token = create_access_token({"sub": 1})
+        assert verify_token(token, token_type="access") is not None
+        assert verify_token(token, token_type="refresh") is None
+
+    def test_expired_token_is_not_served_from_cache(self) -> None:
+        """토큰 만료 시각이 지나면 캐시 대신 다시 검증해야 함"""
+        token = create_access_token({"sub": 1}, expires_delta=timedelta(seconds=5))
+        assert verify_token(token) is not None
+
+        with (
+            patch("app.auth.jwt.time.time", return_value=1e12),
+            patch.object(jwt_module.jwt, "decode", wraps=jwt_module.jwt.decode) as decode,
+        ):
+            verify_token(token)
+
+        assert decode.call_count == 1
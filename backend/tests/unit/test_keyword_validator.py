@@ -180,6 +180,12 @@ class TestKeywordValidator:
         assert result.is_valid is False
         assert "DROP" in result.detected_keywords
 
+    def test_line_comment_inside_block_comment(self, validator: KeywordValidator) -> None:
+        """블록 주석 안의 -- 가 뒤따르는 키워드를 숨기지 않아야 함"""
+        result = validator.validate("/* -- */ DROP TABLE users")
+        assert result.is_valid is False
+        assert "DROP" in result.detected_keywords
+
     def test_detect_union_based_injection(self, validator: KeywordValidator) -> None:
         """UNION 기반 쿼리는 허용 (SELECT만 있으면)"""
         query = "SELECT name FROM users UNION SELECT password FROM credentials"
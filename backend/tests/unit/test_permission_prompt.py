@@ -0,0 +1,74 @@
+"""
+권한 사전 검사 프롬프트 단위 테스트
+
+스키마/권한 조합별 프롬프트 생성과 캐시 동작을 검증합니다.
+"""
+
+from collections.abc import Callable
+
+import pytest
+
+from app.agent.nodes.permission_pre_check import _get_permission_prompt
+from app.models.entities import DatabaseSchema, TableInfo
+
+
+@pytest.fixture
+def sample_schema(make_table: Callable[..., TableInfo]) -> DatabaseSchema:
+    """테스트용 샘플 스키마"""
+    return DatabaseSchema(
+        version="test-v1",
+        tables=[
+            make_table("orders", "주문 테이블"),
+            make_table("products", "상품 테이블"),
+            make_table("salaries"),
+        ],
+    )
+
+
+class TestPermissionPrompt:
+    """_get_permission_prompt 테스트"""
+
+    def test_prompt_lists_accessible_and_inaccessible_tables(
+        self, sample_schema: DatabaseSchema
+    ) -> None:
+        """접근 가능/불가 테이블이 각각 프롬프트에 포함되어야 함"""
+        prompt = _get_permission_prompt(sample_schema, frozenset({"orders", "products"}))
+
+        assert prompt is not None
+        accessible_block, inaccessible_block = prompt.split("## 접근 불가 테이블")
+        assert "- orders: 주문 테이블" in accessible_block
+        assert "- salaries" in inaccessible_block
+        assert "orders" not in inaccessible_block
+
+    def test_returns_none_when_all_tables_accessible(
+        self, sample_schema: DatabaseSchema
+    ) -> None:
+        """모든 테이블에 접근 가능하면 None을 반환해야 함"""
+        prompt = _get_permission_prompt(
+            sample_schema, frozenset({"orders", "products", "salaries"})
+        )
+        assert prompt is None
+
+    def test_same_key_returns_cached_prompt(self, sample_schema: DatabaseSchema) -> None:
+        """같은 스키마/권한 조합은 캐시된 프롬프트를 반환해야 함"""
+        key = frozenset({"orders"})
+        first = _get_permission_prompt(sample_schema, key)
+        second = _get_permission_prompt(sample_schema, key)
+        assert first is second
+
+    def test_new_schema_invalidates_cache(
+        self, sample_schema: DatabaseSchema, make_table: Callable[..., TableInfo]
+    ) -> None:
+        """스키마가 새로 조회되면 프롬프트를 다시 생성해야 함"""
+        key = frozenset({"orders"})
+        _get_permission_prompt(sample_schema, key)
+
+        new_schema = DatabaseSchema(
+            version="test-v2",
+            tables=[make_table("orders"), make_table("invoices")],
+        )
+        prompt = _get_permission_prompt(new_schema, key)
+
+        assert prompt is not None
+        assert "invoices" in prompt
+        assert "salaries" not in prompt
@@ -0,0 +1,118 @@
+"""
+쿼리 결과 캐시 단위 테스트
+
+권한 범위별 키 분리, TTL 만료 동작을 검증합니다.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.database import query_cache
+from app.database.query_cache import (
+    get_cached_result,
+    make_cache_key,
+    run_coalesced,
+    store_result,
+)
+from app.models.entities import QueryResult
+
+
+@pytest.fixture(autouse=True)
+def cache_settings():
+    """캐시 설정 패치 및 테스트 간 캐시 초기화"""
+    settings = MagicMock(query_cache_ttl_seconds=60, query_cache_max_entries=2)
+    query_cache._cache.clear()
+    with patch("app.database.query_cache.get_settings", return_value=settings):
+        yield settings
+    query_cache._cache.clear()
+
+
+class TestQueryResultCache:
+    """캐시 조회/저장 테스트"""
+
+    def test_key_depends_on_permission_scope(self) -> None:
+        """접근 가능 테이블이 다르면 다른 키를 사용해야 함"""
+        query = "SELECT * FROM orders"
+        assert make_cache_key(query, ["orders"]) != make_cache_key(query, ["orders", "users"])
+        assert make_cache_key(query, ["Orders"]) == make_cache_key(query, ["orders"])
+
+    def test_store_and_get(self) -> None:
+        """저장한 결과를 조회할 수 있어야 함"""
+        result = QueryResult(query_id="q1", total_row_count=1)
+        store_result("key", result)
+        assert get_cached_result("key") is result
+
+    def test_expired_entry_is_dropped(self) -> None:
+        """TTL이 지난 항목은 조회되지 않아야 함"""
+        store_result("key", QueryResult(query_id="q1"))
+        with patch("app.database.query_cache.time.monotonic", return_value=1e12):
+            assert get_cached_result("key") is None
+
+    def test_oldest_entry_evicted_over_capacity(self) -> None:
+        """최대 항목 수를 넘으면 가장 오래된 항목이 제거되어야 함"""
+        for i in range(3):
+            store_result(f"key{i}", QueryResult(query_id=str(i)))
+        assert get_cached_result("key0") is None
+        assert get_cached_result("key2") is not None
+
+    def test_zero_ttl_disables_cache(self, cache_settings: MagicMock) -> None:
+        """TTL이 0이면 저장하지 않아야 함"""
+        cache_settings.query_cache_ttl_seconds = 0
+        store_result("key", QueryResult(query_id="q1"))
+        assert get_cached_result("key") is None
+
+
+class TestRunCoalesced:
+    """동시 실행 합치기 테스트"""
+
+    async def test_concurrent_calls_execute_once(self) -> None:
+        """같은 키로 동시에 호출하면 한 번만 실행해야 함"""
+        calls = 0
+        result = QueryResult(query_id="q1")
+
+        async def execute() -> QueryResult:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return result
+
+        results = await asyncio.gather(*(run_coalesced("key", execute) for _ in range(5)))
+
+        assert calls == 1
+        assert all(r is result for r in results)
+        assert query_cache._inflight == {}
+
+    async def test_failure_propagates_to_waiters(self) -> None:
+        """실행이 실패하면 대기자 모두 같은 예외를 받아야 함"""
+
+        async def execute() -> QueryResult:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(run_coalesced("key", execute) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert query_cache._inflight == {}
+
+    async def test_leader_cancellation_does_not_cancel_waiters(self) -> None:
+        """실행한 호출자가 취소되어도 대기자는 직접 다시 실행해 결과를 받아야 함"""
+        result = QueryResult(query_id="q1")
+
+        async def execute() -> QueryResult:
+            await asyncio.sleep(0.05)
+            return result
+
+        leader = asyncio.create_task(run_coalesced("key", execute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(run_coalesced("key", execute))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower is result
+        assert leader.cancelled()
+        assert query_cache._inflight == {}
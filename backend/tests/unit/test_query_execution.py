@@ -0,0 +1,88 @@
+"""
+쿼리 실행 노드 단위 테스트
+
+실행 전 LIMIT 자동 추가 동작과 잘린 결과의 행 수 보정을 검증합니다.
+"""
+
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.agent.nodes import query_execution
+from app.agent.nodes.query_execution import ensure_limit, query_execution_node
+from app.agent.state import Text2SQLAgentState
+from app.models.entities import QueryResult
+
+
+def _state(query: str) -> Text2SQLAgentState:
+    """실행 노드에 필요한 최소 상태"""
+    return cast("Text2SQLAgentState", {"generation": {"generated_query": query}, "auth": {}})
+
+
+class TestEnsureLimit:
+    """ensure_limit 테스트"""
+
+    def test_injects_limit_when_missing(self) -> None:
+        """LIMIT이 없는 SELECT에는 LIMIT이 추가되어야 함"""
+        query, injected = ensure_limit("SELECT * FROM orders", 100)
+        assert injected is True
+        assert query.upper().endswith("LIMIT 100")
+
+    def test_keeps_existing_limit(self) -> None:
+        """이미 LIMIT이 있으면 원본 쿼리를 유지해야 함"""
+        original = "SELECT * FROM orders LIMIT 5"
+        assert ensure_limit(original, 100) == (original, False)
+
+    def test_subquery_limit_does_not_count(self) -> None:
+        """서브쿼리의 LIMIT은 최상위 LIMIT으로 보지 않아야 함"""
+        query, injected = ensure_limit(
+            "SELECT * FROM (SELECT id FROM orders LIMIT 5) AS t", 100
+        )
+        assert injected is True
+        assert query.upper().endswith("LIMIT 100")
+
+    def test_unparseable_query_is_unchanged(self) -> None:
+        """파싱할 수 없는 쿼리는 그대로 반환해야 함"""
+        original = "SELECT * FROM ("
+        assert ensure_limit(original, 100) == (original, False)
+
+    @pytest.mark.parametrize("original", ["SELECT 'abc FROM t", "SELECT $$x FROM t"])
+    def test_untokenizable_query_is_unchanged(self, original: str) -> None:
+        """토큰화할 수 없는 쿼리도 예외 없이 그대로 반환해야 함"""
+        assert ensure_limit(original, 100) == (original, False)
+
+
+class TestQueryExecutionNode:
+    """query_execution_node 테스트"""
+
+    @pytest.mark.parametrize(
+        ("fetched", "expected_total", "expected_truncated"),
+        [(4, 3, True), (3, 3, False), (2, 2, False)],
+    )
+    async def test_injected_limit_row_count_is_clamped(
+        self, fetched: int, expected_total: int, expected_truncated: bool
+    ) -> None:
+        """자동 LIMIT의 여분 행은 행 수에서 빼고 잘림 여부로만 남아야 함"""
+        result = QueryResult(
+            query_id="",
+            rows=[{"id": i} for i in range(min(fetched, 3))],
+            total_row_count=fetched,
+            returned_row_count=min(fetched, 3),
+            is_truncated=fetched > 3,
+        )
+        with (
+            patch.object(
+                query_execution,
+                "get_settings",
+                MagicMock(return_value=MagicMock(max_result_rows=3)),
+            ),
+            patch.object(query_execution, "get_cached_result", MagicMock(return_value=None)),
+            patch.object(query_execution, "run_coalesced", AsyncMock(return_value=result)),
+        ):
+            output = await query_execution_node(_state("SELECT id FROM orders"))
+
+        execution = cast("dict[str, object]", output["execution"])
+        assert execution["limit_injected"] is True
+        assert execution["total_row_count"] == expected_total
+        assert execution["is_truncated"] is expected_truncated
@@ -0,0 +1,102 @@
+"""
+쿼리 검증 노드 단위 테스트
+
+검증 결과 메모가 결정적인 결과만 provider별로 재사용하는지 검증합니다.
+"""
+
+from collections.abc import Generator
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.agent.nodes import query_validation
+from app.agent.nodes.query_validation import (
+    ValidationPipelineResult,
+    _validate_with_schema,
+    clear_validation_cache,
+)
+from app.agent.state import Text2SQLAgentState
+
+QUERY = "SELECT id FROM orders"
+
+
+@pytest.fixture(autouse=True)
+def clean_validation_cache() -> Generator[None, None, None]:
+    """테스트 간 검증 결과 메모 초기화"""
+    clear_validation_cache()
+    yield
+    clear_validation_cache()
+
+
+def _state(llm_provider: str = "openai") -> Text2SQLAgentState:
+    """검증 노드에 필요한 최소 상태"""
+    return cast("Text2SQLAgentState", {"input": {"llm_provider": llm_provider}})
+
+
+def _semantic_result(*, is_valid: bool, confidence: float) -> ValidationPipelineResult:
+    """시맨틱 단계까지 진행된 파이프라인 결과"""
+    return ValidationPipelineResult(
+        is_valid=is_valid,
+        blocked_at_layer=None if is_valid else "semantic",
+        error_message="" if is_valid else "차단",
+        details={"confidence": confidence},
+    )
+
+
+@pytest.fixture
+def pipeline() -> Generator[AsyncMock, None, None]:
+    """스키마/LLM/설정을 고정하고 검증 파이프라인을 모의 객체로 대체"""
+    pipeline = AsyncMock()
+    schema = MagicMock(version="v1")
+    settings = MagicMock(skip_semantic_for_simple_queries=False)
+    with (
+        patch.object(query_validation, "_get_schema_cached", AsyncMock(return_value=schema)),
+        patch.object(query_validation, "get_llm", MagicMock()),
+        patch.object(query_validation, "get_settings", MagicMock(return_value=settings)),
+        patch.object(query_validation, "validate_query_pipeline", pipeline),
+    ):
+        yield pipeline
+
+
+class TestValidationMemo:
+    """검증 결과 메모 테스트"""
+
+    @pytest.mark.parametrize("is_valid", [True, False])
+    async def test_llm_error_result_is_not_memoized(
+        self, pipeline: AsyncMock, is_valid: bool
+    ) -> None:
+        """LLM 오류로 인한 판정(신뢰도 0.0)은 재시도 시 다시 검증해야 함"""
+        pipeline.return_value = _semantic_result(is_valid=is_valid, confidence=0.0)
+
+        await _validate_with_schema(_state(), QUERY)
+        await _validate_with_schema(_state(), QUERY)
+
+        assert pipeline.await_count == 2
+
+    async def test_confident_verdict_is_memoized_per_provider(
+        self, pipeline: AsyncMock
+    ) -> None:
+        """확실한 판정은 같은 provider에서만 재사용해야 함"""
+        pipeline.return_value = _semantic_result(is_valid=True, confidence=0.9)
+
+        await _validate_with_schema(_state("openai"), QUERY)
+        await _validate_with_schema(_state("openai"), QUERY)
+        assert pipeline.await_count == 1
+
+        await _validate_with_schema(_state("anthropic"), QUERY)
+        assert pipeline.await_count == 2
+
+    async def test_schema_block_is_memoized(self, pipeline: AsyncMock) -> None:
+        """스키마 차단은 결정적이므로 메모해야 함"""
+        pipeline.return_value = ValidationPipelineResult(
+            is_valid=False,
+            blocked_at_layer="schema",
+            error_message="테이블 없음",
+            details={},
+        )
+
+        await _validate_with_schema(_state(), QUERY)
+        await _validate_with_schema(_state(), QUERY)
+
+        assert pipeline.await_count == 1
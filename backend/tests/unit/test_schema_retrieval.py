@@ -0,0 +1,56 @@
+"""
+스키마 조회 노드 단위 테스트
+
+권한 범위별 스키마 필터링과 페이로드 캐시 동작을 검증합니다.
+"""
+
+from collections.abc import Callable
+
+import pytest
+
+from app.agent.nodes.schema_retrieval import (
+    _get_schema_payload,
+    filter_schema_by_accessible_tables,
+)
+from app.models.entities import DatabaseSchema, TableInfo
+
+
+@pytest.fixture
+def sample_schema(make_table: Callable[..., TableInfo]) -> DatabaseSchema:
+    """테스트용 샘플 스키마"""
+    return DatabaseSchema(
+        version="test-v1",
+        tables=[make_table("Orders"), make_table("products"), make_table("salaries")],
+    )
+
+
+class TestFilterSchema:
+    """filter_schema_by_accessible_tables 테스트"""
+
+    def test_filters_case_insensitively(self, sample_schema: DatabaseSchema) -> None:
+        """대소문자와 무관하게 접근 가능한 테이블만 남겨야 함"""
+        filtered = filter_schema_by_accessible_tables(sample_schema, ["orders", "PRODUCTS"])
+        assert [t.name for t in filtered.tables] == ["Orders", "products"]
+
+
+class TestSchemaPayload:
+    """_get_schema_payload 테스트"""
+
+    def test_payload_is_cached_per_scope(self, sample_schema: DatabaseSchema) -> None:
+        """같은 스키마/권한 범위에는 같은 페이로드를 재사용해야 함"""
+        scope = frozenset({"orders"})
+        first = _get_schema_payload(sample_schema, ["orders"], scope)
+        assert first[1] == ("Orders",)
+        assert _get_schema_payload(sample_schema, ["orders"], scope) is first
+
+    def test_new_schema_invalidates_cache(self, sample_schema: DatabaseSchema) -> None:
+        """스키마 객체가 바뀌면 페이로드를 다시 생성해야 함"""
+        scope = frozenset({"orders"})
+        first = _get_schema_payload(sample_schema, ["orders"], scope)
+        refreshed = sample_schema.model_copy()
+        assert _get_schema_payload(refreshed, ["orders"], scope) is not first
+
+    def test_unfiltered_payload_includes_all_tables(self, sample_schema: DatabaseSchema) -> None:
+        """권한 필터가 없으면 전체 테이블을 포함해야 함"""
+        _, table_names = _get_schema_payload(sample_schema, [], None)
+        assert table_names == ("Orders", "products", "salaries")
@@ -7,7 +7,11 @@ SQL 쿼리에서 참조하는 테이블/컬럼이 실제 스키마에 존재하
 import pytest
 
 from app.models.entities import DatabaseSchema, TableInfo, SchemaColumnInfo
-from app.validation.schema_validator import SchemaValidator, ValidationResult
+from app.validation.schema_validator import (
+    SchemaValidator,
+    ValidationResult,
+    get_schema_validator,
+)
 
 
 @pytest.fixture
@@ -262,3 +266,17 @@ class TestSchemaValidatorHelpers:
         assert validator.column_exists("users", "id") is True
         assert validator.column_exists("users", "fake") is False
         assert validator.column_exists("fake", "id") is False
+
+
+class TestGetSchemaValidator:
+    """get_schema_validator 캐시 테스트"""
+
+    def test_reuses_validator_for_same_schema(self, sample_schema: DatabaseSchema) -> None:
+        """같은 스키마 객체에는 같은 검증기를 반환해야 함"""
+        assert get_schema_validator(sample_schema) is get_schema_validator(sample_schema)
+
+    def test_rebuilds_for_new_schema(self, sample_schema: DatabaseSchema) -> None:
+        """스키마 객체가 바뀌면 새 검증기를 만들어야 함"""
+        first = get_schema_validator(sample_schema)
+        refreshed = sample_schema.model_copy()
+        assert get_schema_validator(refreshed) is not first
@@ -0,0 +1,185 @@
+"""
+시맨틱 쿼리 검증기 단위 테스트
+
+동시에 들어온 동일 쿼리의 LLM 호출 합치기, 판정 캐시, 단순 쿼리 판정을 검증합니다.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.validation import semantic_validator
+from app.validation.semantic_validator import (
+    SemanticValidator,
+    clear_semantic_cache,
+    is_simple_select,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_verdict_cache():
+    """테스트 간 시맨틱 판정 캐시 초기화"""
+    clear_semantic_cache()
+    yield
+    clear_semantic_cache()
+
+
+class TestSemanticValidatorCoalescing:
+    """동시 검증 합치기 테스트"""
+
+    async def test_concurrent_same_query_calls_llm_once(self) -> None:
+        """같은 쿼리를 동시에 검증하면 LLM을 한 번만 호출해야 함"""
+
+        async def respond(_messages: object) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return MagicMock(content="SAFE")
+
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(side_effect=respond)
+        validator = SemanticValidator(llm)
+
+        results = await asyncio.gather(
+            *(validator.validate("SELECT * FROM orders") for _ in range(3))
+        )
+
+        assert llm.ainvoke.await_count == 1
+        assert all(r.is_valid for r in results)
+        assert semantic_validator._inflight == {}
+
+    async def test_different_queries_are_not_merged(self) -> None:
+        """다른 쿼리는 각각 LLM을 호출해야 함"""
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value=MagicMock(content="SAFE"))
+        validator = SemanticValidator(llm)
+
+        await asyncio.gather(
+            validator.validate("SELECT * FROM orders"),
+            validator.validate("SELECT * FROM users"),
+        )
+
+        assert llm.ainvoke.await_count == 2
+
+
+    async def test_leader_cancellation_does_not_cancel_waiters(self) -> None:
+        """검증한 호출자가 취소되어도 대기자는 직접 다시 검증해 결과를 받아야 함"""
+
+        async def respond(_messages: object) -> MagicMock:
+            await asyncio.sleep(0.05)
+            return MagicMock(content="SAFE")
+
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(side_effect=respond)
+        validator = SemanticValidator(llm)
+
+        leader = asyncio.create_task(validator.validate("SELECT * FROM orders"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(validator.validate("SELECT * FROM orders"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert (await follower).is_valid is True
+        assert leader.cancelled()
+        assert semantic_validator._inflight == {}
+
+    async def test_error_propagates_to_waiters(self) -> None:
+        """검증 중 예외는 대기자에게 취소가 아닌 같은 예외로 전달되어야 함"""
+
+        async def fail(_query: str) -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        validator = SemanticValidator(MagicMock())
+        with patch.object(validator, "_ask_llm", side_effect=fail):
+            results = await asyncio.gather(
+                *(validator.validate("SELECT * FROM orders") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert semantic_validator._inflight == {}
+
+
+class TestSemanticVerdictCache:
+    """시맨틱 판정 캐시 테스트"""
+
+    async def test_repeated_query_uses_cached_verdict(self) -> None:
+        """공백만 다른 같은 쿼리는 캐시된 판정을 재사용해야 함"""
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value=MagicMock(content="UNSAFE: 시스템 테이블 접근"))
+        validator = SemanticValidator(llm)
+
+        first = await validator.validate("SELECT * FROM orders")
+        second = await validator.validate("SELECT *\n  FROM orders;")
+
+        assert llm.ainvoke.await_count == 1
+        assert second is first
+
+    async def test_verdict_is_scoped_to_strict_mode(self) -> None:
+        """strict 모드가 다른 검증기는 캐시된 판정을 공유하지 않아야 함"""
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value=MagicMock(content="SAFE"))
+
+        await SemanticValidator(llm, strict_mode=False).validate("SELECT * FROM orders")
+        await SemanticValidator(llm, strict_mode=True).validate("SELECT * FROM orders")
+
+        assert llm.ainvoke.await_count == 2
+
+    async def test_llm_error_is_not_cached(self) -> None:
+        """LLM 오류로 인한 차단 결과는 캐시하지 않아야 함"""
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(
+            side_effect=[RuntimeError("timeout"), MagicMock(content="SAFE")]
+        )
+        validator = SemanticValidator(llm)
+
+        assert (await validator.validate("SELECT * FROM orders")).is_valid is False
+        assert (await validator.validate("SELECT * FROM orders")).is_valid is True
+
+
+class TestIsSimpleSelect:
+    """is_simple_select 테스트"""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT id, name FROM users WHERE id = 1",
+            "SELECT * FROM orders ORDER BY created_at DESC LIMIT 10",
+            "SELECT status FROM orders WHERE total > 100",
+        ],
+    )
+    def test_simple_queries(self, query: str) -> None:
+        """단순한 조회 쿼리는 단순 쿼리로 판정해야 함"""
+        assert is_simple_select(query) is True
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT * FROM users WHERE 1=1",
+            "SELECT * FROM users -- comment",
+            "SELECT id FROM users UNION SELECT id FROM orders",
+            "WITH t AS (SELECT id FROM users) SELECT * FROM t",
+            "SELECT COUNT(*) FROM users u JOIN orders o ON u.id = o.user_id "
+            "WHERE o.total > (SELECT AVG(total) FROM orders)",
+            "SELECT id FROM users WHERE id IN (SELECT user_id FROM orders)",
+            "SELECT SUM(total) FROM orders",
+        ],
+    )
+    def test_non_simple_queries(self, query: str) -> None:
+        """항진식/주석/UNION/CTE/복잡한 쿼리는 LLM 검증 대상이어야 함"""
+        assert is_simple_select(query) is False
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT pg_read_binary_file('/etc/passwd')",
+            "SELECT current_setting('data_directory')",
+            "SELECT pg_sleep(100)",
+            "SELECT inet_server_addr(), current_user",
+            "SELECT * FROM generate_series(1, 10)",
+        ],
+    )
+    def test_function_only_queries_are_not_simple(self, query: str) -> None:
+        """테이블 없이 함수만 호출하는 쿼리는 LLM 검증을 생략하면 안 됨"""
+        assert is_simple_select(query) is False
@@ -0,0 +1,20 @@
+"""
+SQL 문자열 유틸리티 단위 테스트
+
+캐시 키용 SQL 정규화를 검증합니다.
+"""
+
+from app.utils.sql import normalize_sql
+
+
+class TestNormalizeSql:
+    """normalize_sql 테스트"""
+
+    def test_collapses_whitespace_and_trailing_semicolon(self) -> None:
+        """공백과 끝 세미콜론 차이는 같은 쿼리로 정규화되어야 함"""
+        assert normalize_sql("SELECT *\n  FROM t;") == normalize_sql("SELECT * FROM t")
+
+    def test_preserves_string_literals(self) -> None:
+        """문자열 리터럴 내부의 공백과 대소문자는 유지되어야 함"""
+        normalized = normalize_sql("SELECT * FROM t WHERE city = 'New  York'")
+        assert "'New  York'" in normalized
@@ -0,0 +1,58 @@
+"""
+SSE 프레임 묶음 전송 단위 테스트
+
+연속으로 생성된 프레임을 한 번의 쓰기로 묶는 동작을 검증합니다.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+from app.api.routes import chat
+from app.api.routes.chat import _coalesce_sse_frames
+
+
+class TestCoalesceSseFrames:
+    """_coalesce_sse_frames 테스트"""
+
+    async def test_back_to_back_frames_share_one_write(self) -> None:
+        """연속 프레임은 이벤트 경계를 유지한 채 한 번에 전송되어야 함"""
+
+        async def frames() -> AsyncGenerator[dict[str, str], None]:
+            for i in range(3):
+                yield {"event": "message", "data": str(i)}
+
+        chunks = [chunk async for chunk in _coalesce_sse_frames(frames())]
+
+        assert len(chunks) == 1
+        assert chunks[0].count(b"data: ") == 3
+        assert chunks[0].index(b"data: 0") < chunks[0].index(b"data: 2")
+
+    async def test_late_frame_is_sent_separately(self) -> None:
+        """대기 시간 이후 도착한 프레임은 별도로 전송되어야 함"""
+
+        async def frames() -> AsyncGenerator[dict[str, str], None]:
+            yield {"event": "message", "data": "first"}
+            await asyncio.sleep(chat.SSE_FLUSH_SECONDS * 10)
+            yield {"event": "message", "data": "second"}
+
+        chunks = [chunk async for chunk in _coalesce_sse_frames(frames())]
+
+        assert len(chunks) == 2
+        assert b"first" in chunks[0] and b"second" in chunks[1]
+
+    async def test_slow_consumer_bounds_buffered_frames(self) -> None:
+        """소비가 느려도 생성기가 큐 크기 이상 앞서 나가지 않아야 함"""
+        produced = 0
+
+        async def frames() -> AsyncGenerator[dict[str, str], None]:
+            nonlocal produced
+            for i in range(chat.SSE_MAX_FRAMES_PER_FLUSH * 10):
+                produced += 1
+                yield {"event": "message", "data": str(i)}
+
+        stream = _coalesce_sse_frames(frames())
+        await anext(stream)
+        await asyncio.sleep(chat.SSE_FLUSH_SECONDS * 4)
+
+        assert produced <= chat.SSE_MAX_FRAMES_PER_FLUSH * 2 + 1
+        await stream.aclose()
@@ -0,0 +1,33 @@
+"""
+쿼리 테이블 추출 단위 테스트
+
+extract_tables_from_query의 추출 결과와 정규화 기반 캐시 동작을 검증합니다.
+"""
+
+from app.auth.permissions import _extract_tables_cached, extract_tables_from_query
+
+
+class TestExtractTablesFromQuery:
+    """extract_tables_from_query 테스트"""
+
+    def test_extracts_joined_tables_lowercase(self) -> None:
+        """JOIN된 테이블을 소문자로 추출해야 함"""
+        tables = extract_tables_from_query(
+            "SELECT * FROM Orders o JOIN users u ON o.user_id = u.id"
+        )
+        assert sorted(tables) == ["orders", "users"]
+
+    def test_whitespace_variants_share_cache_entry(self) -> None:
+        """공백/세미콜론만 다른 쿼리는 한 번만 파싱해야 함"""
+        _extract_tables_cached.cache_clear()
+        extract_tables_from_query("SELECT * FROM orders")
+        extract_tables_from_query("SELECT *\n  FROM orders;")
+        info = _extract_tables_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_returned_list_does_not_affect_cache(self) -> None:
+        """반환된 목록을 수정해도 캐시된 결과는 바뀌지 않아야 함"""
+        tables = extract_tables_from_query("SELECT * FROM orders")
+        tables.append("users")
+        assert extract_tables_from_query("SELECT * FROM orders") == ["orders"]
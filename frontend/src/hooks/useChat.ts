@@ -165,6 +165,7 @@ export function useChat(options: UseChatOptions = {}): UseChatReturn {
 
       let queryPreview: { query: string; explanation: string; queryId: string } | undefined;
       let queryResult: QueryResultData | undefined;
+      const resultRows: Record<string, unknown>[] = [];
       let hasError = false;
 
       try {
@@ -230,8 +231,20 @@ export function useChat(options: UseChatOptions = {}): UseChatReturn {
               onConfirmationRequired?.(event.query_id, event.query, event.explanation);
             },
 
-            onResult: (event) => {
-              queryResult = event.data;
+            onRowBatch: (event) => {
+              // 결과 행은 배치로 나뉘어 도착하므로 메타데이터가 올 때까지 누적
+              resultRows.push(...event.rows);
+            },
+
+            onResultMeta: (event) => {
+              queryResult = {
+                rows: resultRows,
+                total_row_count: event.total_row_count,
+                returned_row_count: event.returned_row_count,
+                columns: event.columns,
+                is_truncated: event.is_truncated,
+                execution_time_ms: event.execution_time_ms,
+              };
             },
 
             onError: (event) => {
@@ -109,7 +109,8 @@ export interface SSEEventHandlers {
   onQueryPreview?: (event: Extract<ChatStreamEvent, { type: 'query_preview' }>) => void;
   onConfirmRequired?: (event: Extract<ChatStreamEvent, { type: 'confirm_required' }>) => void;
   onConfirmationRequired?: (event: Extract<ChatStreamEvent, { type: 'confirmation_required' }>) => void;
-  onResult?: (event: Extract<ChatStreamEvent, { type: 'result' }>) => void;
+  onRowBatch?: (event: Extract<ChatStreamEvent, { type: 'row_batch' }>) => void;
+  onResultMeta?: (event: Extract<ChatStreamEvent, { type: 'result_meta' }>) => void;
   onError?: (event: Extract<ChatStreamEvent, { type: 'error' }>) => void;
   onDone?: (event: Extract<ChatStreamEvent, { type: 'done' }>) => void;
   onConnectionError?: (error: Error) => void;
@@ -215,8 +216,11 @@ export async function streamChat(
           case 'confirmation_required':
             handlers.onConfirmationRequired?.(event);
             break;
-          case 'result':
-            handlers.onResult?.(event);
+          case 'row_batch':
+            handlers.onRowBatch?.(event);
+            break;
+          case 'result_meta':
+            handlers.onResultMeta?.(event);
             break;
           case 'error':
             handlers.onError?.(event);
@@ -139,9 +139,19 @@ export interface ConfirmationRequiredEvent {
   explanation: string;
 }
 
-export interface ResultEvent {
-  type: 'result';
-  data: QueryResultData;
+export interface RowBatchEvent {
+  type: 'row_batch';
+  batch_index: number;
+  rows: Record<string, unknown>[];
+}
+
+export interface ResultMetaEvent {
+  type: 'result_meta';
+  total_row_count: number;
+  returned_row_count: number;
+  columns: ColumnInfo[];
+  is_truncated: boolean;
+  execution_time_ms: number;
 }
 
 export interface ErrorEvent {
@@ -161,7 +171,8 @@ export type ChatStreamEvent =
   | QueryPreviewEvent
   | ConfirmRequiredEvent
   | ConfirmationRequiredEvent
-  | ResultEvent
+  | RowBatchEvent
+  | ResultMetaEvent
   | ErrorEvent
   | DoneEvent;
 